@@ -149,6 +149,8 @@ from .decorators import (  # type: ignore[no-redef]
     help_option,
     jobs_option,
     lazy_group,
+    limit_option,
+    log_format_option,
     man_option,
     multicall_group,
     no_color_option,
@@ -191,6 +193,9 @@ from .highlight import (
 from .humanize import format_duration, format_size
 from .logging import (
     Formatter,
+    JSONFormatter,
+    LogFormat,
+    LogFormatOption,
     LogLevel,
     QuietOption,
     StreamHandler,
@@ -225,6 +230,7 @@ from .rst_to_myst import (
 )
 from .spinner import (  # type: ignore[no-redef]
     SPINNERS,
+    LaneProgress,
     OperationTrail,
     ProgressOption,
     Spinner,
@@ -238,17 +244,22 @@ from .spinner import (  # type: ignore[no-redef]
 from .styling import (
     Style,
     ansi_to_html,
+    ansi_to_html_stream,
     ansi_to_jira,
     ansi_to_latex,
     ansi_to_textile,
     render_ansi,
+    render_ansi_stream,
     split_ansi,
+    split_ansi_stream,
     wrap_ansi,
 )
 from .table import (
     ColumnsOption,
     ColumnSpec,
+    LimitOption,
     SortByOption,
+    TableData,
     TableFormat,
     TableFormatOption,
     column_sort_key,
@@ -355,9 +366,14 @@ __all__ = [
     "HelpSection",
     "HelpTheme",
     "IntRange",
+    "JSONFormatter",
     "JobsOption",
+    "LaneProgress",
     "LazyGroup",
     "LazySubcommand",
+    "LimitOption",
+    "LogFormat",
+    "LogFormatOption",
     "LogLevel",
     "ManOption",
     "MissingParameter",
@@ -389,6 +405,7 @@ __all__ = [
     "SpinnerPreset",
     "StreamHandler",
     "Style",
+    "TableData",
     "TableFormat",
     "TableFormatOption",
     "TelemetryOption",
@@ -406,6 +423,7 @@ __all__ = [
     "ZeroExitOption",
     "accessible_option",
     "ansi_to_html",
+    "ansi_to_html_stream",
     "ansi_to_jira",
     "ansi_to_latex",
     "ansi_to_textile",
@@ -468,7 +486,9 @@ __all__ = [
     "last_param",
     "launch",
     "lazy_group",
+    "limit_option",
     "load_test_suite",
+    "log_format_option",
     "make_pass_decorator",
     "make_schema_callable",
     "man_option",
@@ -500,6 +520,7 @@ __all__ = [
     "read_manpage",
     "register_theme",
     "render_ansi",
+    "render_ansi_stream",
     "render_columns_markdown_table",
     "render_command_tree",
     "render_help",
@@ -524,6 +545,7 @@ __all__ = [
     "show_params_option",
     "sort_by_option",
     "split_ansi",
+    "split_ansi_stream",
     "style",
     "table_format_option",
     "telemetry_option",
@@ -24,8 +24,12 @@ cycle.
 
 from __future__ import annotations
 
+import os
 from contextlib import contextmanager
 from importlib import metadata
+from pathlib import Path
+
+from extra_platforms import is_macos, is_windows
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
@@ -48,6 +52,22 @@ def generator_tag() -> str:
         return "Click Extra"
 
 
+def user_cache_dir() -> Path:
+    """Directory holding Click Extra's caches in the user's cache directory.
+
+    `%LOCALAPPDATA%` on Windows, `~/Library/Caches` on macOS,
+    `$XDG_CACHE_HOME` (or `~/.cache`) elsewhere, each with a `click-extra`
+    subdirectory. Nothing is created: writers make the directories they need.
+    """
+    if is_windows():
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif is_macos():
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "click-extra"
+
+
 def missing_extra_message(
     extra: str,
     *,
@@ -25,7 +25,7 @@ import shlex
 import shutil
 import sys
 import time
-from functools import partial
+from functools import cache, partial
 from pathlib import Path
 
 import click
@@ -56,9 +56,10 @@ from .logo import BRAND_SCREEN
 from .myst_converter import convert_directory, detect_source_package
 from .parameters import make_resilient_context
 from .prebake import (
-    _find_dunder_str,
+    BakedField,
     discover_package_init_files,
     prebake_dunder,
+    prebake_fields,
     prebake_version,
 )
 from .screenshot import (
@@ -1253,7 +1254,9 @@ def field(name: str, module: Path | None, value: str) -> None:
 
 @prebake.command(name="all")
 @_module_option
-def all_fields(module: Path | None) -> None:
+@jobs_option
+@pass_context
+def all_fields(ctx: context.Context, module: Path | None) -> None:
     """Pre-bake `__version__` and all git fields in one pass.
 
     Scans each target file for empty `__<field>__` dunder placeholders,
@@ -1271,44 +1274,38 @@ def all_fields(module: Path | None) -> None:
     `__git_dirty__`) are baked if their dunder placeholder exists and a git
     resolution is available. Fields without a placeholder in the source file
     are skipped silently.
+
+    Each file is parsed and written once, and several packages are baked in
+    parallel (see --jobs). Git values are resolved once for all of them.
     """
     paths = _resolve_paths(module)
-    changed = False
 
-    for init_path in paths:
-        source = init_path.read_text(encoding="utf-8")
+    # Resolve each git field at most once for the whole run, and only when a
+    # file holds an empty placeholder for it. The canonical field-to-resolver
+    # mapping lives in click_extra.version, so adding a git field there needs
+    # no matching edit here.
+    fields = {
+        f"__{field_name}__": cache(partial(resolver, None))
+        for field_name, resolver in GIT_RESOLVERS.items()
+    }
+    git_hash = fields["__git_short_hash__"]()
 
-        # Pre-bake __version__ with git short hash.
-        git_hash = run_git(*GIT_FIELDS["git_short_hash"])
-        if git_hash:
-            baked = prebake_version(init_path, local_version=git_hash)
+    def bake(init_path: Path) -> tuple[Path, dict[str, BakedField]]:
+        return init_path, prebake_fields(init_path, fields, local_version=git_hash)
+
+    changed = False
+    worker_count = context.get(ctx, context.JOBS, 1)
+    for init_path, results in run_jobs(bake, paths, jobs=worker_count):
+        for dunder_name, (current, baked) in results.items():
             if baked:
-                echo(f"Pre-baked {init_path}: __version__ = {baked!r}")
+                echo(f"Pre-baked {init_path}: {dunder_name} = {baked!r}")
                 changed = True
-
-        # Pre-bake each git field that has an empty dunder placeholder. The
-        # canonical field-to-resolver mapping lives in click_extra.version, so
-        # adding a git field there needs no matching edit here. Direct fields,
-        # the tag-derived git_tag_sha, and the computed git_distance/git_dirty
-        # all resolve uniformly through their GIT_RESOLVERS callable.
-        for field_name, resolver in GIT_RESOLVERS.items():
-            dunder_name = f"__{field_name}__"
-            node = _find_dunder_str(source, dunder_name)
-            if node is None:
+            elif dunder_name == "__version__":
                 continue
-            if node.value:
+            elif current:
                 echo(f"Skipped {init_path}: {dunder_name} already set")
-                continue
-            value = resolver(None)
-            if not value:
+            else:
                 echo(f"Skipped {init_path}: {dunder_name} (no git value)")
-                continue
-            baked = prebake_dunder(init_path, dunder_name, value)
-            if baked:
-                echo(f"Pre-baked {init_path}: {dunder_name} = {baked!r}")
-                changed = True
-                # Re-read source after each write so AST offsets stay valid.
-                source = init_path.read_text(encoding="utf-8")
 
     if not changed:
         echo("No changes made.")
@@ -29,11 +29,13 @@ from __future__ import annotations
 
 import importlib
 import importlib.util
+import json
 import logging
 import runpy
 import shlex
 import sys
 from configparser import ConfigParser
+from hashlib import sha256
 from importlib import metadata
 from pathlib import Path
 
@@ -43,6 +45,7 @@ from click.core import ParameterSource
 from click.utils import make_str
 
 from . import context
+from ._utils import user_cache_dir
 from .carapace import (
     dump_carapace_spec,
     install_carapace_spec,
@@ -276,6 +279,76 @@ def unpatch_click() -> None:
     set_default_theme(BUILTIN_THEMES.get("dark", NOCOLOR_THEME))
 
 
+def entry_points_index_path() -> Path:
+    """Return where the `console_scripts` index of this environment is cached.
+
+    One file per environment, named after the interpreter running it, in the
+    user's cache directory (see {func}`~click_extra._utils.user_cache_dir`).
+    """
+    environment = sha256(f"{sys.prefix}\0{sys.executable}".encode()).hexdigest()
+    return user_cache_dir() / "entry-points" / f"{environment[:16]}.json"
+
+
+def _entry_points_signature() -> list[list[str | int]]:
+    """Fingerprint the `sys.path` entries distributions are discovered from.
+
+    Installing, upgrading or removing a distribution adds or deletes its
+    `.dist-info` directory, which bumps the modification time of the
+    directory holding it: a changed fingerprint means the index is stale.
+    """
+    signature: list[list[str | int]] = []
+    for entry in sys.path:
+        try:
+            signature.append([entry, Path(entry or ".").stat().st_mtime_ns])
+        except OSError:
+            continue
+    return signature
+
+
+def console_scripts_index() -> dict[str, str]:
+    """Map every installed `console_scripts` entry point name to its target.
+
+    Enumerating entry points reads the metadata of every distribution in the
+    environment, which adds up in a large one. The mapping is therefore cached
+    at {func}`entry_points_index_path` along with the
+    {func}`_entry_points_signature` it was built under, and only rebuilt once
+    that signature changes. A cache that cannot be read or written is ignored.
+
+    When two distributions declare the same name, the first one enumerated
+    wins, like a plain scan of {func}`importlib.metadata.entry_points` would.
+    """
+    index_path = entry_points_index_path()
+    signature = _entry_points_signature()
+    try:
+        cached = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = None
+    if isinstance(cached, dict) and cached.get("signature") == signature:
+        scripts: dict[str, str] = cached["scripts"]
+        return scripts
+
+    scripts = {}
+    for ep in metadata.entry_points().select(group="console_scripts"):
+        scripts.setdefault(ep.name, ep.value)
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text(
+            json.dumps({"signature": signature, "scripts": scripts}),
+            encoding="utf-8",
+        )
+    except OSError as ex:
+        logger.debug("Cannot cache console_scripts index: %s", ex)
+    else:
+        logger.debug("Indexed %d console_scripts in %s.", len(scripts), index_path)
+    return scripts
+
+
+def clear_console_scripts_index() -> None:
+    """Drop the cached `console_scripts` index, forcing the next lookup to
+    rebuild it."""
+    entry_points_index_path().unlink(missing_ok=True)
+
+
 def _read_project_scripts(directory: Path) -> dict[str, str]:
     """Read the console-script entry points declared by a local project.
 
@@ -379,7 +452,8 @@ def resolve_target(script: str) -> tuple[str, str]:
 
     Resolution order:
 
-    1. `console_scripts` entry points from installed packages.
+    1. `console_scripts` entry points from installed packages, looked up in
+       {func}`console_scripts_index`.
     2. A local project directory: its `console_scripts` entry point is read
        from `pyproject.toml` / `setup.cfg` and its package is added to
        `sys.path`.
@@ -401,16 +475,16 @@ def resolve_target(script: str) -> tuple[str, str]:
     logger.debug("Resolving target %r.", script)
 
     # 1. Console scripts entry points.
-    for ep in metadata.entry_points().select(group="console_scripts"):
-        if ep.name == script:
-            module_path, _, function_name = ep.value.partition(":")
-            logger.info(
-                "Resolved %r as console_scripts entry point: %s:%s.",
-                script,
-                module_path,
-                function_name,
-            )
-            return module_path, function_name
+    target = console_scripts_index().get(script)
+    if target is not None:
+        module_path, _, function_name = target.partition(":")
+        logger.info(
+            "Resolved %r as console_scripts entry point: %s:%s.",
+            script,
+            module_path,
+            function_name,
+        )
+        return module_path, function_name
 
     # 2. Local project directory: discover its console-script entry point and
     # make its package importable. Checked before the path/module heuristics so
@@ -995,6 +1069,13 @@ def _config_args_for_target(
     help="With --help-format, write the rendering where its consumer looks for it "
     "instead of printing it, and echo the written path.",
 )
+@option(
+    "--refresh-index",
+    is_flag=True,
+    default=False,
+    help="Rebuild the cached index of installed console_scripts entry points "
+    "before resolving SCRIPT. Exits after the rebuild if no SCRIPT is given.",
+)
 @option(
     "--table-format",
     type=EnumChoice(TableFormat),
@@ -1019,6 +1100,7 @@ def wrap(
     help_format: str | None,
     output_dir: Path | None,
     install: bool,
+    refresh_index: bool,
     table_format: TableFormat,
 ) -> None:
     """Run, or introspect, any Click CLI through Click Extra.
@@ -1037,7 +1119,22 @@ def wrap(
     Resolution order for SCRIPT: installed console_scripts entry point, a local
     project directory (its entry point is read from pyproject.toml or setup.cfg),
     Python file path, module:function notation, or Python module name.
+
+    Installed entry points are looked up in an index cached per environment, and
+    rebuilt whenever a package is installed or removed. --refresh-index forces
+    that rebuild.
     """
+    if refresh_index:
+        clear_console_scripts_index()
+        scripts = console_scripts_index()
+        logger.info(
+            "Indexed %d console_scripts entry points in %s.",
+            len(scripts),
+            entry_points_index_path(),
+        )
+        if not script_and_args:
+            ctx.exit(0)
+
     if not script_and_args:
         click.echo(ctx.get_help(), color=ctx.color)
         ctx.exit(0)
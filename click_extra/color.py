@@ -24,18 +24,24 @@ tri-state WHEN resolution. The actual styling lives elsewhere:
 
 from __future__ import annotations
 
+import json
 import os
 import re
 import select
 import sys
+import threading
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from gettext import gettext as _
+from hashlib import sha256
+from pathlib import Path
 
 import click
 from click.core import ParameterSource
 from extra_platforms import is_unix
 
+from ._utils import user_cache_dir
 from .envvar import parse_envvar_flag, temporary_env
 from .parameters import ExtraOption
 from .styling import _relative_luminance
@@ -238,6 +244,105 @@ never answers (no OSC 11 support) does not noticeably stall startup. See
 """
 
 
+_BACKGROUND_CACHE_TTL: float = 300.0
+"""Seconds an OSC 11 reply stays cached for its terminal session.
+
+Short, as a user switching their terminal theme expects the next invocations to
+follow. See {func}`background_cache_path`.
+"""
+
+
+_SILENT_TERMINAL_CACHE_TTL: float = 3600.0
+"""Seconds a terminal session that never answered OSC 11 stays marked as silent.
+
+A terminal without OSC 11 support does not gain it mid-session, and querying
+it again costs the full {data}`_OSC_QUERY_TIMEOUT`, so the negative entry
+outlives a positive one.
+"""
+
+
+def _terminal_session_key() -> str | None:
+    """Identify the terminal session stdin is attached to.
+
+    Combines the tty device of stdin with the variables terminal emulators set
+    per window or tab (`TERM_SESSION_ID`, `WINDOWID`) and the PID of the
+    parent shell. Returns `None` when stdin is not a terminal, where there is
+    no session to key on.
+    """
+    stdin = sys.__stdin__
+    if stdin is None or not is_a_tty(stdin):
+        return None
+    try:
+        device = os.ttyname(stdin.fileno())
+    except (OSError, ValueError, AttributeError):
+        return None
+    parts = [
+        device,
+        os.environ.get("TERM_SESSION_ID", ""),
+        os.environ.get("WINDOWID", ""),
+        str(os.getppid()),
+    ]
+    return "\0".join(parts)
+
+
+def background_cache_path() -> Path | None:
+    """Return where the OSC 11 reply of the current terminal session is cached.
+
+    One file per terminal session (see {func}`_terminal_session_key`), in the
+    `terminal-background` subdirectory of the user's cache directory. Returns
+    `None` outside a terminal.
+    """
+    key = _terminal_session_key()
+    if key is None:
+        return None
+    session = sha256(key.encode()).hexdigest()
+    return user_cache_dir() / "terminal-background" / f"{session[:16]}.json"
+
+
+def _cached_osc_background() -> tuple[int, int, int] | None:
+    """{func}`query_osc_background`, memoized per terminal session.
+
+    A reply is reused for {data}`_BACKGROUND_CACHE_TTL` seconds, and a silent
+    terminal is not queried again for {data}`_SILENT_TERMINAL_CACHE_TTL`
+    seconds, so only the first invocation of a session pays for the round-trip.
+    A cache that cannot be read or written is ignored.
+
+    Only a query actually sent is cached: one skipped because stdout is not a
+    terminal (`cli | less`, `$(cli)`), or answered with a reply that does not
+    parse, says nothing about the terminal session.
+    """
+    cache_path = background_cache_path()
+    if cache_path is None:
+        return query_osc_background()
+
+    now = time.time()
+    rgb: tuple[int, int, int] | None
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        age = now - cached["time"]
+        rgb = None
+        if cached["rgb"] is not None:
+            r, g, b = cached["rgb"]
+            rgb = (r, g, b)
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    else:
+        ttl = _SILENT_TERMINAL_CACHE_TTL if rgb is None else _BACKGROUND_CACHE_TTL
+        if 0 <= age < ttl:
+            return rgb
+
+    response = _osc_background_reply()
+    rgb = _parse_osc_rgb(response) if response else None
+    if rgb is None and response != b"":
+        return rgb
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"rgb": rgb, "time": now}), encoding="utf-8")
+    except OSError:
+        pass
+    return rgb
+
+
 def _colorfgbg_background(value: str) -> Literal["dark", "light"] | None:
     """Classify a `COLORFGBG` value as a dark or light background.
 
@@ -312,6 +417,17 @@ def query_osc_background(
     {class}`~click_extra.theme.ThemeOption`'s `query_background`).
     ```
     """
+    response = _osc_background_reply(timeout)
+    return _parse_osc_rgb(response) if response else None
+
+
+def _osc_background_reply(timeout: float = _OSC_QUERY_TIMEOUT) -> bytes | None:
+    """Send the OSC 11 query and return the raw bytes the terminal wrote back.
+
+    Returns `None` when the query is not sent at all, for the reasons listed by
+    {func}`query_osc_background`, and an empty reply when the terminal stayed
+    silent for *timeout* seconds.
+    """
     if not is_unix() or termios is None or tty is None:
         return None
 
@@ -353,7 +469,56 @@ def query_osc_background(
         # the saved attributes does not need to wait for that drain.
         termios.tcsetattr(fd, termios.TCSANOW, old_attributes)
 
-    return _parse_osc_rgb(response)
+    return response
+
+
+class _BackgroundQuery(threading.Thread):
+    """OSC 11 query running on its own thread, ahead of the code consuming it."""
+
+    def __init__(self) -> None:
+        super().__init__(name="click-extra-osc-background", daemon=True)
+        self.rgb: tuple[int, int, int] | None = None
+
+    def run(self) -> None:
+        self.rgb = _cached_osc_background()
+
+
+_pending_background_query: _BackgroundQuery | None = None
+"""OSC 11 query started by {func}`start_background_query`, if any.
+
+Kept for the whole invocation, so the eager pre-pass and the regular parse of
+`--theme` both read the same reply.
+"""
+
+
+def start_background_query() -> None:
+    """Send the OSC 11 query now, and collect its reply on a background thread.
+
+    {func}`resolve_background` joins the thread once it actually needs the
+    color, so the terminal round-trip overlaps with whatever runs in between:
+    configuration discovery and the other eager option callbacks, when
+    {meth}`click_extra.commands.Command.main` starts it. Has no effect when
+    a query is already pending.
+
+    Every call must be paired with {func}`finish_background_query`.
+    """
+    global _pending_background_query
+    if _pending_background_query is None:
+        _pending_background_query = _BackgroundQuery()
+        _pending_background_query.start()
+
+
+def finish_background_query() -> None:
+    """Wait for the pending OSC 11 query, if any, and discard its reply.
+
+    The query holds stdin in cbreak mode until it returns: waiting for it
+    guarantees the terminal mode is restored before the process moves on, even
+    when nothing ended up reading the reply.
+    """
+    global _pending_background_query
+    if _pending_background_query is not None:
+        _pending_background_query.join()
+        _pending_background_query = None
 
 
 def resolve_background(
@@ -371,7 +536,10 @@ def resolve_background(
        anything unrecognized fall through.
     #. The live OSC 11 query ({func}`query_osc_background`), but only when
        *allow_query* is true. It is the most accurate and the only real-time
-       signal, yet it reads stdin, so it stays opt-in.
+       signal, yet it reads stdin, so it stays opt-in. Its outcome is cached
+       per terminal session (see {func}`background_cache_path`), silence
+       included, so repeated invocations skip the round-trip. A query already
+       sent by {func}`start_background_query` is joined rather than repeated.
     #. `COLORFGBG` — set by a handful of terminals (rxvt, Konsole) and cached
        by [shell-term-background](https://github.com/rocky/shell-term-background)
        at shell startup. Read last because it is frequently stale: it reflects
@@ -402,7 +570,12 @@ def resolve_background(
         return "light"
 
     if allow_query:
-        rgb = query_osc_background()
+        pending = _pending_background_query
+        if pending is not None:
+            pending.join()
+            rgb = pending.rgb
+        else:
+            rgb = _cached_osc_background()
         if rgb is not None:
             return "dark" if _is_dark_rgb(rgb) else "light"
 
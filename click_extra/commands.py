@@ -25,6 +25,7 @@ from __future__ import annotations
 import importlib
 import logging
 import os
+import sys
 from dataclasses import dataclass
 from difflib import get_close_matches
 from gettext import gettext as _
@@ -35,7 +36,12 @@ from click.core import iter_params_for_processing
 
 from . import context
 from .accessibility import ACCESSIBLE_ENVVAR, AccessibleOption
-from .color import ColorOption, NoColorOption
+from .color import (
+    ColorOption,
+    NoColorOption,
+    finish_background_query,
+    start_background_query,
+)
 from .command_doc import HelpFormatOption, ManOption, normalize_examples
 from .config import (
     DEFAULT_SUBCOMMANDS_KEY,
@@ -56,7 +62,7 @@ from .logging import QuietOption, VerboseOption, VerbosityOption
 from .parameters import ExtraOption, ShowParamsOption
 from .spinner import ProgressOption
 from .table import TableFormatOption
-from .theme import THEME_ENVVAR, ThemeOption, get_current_theme
+from .theme import AUTO_THEME, THEME_ENVVAR, ThemeOption, get_current_theme
 from .tree import TreeOption
 from .version import VersionOption
 
@@ -537,11 +543,71 @@ class Command(_HelpColorsMixin, cloup.Command):  # type: ignore[misc]
         instead of relying on Click's auto-detection via the
         `_detect_program_name()` method. This is to avoid the CLI being called
         `python -m <module_name>`, which is not very user-friendly.
+
+        A {class}`~click_extra.theme.ThemeOption` allowed to query the terminal
+        background gets its OSC 11 query sent right here, before any parameter
+        is processed: the reply is collected in the background while the
+        configuration file loads, instead of after it. See
+        {func}`~click_extra.color.start_background_query`. The query is over by
+        the time {meth}`parse_args` returns.
         """
         if not prog_name and self.name:
             prog_name = self.name
 
-        return super().main(args=args, prog_name=prog_name, **kwargs)
+        if self._may_query_background(sys.argv[1:] if args is None else args):
+            start_background_query()
+        try:
+            return super().main(args=args, prog_name=prog_name, **kwargs)
+        finally:
+            # Only does something when the context failed before parse_args.
+            finish_background_query()
+
+    def _may_query_background(self, args: Sequence[str]) -> bool:
+        """Whether resolving `--theme` may need the live OSC 11 query.
+
+        Only a {class}`~click_extra.theme.ThemeOption` built with
+        `query_background=True` ever queries, only to resolve
+        {data}`~click_extra.theme.AUTO_THEME`, and a `CLITHEME` set to `dark`
+        or `light` settles the background before the query is consulted.
+
+        The theme is read from what is known before parsing, in the order
+        {meth}`~click_extra.theme.ThemeOption.set_theme` ranks it: the last
+        occurrence of the option in `args`, its environment variables, then
+        {data}`~click_extra.theme.THEME_ENVVAR` over its default. A palette
+        only set by the configuration file is not loaded yet, so an `auto`
+        default still sends the query.
+
+        A command with a prompting option never sends it early: the prompt would
+        read stdin while the query holds it in cbreak mode.
+        """
+        clitheme = os.environ.get("CLITHEME", "").strip().lower()
+        if clitheme.split(":", 1)[0] in ("dark", "light"):
+            return False
+        # A prompt reads stdin during parsing, where the query would race it.
+        if any(
+            isinstance(param, click.Option) and param.prompt for param in self.params
+        ):
+            return False
+        for param in self.params:
+            if not isinstance(param, ThemeOption) or not param.query_background:
+                continue
+            value = _last_option_value(self, param, args)
+            if value is None:
+                value = next(
+                    (
+                        os.environ[envvar]
+                        for envvar in param_envvar_ids(param, self.context_settings)
+                        if os.environ.get(envvar)
+                    ),
+                    None,
+                )
+            if value is None:
+                value = os.environ.get(THEME_ENVVAR)
+            if not value and isinstance(param.default, str):
+                value = param.default
+            if value == AUTO_THEME:
+                return True
+        return False
 
     def make_context(
         self,
@@ -738,6 +804,71 @@ class Command(_HelpColorsMixin, cloup.Command):  # type: ignore[misc]
             return super().parse_args(ctx, args)
         except click.NoSuchOption as exc:
             _enhance_short_option_error(exc, original_args, ctx)
+        finally:
+            # Every parameter is processed, `--theme` included: wait for the
+            # OSC 11 query sent by main(), if any, so it no longer holds stdin
+            # in cbreak mode while the command reads it (prompts, getpass).
+            finish_background_query()
+
+
+def _last_option_value(
+    command: click.Command, param: click.Option, args: Sequence[str]
+) -> str | None:
+    """Value given to the last occurrence of `param` in `args`, if any.
+
+    Walks `args` the way Click's parser tokenizes them, against every option of
+    `command`: reads the `--opt value`, `--opt=value` and concatenated `-ovalue`
+    forms, steps over the values of other options (so `--label --theme` is no
+    `--theme`), and stops at `--`, or at the first positional argument when
+    `command` does not allow interspersed arguments.
+    """
+    # Which option names consume a value, and which of them are `param`'s.
+    takes_value = {
+        opt: not (option.is_flag or option.count)
+        for option in command.params
+        if isinstance(option, click.Option)
+        for opt in option.opts
+    }
+    value = None
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        index += 1
+        if arg == "--":
+            break
+        if not arg.startswith("-") or arg == "-":
+            if not command.allow_interspersed_args:
+                break
+            continue
+        name, equal, attached = arg.partition("=")
+        # Click only splits `=` off long names: `-t=dark` sets `-t` to `=dark`.
+        if arg.startswith("--") or (len(name) > 2 and name in takes_value):
+            if not takes_value.get(name):
+                continue
+            if not equal:
+                if index >= len(args):
+                    break
+                attached = args[index]
+                index += 1
+            if name in param.opts:
+                value = attached
+            continue
+        # A cluster of single-character options: `-vt auto`, `-tauto`.
+        for position, char in enumerate(arg[1:], start=1):
+            short = f"-{char}"
+            if short not in takes_value:
+                break
+            if takes_value[short]:
+                attached = arg[position + 1 :]
+                if not attached:
+                    if index >= len(args):
+                        break
+                    attached = args[index]
+                    index += 1
+                if short in param.opts:
+                    value = attached
+                break
+    return value
 
 
 def _enhance_short_option_error(
@@ -48,6 +48,7 @@ from .formats import (
     SERIALIZABLE_FORMATS,
     SQLITE_CONFIG_TABLE,
     ConfigFormat,
+    create_sqlite_config_index,
     format_from_mime,
     format_from_path,
     parse_content,
@@ -106,6 +107,7 @@ __all__ = [
     "ValidationError",
     "ValidationReport",
     "config_table_to_flags",
+    "create_sqlite_config_index",
     "ensure_config_loaded",
     "field_docstrings",
     "flatten_config_keys",
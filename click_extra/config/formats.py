@@ -37,6 +37,7 @@ import importlib.util
 import json
 import logging
 import plistlib
+import sqlite3
 import sys
 from enum import Enum
 from fnmatch import fnmatch
@@ -173,6 +174,79 @@ The table holds `key`/`value` columns: dotted parameter paths and their
 JSON-encoded values."""
 
 
+def create_sqlite_config_index(path: Path | str) -> None:
+    """Index the `key` column of the {data}`SQLITE_CONFIG_TABLE` in `path`.
+
+    Lets {class}`~click_extra.config.option.ConfigOption`, with
+    `sqlite_app_rows` set, fetch an app's rows from a store shared by many
+    CLIs through a range scan. Idempotent, and unnecessary for a table whose
+    `key` is its primary key, which SQLite already indexes.
+    """
+    connection = sqlite3.connect(str(path))
+    try:
+        with connection:
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {SQLITE_CONFIG_TABLE}_key "
+                f"ON {SQLITE_CONFIG_TABLE} (key)"
+            )
+    finally:
+        connection.close()
+
+
+def _yaml_loader() -> Any:
+    """Return the PyYAML loader {func}`parse_content` reads YAML with.
+
+    `CFullLoader`, backed by `libyaml`, when PyYAML was built with its C
+    extension, and the pure-Python `FullLoader` otherwise. Both resolve the
+    same tags to the same objects: only throughput differs.
+    """
+    import yaml
+
+    return getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+
+def _yaml_emits_identically(data: Any) -> bool:
+    """Tell whether the `libyaml` emitter writes `data` like the pure-Python one.
+
+    The two emitters agree on block collections of printable text, but not
+    elsewhere: `libyaml` escapes characters outside the Basic Multilingual
+    Plane that `allow_unicode` keeps verbatim, folds escaped double-quoted
+    scalars at other columns, spells mappings with an empty key differently,
+    and omits the `...` end marker after a top-level scalar.
+    """
+    if not isinstance(data, (dict, list, tuple)):
+        return False
+    stack: list[Any] = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if not value.isprintable() or (value and max(value) > "\uffff"):
+                return False
+        elif isinstance(value, dict):
+            if "" in value:
+                return False
+            stack.extend(value)
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return True
+
+
+def _yaml_dumper(data: Any) -> Any:
+    """Return the PyYAML dumper {func}`serialize_content` writes `data` with.
+
+    `CDumper` when PyYAML has its C extension and
+    {func}`_yaml_emits_identically` vouches for `data`, so the output never
+    depends on how PyYAML was built. The pure-Python `Dumper` otherwise.
+    """
+    import yaml
+
+    cdumper = getattr(yaml, "CDumper", None)
+    if cdumper is not None and _yaml_emits_identically(data):
+        return cdumper
+    return yaml.Dumper
+
+
 def parse_content(fmt: ConfigFormat, content: str) -> Any:
     """Parse content with a single stateless format.
 
@@ -201,7 +275,7 @@ def parse_content(fmt: ConfigFormat, content: str) -> Any:
         case ConfigFormat.YAML:
             import yaml
 
-            return yaml.full_load(content)
+            return yaml.load(content, Loader=_yaml_loader())
 
         case ConfigFormat.JSON:
             return json.loads(content)
@@ -295,7 +369,12 @@ def serialize_content(fmt: ConfigFormat, data: Any, **kwargs: Any) -> str:
             return str(
                 yaml.dump(
                     data,
-                    **{"allow_unicode": True, "default_flow_style": False, **kwargs},
+                    **{
+                        "Dumper": _yaml_dumper(data),
+                        "allow_unicode": True,
+                        "default_flow_style": False,
+                        **kwargs,
+                    },
                 )
             )
         case ConfigFormat.TOML:
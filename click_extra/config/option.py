@@ -96,12 +96,10 @@ from .formats import (
 )
 from .schema import (
     ConfigValidator,
-    _merge_into_template,
-    _normalize_conf,
+    _merge_app_conf,
+    _normalize_app_entries,
     _opaque_paths,
-    _scope_app_sections,
     _select_app_section,
-    _strip_opaque_subtrees,
     make_schema_callable,
     run_config_validation,
 )
@@ -246,6 +244,7 @@ class ConfigOption(ExtraOption, ParamStructure):
         schema_strict: bool = False,
         fallback_sections: Sequence[str] = (),
         config_validators: Sequence[ConfigValidator] = (),
+        sqlite_app_rows: bool = False,
         **kwargs,
     ) -> None:
         """Takes as input a path to a file or folder, a glob pattern, or an URL.
@@ -496,6 +495,22 @@ class ConfigOption(ExtraOption, ParamStructure):
         Works with all configuration formats.
         """
 
+        self.sqlite_app_rows = sqlite_app_rows
+        """Only read the rows of the app's own sections from a `SQLITE` store.
+
+        When `True`, {meth}`load_sqlite_config` fetches the rows whose key is
+        the app's section name, or one of the `fallback_sections`, or starts
+        with one of them followed by a dot, instead of the whole table. Meant
+        for a database shared by many CLIs, where decoding every other app's
+        rows is wasted work: index the `key` column with
+        {func}`~click_extra.config.formats.create_sqlite_config_index` and the
+        lookup becomes a range scan.
+
+        Rows outside those sections are then missing from
+        `ctx.meta[click_extra.context.CONF_FULL]`. Defaults to `False`, which
+        reads the whole table.
+        """
+
         self.schema_warn_unknown: bool = (
             self.included_params is not None and not self.included_params
         )
@@ -1237,34 +1252,21 @@ class ConfigOption(ExtraOption, ParamStructure):
             # Extract all options of the section.
             sub_conf = {}
             for option_id in ini_config.options(section_id):
-                # Fetch the expected type of the CLI parameter.
-                try:
-                    target_params = self.get_tree_value(
-                        self.params_objects, section_id, option_id
+                # Fetch the expected type of the CLI parameter. An item with no
+                # entry does not correspond to any existing parameter in the
+                # CLI structure.
+                target_types = self.params_types.get((section_id, option_id), (None,))
+                # One variable name can be shared by multiple options. If we are
+                # lucky, all options sharing the same name also share the same
+                # type.
+                # XXX This case is tricky and not even covered in Click unittests.
+                if len(target_types) > 1:
+                    raise ValueError(
+                        f"Cannot handle the {target_types!r} types defined by the "
+                        "multiple options associated to the "
+                        f"[{section_id}]:{option_id} INI config item."
                     )
-                # The item in the INI config file does not correspond to any existing
-                # parameter in the CLI structure.
-                except KeyError:
-                    target_type = None
-                # The item in the INI config file corresponds to a single parameter
-                # in the CLI structure.
-                else:
-                    # Because one variable name can be shared by multiple options, we
-                    # need to fetch all of those we detected in the CLI structure.
-                    assert isinstance(target_params, list)
-                    # We deduplicate them to simplify the next steps. If we are lucky,
-                    # all options sharing the same name also share the same type.
-                    target_types = [self.get_param_type(p) for p in target_params]
-                    dedup_types = set(target_types)
-
-                    # XXX This case is tricky and not even covered in Click unittests.
-                    if len(dedup_types) > 1:
-                        raise ValueError(
-                            f"Cannot handle the {target_types!r} types defined by the "
-                            "multiple options associated to the "
-                            f"[{section_id}]:{option_id} INI config item."
-                        )
-                    target_type = dedup_types.pop()
+                target_type = target_types[0]
 
                 value: Any
 
@@ -1294,9 +1296,8 @@ class ConfigOption(ExtraOption, ParamStructure):
                 sub_conf[option_id] = value
 
             # Place collected options at the right level of the dict tree.
-            conf = always_merger.merge(
-                conf,
-                self.init_tree_dict(*section_id.split(PARAM_PATH_SEP), leaf=sub_conf),
+            self.insert_tree_value(
+                conf, *section_id.split(PARAM_PATH_SEP), leaf=sub_conf
             )
 
         return conf
@@ -1455,23 +1456,41 @@ class ConfigOption(ExtraOption, ParamStructure):
         JSON-encoded, which carries every type the other formats do:
         booleans, numbers, strings, lists and nested objects alike.
 
+        With {attr}`sqlite_app_rows` set, only the rows of the app's own
+        sections are read and decoded.
+
         Returns a ready-to-use data structure.
         """
+        query = f"SELECT key, value FROM {SQLITE_CONFIG_TABLE}"
+        bounds: list[str] = []
+        ctx = get_current_context(silent=True)
+        app_name = self._app_section_name(ctx) if ctx is not None else ""
+        if self.sqlite_app_rows and app_name:
+            # A section's rows are keyed `<section>.<path>`: they sort between
+            # `<section>.` and the next character after the separator, a range
+            # an index on the key column answers without a full scan. The
+            # section name itself is matched too, for a row holding it whole.
+            upper_sep = chr(ord(PARAM_PATH_SEP) + 1)
+            clauses = []
+            for section in unique((app_name, *self.fallback_sections)):
+                clauses.append("key = ? OR (key >= ? AND key < ?)")
+                bounds += (
+                    section,
+                    f"{section}{PARAM_PATH_SEP}",
+                    f"{section}{upper_sep}",
+                )
+            query += f" WHERE {' OR '.join(clauses)}"
+
         connection = sqlite3.connect(str(path))
         try:
-            rows = connection.execute(
-                f"SELECT key, value FROM {SQLITE_CONFIG_TABLE}"
-            ).fetchall()
+            rows = connection.execute(query, bounds).fetchall()
         finally:
             connection.close()
 
         conf: dict[str, Any] = {}
         for key, raw_value in rows:
-            conf = always_merger.merge(
-                conf,
-                self.init_tree_dict(
-                    *key.split(PARAM_PATH_SEP), leaf=json.loads(raw_value)
-                ),
+            self.insert_tree_value(
+                conf, *key.split(PARAM_PATH_SEP), leaf=json.loads(raw_value)
             )
 
         return conf
@@ -1516,25 +1535,6 @@ class ConfigOption(ExtraOption, ParamStructure):
         app_name = self._app_section_name(ctx)
         return app_name, self._resolve_app_section(user_conf, app_name)
 
-    def _strip_opaque_from_conf(
-        self,
-        ctx: click.Context,
-        normalized_conf: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Remove opaque sub-trees from a normalized config before strict-check.
-
-        Opaque paths are relative to the app's section, so they are prefixed with
-        the app name when stripping. Returns `normalized_conf` unchanged if no
-        opaque paths are declared, so the helper is safe to call unconditionally.
-        """
-        if not self._opaque_paths:
-            return normalized_conf
-        app_name = self._app_section_name(ctx)
-        prefixed_paths = (
-            f"{app_name}.{path}" if app_name else path for path in self._opaque_paths
-        )
-        return _strip_opaque_subtrees(normalized_conf, prefixed_paths)
-
     def _resolve_app_section(
         self,
         conf: dict[str, Any],
@@ -1615,21 +1615,20 @@ class ConfigOption(ExtraOption, ParamStructure):
         method; it stays as the standalone entry point for external callers.
         ```
         """
-        normalized_conf = _normalize_conf(user_conf, strict=self.strict)
-        normalized_conf = self._strip_opaque_from_conf(ctx, normalized_conf)
         # Scope the merge (and its strict check) to the app's own section, so
         # foreign sections in a shared file are ignored and legacy fallback
         # sections are honored.
         app_name = self._app_section_name(ctx)
-        scoped_conf = (
-            _scope_app_sections(normalized_conf, app_name, self.fallback_sections)
-            if app_name
-            else normalized_conf
+        normalized_conf = _normalize_app_entries(
+            user_conf, app_name, self.fallback_sections, strict=self.strict
         )
-        filtered_conf = _merge_into_template(
-            copy.deepcopy(self.params_template),
-            scoped_conf,
-            self.strict,
+        filtered_conf = _merge_app_conf(
+            normalized_conf,
+            self.params_template,
+            app_name,
+            opaque_paths=self._opaque_paths,
+            fallback_sections=self.fallback_sections,
+            strict=self.strict,
             blocked=self.excluded_params,
         )
         self._install_default_map(ctx, filtered_conf)
@@ -2336,9 +2335,7 @@ class ExportConfigOption(ExtraOption):
             # names) are kept verbatim: the app-section lookup matches the
             # root exactly, and command names are displayed as invoked.
             file_keys = (*keys[:-1], keys[-1].replace("_", "-"))
-            tree = always_merger.merge(
-                tree, ParamStructure.init_tree_dict(*file_keys, leaf=leaf)
-            )
+            ParamStructure.insert_tree_value(tree, *file_keys, leaf=leaf)
 
         return _remove_blanks(tree, remove_none=False, remove_str=False)
 
@@ -18,7 +18,6 @@
 from __future__ import annotations
 
 import ast
-import copy
 import inspect
 import logging
 import sys
@@ -35,7 +34,6 @@ from functools import partial
 from typing import NamedTuple, get_origin, get_type_hints
 
 from click import get_current_context
-from deepmerge import always_merger
 
 from .. import context
 from ..parameters import PARAM_PATH_SEP, ParamStructure
@@ -191,18 +189,6 @@ class ConfigValidator:
     description: str = ""
 
 
-def _strip_reserved_keys(conf: dict, keys: frozenset[str] | None = None) -> dict:
-    """Recursively return a copy of *conf* with reserved keys removed at every level."""
-    if keys is None:
-        keys = _RESERVED_CONFIG_KEYS
-    cleaned: dict = {}
-    for k, v in conf.items():
-        if k in keys:
-            continue
-        cleaned[k] = _strip_reserved_keys(v, keys) if isinstance(v, dict) else v
-    return cleaned
-
-
 def _check_type_conflict(
     target: dict,
     parts: list[str],
@@ -245,7 +231,11 @@ def _check_type_conflict(
         node = existing
 
 
-def _expand_dotted_keys(conf: dict, strict: bool = False) -> dict:
+def _expand_dotted_keys(
+    conf: dict,
+    strict: bool = False,
+    reserved: frozenset[str] = frozenset(),
+) -> dict:
     """Expand dotted keys into nested dicts, then deep-merge.
 
     Allows configuration files to mix flat dot-notation and nested structures::
@@ -264,11 +254,16 @@ def _expand_dotted_keys(conf: dict, strict: bool = False) -> dict:
 
     In strict mode, raises `ValueError` on type conflicts and invalid
     dotted keys (empty segments).
+
+    :param reserved: keys dropped at every level during the same walk, so
+        stripping them does not cost a second copy of the document.
     """
     expanded: dict = {}
     for key, value in conf.items():
+        if key in reserved:
+            continue
         if isinstance(value, dict):
-            value = _expand_dotted_keys(value, strict=strict)
+            value = _expand_dotted_keys(value, strict=strict, reserved=reserved)
         if "." in key:
             parts = key.split(".")
             if not all(parts):
@@ -277,12 +272,10 @@ def _expand_dotted_keys(conf: dict, strict: bool = False) -> dict:
                     raise ValueError(msg)
                 logger.warning(f"Ignoring {msg.lower()}")
                 continue
-            nested = ParamStructure.init_tree_dict(*parts, leaf=value)
-            _check_type_conflict(expanded, parts, value, key, strict)
-            expanded = always_merger.merge(expanded, nested)
         else:
-            _check_type_conflict(expanded, [key], value, key, strict)
-            expanded = always_merger.merge(expanded, {key: value})
+            parts = [key]
+        _check_type_conflict(expanded, parts, value, key, strict)
+        ParamStructure.insert_tree_value(expanded, *parts, leaf=value)
     return expanded
 
 
@@ -295,8 +288,10 @@ def _normalize_conf(conf: dict, strict: bool = False) -> dict:
     document that gets validated and the document that gets merged into
     `default_map` are normalized identically. A change to the recipe applies to
     both at once instead of risking drift between the two call sites.
+
+    Both steps happen in a single recursive walk of *conf*.
     """
-    return _expand_dotted_keys(_strip_reserved_keys(conf), strict=strict)
+    return _expand_dotted_keys(conf, strict=strict, reserved=_RESERVED_CONFIG_KEYS)
 
 
 def _merge_into_template(
@@ -1119,6 +1114,78 @@ def _select_app_section(
     return {}
 
 
+def _copy_template(template: dict[str, Any]) -> dict[str, Any]:
+    """Copy the dict nodes of a parameter template, sharing its leaves.
+
+    Templates hold nested dicts with `None` placeholders, so a structural copy
+    is all :py:func:`_merge_into_template` needs to leave the cached original
+    untouched, without `copy.deepcopy`'s per-object memo bookkeeping.
+    """
+    return {
+        k: _copy_template(v) if isinstance(v, dict) else v for k, v in template.items()
+    }
+
+
+def _normalize_app_entries(
+    conf: dict[str, Any],
+    app_name: str,
+    fallback_sections: Sequence[str] = (),
+    strict: bool = False,
+) -> dict[str, Any]:
+    """Normalize only the top-level entries of *conf* addressed to the app.
+
+    Keeps the app's own section, the legacy `fallback_sections`, and dotted
+    keys rooted in either (like `"my-cli.verbosity"`), then runs
+    :py:func:`_normalize_conf` on that subset. Foreign sections of a shared
+    file are never walked, which is where the bulk of a large document lives.
+    An empty `app_name` normalizes the whole document.
+    """
+    if app_name:
+        roots = {app_name, *fallback_sections}
+        conf = {
+            key: value
+            for key, value in conf.items()
+            if str(key).partition(".")[0] in roots
+        }
+    return _normalize_conf(conf, strict=strict)
+
+
+def _merge_app_conf(
+    normalized: dict[str, Any],
+    template: dict[str, Any],
+    app_name: str,
+    *,
+    opaque_paths: Iterable[str] = (),
+    fallback_sections: Sequence[str] = (),
+    strict: bool = False,
+    blocked: frozenset[str] = frozenset(),
+    warn: bool = True,
+) -> dict[str, Any]:
+    """Partition, scope and merge a normalized document onto *template*.
+
+    The CLI-flag half of the validation pipeline, shared by
+    :py:func:`run_config_validation` and
+    :py:meth:`~click_extra.config.option.ConfigOption.merge_default_map` so both
+    produce the same `default_map` payload. Opaque sub-trees are pruned by
+    shallow copies along their paths, so their content is never traversed, and
+    the merge fills a structural copy of *template*, never the caller's.
+
+    Raises `ValueError` from the strict merge.
+    """
+    if opaque_paths:
+        normalized = _strip_opaque_subtrees(
+            normalized,
+            (f"{app_name}.{path}" if app_name else path for path in opaque_paths),
+        )
+    if app_name:
+        normalized = _scope_app_sections(
+            normalized, app_name, fallback_sections, warn=warn
+        )
+    return _merge_into_template(
+        _copy_template(template), normalized, strict, blocked=blocked
+    )
+
+
 def _collect_validator_errors(
     app_name: str,
     app_section: dict[str, Any],
@@ -1226,7 +1293,8 @@ def run_config_validation(
 
     Stages, in order:
 
-    1. **Normalize.** Strip reserved keys and expand dotted keys.
+    1. **Normalize.** Strip reserved keys and expand dotted keys, in the app's
+       own top-level entries only (see :py:func:`_normalize_app_entries`).
     2. **Partition.** Split opaque sub-trees (schema extension fields plus every
        registered validator's `extension_path`) from the CLI-flag-bound
        content. Extracted sub-trees land in
@@ -1273,8 +1341,10 @@ def run_config_validation(
         errors.append(error)
         return not collect_all
 
-    # Stage 1: normalize.
-    normalized = _normalize_conf(user_conf, strict=strict)
+    # Stage 1: normalize the app's own entries.
+    normalized = _normalize_app_entries(
+        user_conf, app_name, fallback_sections, strict=strict
+    )
 
     # Stage 2: partition opaque sub-trees from CLI-flag-bound content.
     opaque_paths = _opaque_paths(config_schema, config_validators)
@@ -1287,24 +1357,18 @@ def run_config_validation(
 
     # Stage 3: strict-check the CLI-flag-bound part against the template.
     if params_template is not None:
-        prefixed_paths = (
-            f"{app_name}.{path}" if app_name else path for path in opaque_paths
-        )
-        stripped = _strip_opaque_subtrees(normalized, prefixed_paths)
-        # Scope the strict check to the app's own section: foreign sections in
-        # a shared file are not ours to police. Stage 2 already resolved the
-        # section once, so the legacy-section warning is muted here.
-        scoped = (
-            _scope_app_sections(stripped, app_name, fallback_sections, warn=False)
-            if app_name
-            else stripped
-        )
         try:
-            merged_conf = _merge_into_template(
-                copy.deepcopy(params_template),
-                scoped,
-                strict,
+            # Stage 2 already resolved the section once, so the legacy-section
+            # warning is muted here.
+            merged_conf = _merge_app_conf(
+                normalized,
+                params_template,
+                app_name,
+                opaque_paths=opaque_paths,
+                fallback_sections=fallback_sections,
+                strict=strict,
                 blocked=frozenset(blocked_params),
+                warn=False,
             )
         except ValueError as exc:
             # Path-1 error. Empty path keeps str(ValidationError) == str(exc),
@@ -61,7 +61,7 @@ from .highlight import HelpFormatter
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
     from typing import Concatenate, Final
 
     from .table import ColumnSpec, TableFormat
@@ -161,11 +161,12 @@ class Context(cloup.Context):
 
     def render_table(
         self,
-        table_data: Sequence[Sequence[str | None]],
+        table_data: Iterable[Sequence[str | None]],
         headers: Sequence[str | ColumnSpec | tuple[str, str | None] | None]
         | None = None,
         table_format: TableFormat | None = None,
         sort_key: Callable[[Sequence[str | None]], Any] | None = None,
+        limit: int | None = None,
         **kwargs: Any,
     ) -> str:
         """Render a table honoring the invocation's table options, and return it.
@@ -191,16 +192,19 @@ class Context(cloup.Context):
             headers,
             table_format=table_format,
             sort_key=sort_key,
+            limit=limit,
             **kwargs,
         )
 
     def print_table(
         self,
-        table_data: Sequence[Sequence[str | None]],
+        table_data: Iterable[Sequence[str | None]],
         headers: Sequence[str | ColumnSpec | tuple[str, str | None] | None]
         | None = None,
         table_format: TableFormat | None = None,
         sort_key: Callable[[Sequence[str | None]], Any] | None = None,
+        limit: int | None = None,
+        pager: bool = False,
         **kwargs: Any,
     ) -> None:
         """Render a table honoring the invocation's table options, and print it.
@@ -208,7 +212,8 @@ class Context(cloup.Context):
         The printing counterpart of {meth}`render_table`: same defaulting of
         `table_format` and `sort_key` from the context's shared `meta`,
         delegating to {func}`click_extra.table.print_table` (which also
-        handles ANSI translation and colorization policy).
+        handles ANSI translation and colorization policy). Rows may come from
+        a lazy iterable, and `limit` and `pager` pass through unchanged.
         """
         # Imported here because the table module depends on this one.
         from .table import print_table
@@ -222,6 +227,8 @@ class Context(cloup.Context):
             headers,
             table_format=table_format,
             sort_key=sort_key,
+            limit=limit,
+            pager=pager,
             **kwargs,
         )
 
@@ -448,6 +455,14 @@ The quiet counterpart of {data}`VERBOSE`: each `-q` subtracts one step from the
 `verbose - quiet` net applied on top of the base verbosity level.
 """
 
+LOG_FORMAT: Final[str] = "click_extra.log_format"
+"""The {class}`~click_extra.logging.LogFormat` log records are rendered in.
+
+Written by {meth}`click_extra.logging.LogFormatOption.apply_format`, from the
+option's own callback or from the verbosity options' parse-time pre-scan,
+whichever runs first. Read by the same method to apply the format only once.
+"""
+
 
 # --- Timing -------------------------------------------------------------------
 
@@ -496,6 +511,22 @@ table by {func}`click_extra.table.print_table` from the column IDs its headers
 carry.
 """
 
+SORT_SPILL_ROWS: Final[str] = "click_extra.sort_spill_rows"
+"""Row count above which table sorts spill sorted runs to disk.
+
+Written by {class}`click_extra.table.SortByOption.init_sort` from its
+`spill_rows` argument. Read by {func}`click_extra.table.render_table` and
+{func}`click_extra.table.print_table`. Unset or `None` sorts in memory.
+"""
+
+TABLE_LIMIT: Final[str] = "click_extra.table_limit"
+"""Maximum number of rows to render, picked via `--limit`.
+
+Written by {class}`click_extra.table.LimitOption.init_limit`. Read by
+{func}`click_extra.table.render_table` and {func}`click_extra.table.print_table`
+as their default `limit`. Unset or `None` renders every row.
+"""
+
 COLUMNS: Final[str] = "click_extra.columns"
 """Tuple of column IDs selected via `--columns` (in display order).
 
@@ -42,10 +42,10 @@ from .config import (
     ValidateConfigOption,
 )
 from .execution import JobsOption, TimerOption, ZeroExitOption
-from .logging import QuietOption, VerboseOption, VerbosityOption
+from .logging import LogFormatOption, QuietOption, VerboseOption, VerbosityOption
 from .multicall import MulticallGroup
 from .parameters import Argument, Option, ShowParamsOption
-from .table import ColumnsOption, SortByOption, TableFormatOption
+from .table import ColumnsOption, LimitOption, SortByOption, TableFormatOption
 from .telemetry import TelemetryOption
 from .theme import ThemeOption
 from .tree import TreeOption
@@ -349,6 +349,8 @@ columns_option = decorator_factory(dec=option, cls=ColumnsOption)
 config_option = decorator_factory(dec=option, cls=ConfigOption)
 export_config_option = decorator_factory(dec=option, cls=ExportConfigOption)
 jobs_option = decorator_factory(dec=option, cls=JobsOption)
+limit_option = decorator_factory(dec=option, cls=LimitOption)
+log_format_option = decorator_factory(dec=option, cls=LogFormatOption)
 help_format_option = decorator_factory(dec=option, cls=HelpFormatOption)
 man_option = decorator_factory(dec=option, cls=ManOption)
 no_color_option = decorator_factory(dec=option, cls=NoColorOption)
@@ -33,6 +33,7 @@ serialization and disclosure atoms both altitudes (and
 
 from __future__ import annotations
 
+import io
 import logging
 import os
 import signal
@@ -70,6 +71,7 @@ if TYPE_CHECKING:
     from typing import IO, Any
 
     from .envvar import TEnvVars
+    from .spinner import LaneProgress, _LaneTally
     from .theme import HelpTheme
 
     TArg = str | Path | None
@@ -552,12 +554,30 @@ def run_jobs(
             )
 
 
+def _lane_results(
+    func: Callable[[T], R],
+    items: list[T],
+    tally: _LaneTally | None,
+) -> Generator[R, None, None]:
+    """Map `func` over one lane's `items` in order, feeding its progress tally."""
+    if tally is None:
+        for item in items:
+            yield func(item)
+        return
+    tally.begin()
+    for item in items:
+        result = func(item)
+        tally.step()
+        yield result
+
+
 def run_lanes(
     func: Callable[[T], R],
     lanes: Iterable[Iterable[T]],
     *,
     jobs: int | None = None,
     serial_at_debug: bool = False,
+    progress: LaneProgress | None = None,
 ) -> Generator[R, None, None]:
     """Run `func` over grouped items: serial within a lane, concurrent across.
 
@@ -587,10 +607,18 @@ def run_lanes(
         `1` or fewer forces fully sequential execution.
     :param serial_at_debug: forwarded to {func}`resolve_jobs` when `jobs` is not
         given: collapse to sequential at `DEBUG` verbosity.
+    :param progress: a {class}`~click_extra.spinner.LaneProgress` display to
+        feed. Each lane is announced to it as it is materialized, and the worker
+        running the lane counts every finished item, so the display tracks each
+        lane's throughput and ETA.
     :return: An iterator over `func`'s results, lane by lane in submission order.
     """
-    # Each lane is materialized only as it is pulled, never all of them at once.
-    lane_stream = (list(lane) for lane in lanes)
+    # Each lane is materialized only as it is pulled, never all of them at once,
+    # and announced to the progress display (if any) at that point.
+    lane_stream = (
+        (items, progress.lane(items) if progress is not None else None)
+        for items in (list(lane) for lane in lanes)
+    )
     head = list(islice(lane_stream, 2))
     if not head:
         return
@@ -600,14 +628,13 @@ def run_lanes(
 
     if jobs <= 1:
         # Sequential and lazy across every lane and item: the caller can break early.
-        for lane in chain(head, lane_stream):
-            for item in lane:
-                yield func(item)
+        for items, tally in chain(head, lane_stream):
+            yield from _lane_results(func, items, tally)
     else:
         # Each lane is a serial chain run on one worker; chains run concurrently and
         # their results are yielded in submission order.
-        def run_chain(lane: list[T]) -> list[R]:
-            return [func(item) for item in lane]
+        def run_chain(lane: tuple[list[T], _LaneTally | None]) -> list[R]:
+            return list(_lane_results(func, *lane))
 
         # The pool teardown drops queued lanes on a prompt interrupt instead of
         # blocking on the in-flight ones (see {func}`_interruptible_pool`).
@@ -861,7 +888,7 @@ def format_cli_prompt(
     )
 
 
-_LIVE_PROCESSES: Final[set[subprocess.Popen[str]]] = set()
+_LIVE_PROCESSES: Final[set[subprocess.Popen[Any]]] = set()
 """Registry of the subprocesses currently running through {func}`run_cli`.
 
 Populated by {func}`run_cli` for the lifetime of each child (added right after
@@ -877,7 +904,7 @@ _LIVE_PROCESSES_LOCK: Final = threading.Lock()
 mutation by worker threads."""
 
 
-_GROUP_LEADERS: Final[set[subprocess.Popen[str]]] = set()
+_GROUP_LEADERS: Final[set[subprocess.Popen[Any]]] = set()
 """Subset of {data}`_LIVE_PROCESSES` spawned with `start_new_session`.
 
 Each of these children leads its own POSIX session and process group, so the
@@ -888,7 +915,7 @@ with {data}`_LIVE_PROCESSES`, under the same lock.
 
 
 def _kill_posix_process_group(
-    process: subprocess.Popen[str],
+    process: subprocess.Popen[Any],
     signum: signal.Signals,
 ) -> bool:
     """Signal the whole POSIX process group led by `process`.
@@ -1010,32 +1037,145 @@ def _kill_windows_process_tree(pid: int) -> None:
     )
 
 
+_PROGRESS_INTERVAL: Final = 1.0
+"""Seconds between two carriage-return redraws {func}`run_cli` forwards to the
+logger when `collapse_progress` is on."""
+
+
+class _OutputThrottle:
+    """Rate limiter shared by the reader threads of one {func}`run_cli` call.
+
+    Forwards at most `max_rate` lines to the logger per one-second window, and
+    counts the others. When a window with suppressed lines is over, a single
+    summary record reports how many were dropped: the next forwarded line
+    triggers it, or the last reader to finish, via {meth}`close`.
+    """
+
+    def __init__(
+        self,
+        log: logging.Logger,
+        level: int,
+        extra: dict[str, Any] | None,
+        max_rate: int,
+        readers: int,
+    ) -> None:
+        self.log = log
+        self.level = level
+        self.extra = extra
+        self.max_rate = max_rate
+        self.open_readers = readers
+        self.lock = threading.Lock()
+        self.window_start = time.monotonic()
+        self.forwarded = 0
+        self.suppressed = 0
+
+    def _report(self) -> None:
+        """Log the number of lines suppressed so far, then reset it.
+
+        Must be called with {attr}`lock` held.
+        """
+        if self.suppressed:
+            self.log.log(
+                self.level,
+                f"Suppressed {self.suppressed} output lines.",
+                extra=self.extra,
+            )
+            self.suppressed = 0
+
+    def forward(self, text: str) -> None:
+        """Log *text*, unless the current window's quota is spent."""
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window_start >= 1.0:
+                self._report()
+                self.window_start = now
+                self.forwarded = 0
+            if self.forwarded >= self.max_rate:
+                self.suppressed += 1
+                return
+            self.forwarded += 1
+        self.log.log(self.level, text, extra=self.extra)
+
+    def close(self) -> None:
+        """Report the lines suppressed in the last window, once all readers
+        are done."""
+        with self.lock:
+            self.open_readers -= 1
+            if not self.open_readers:
+                self._report()
+
+
 def _pump_stream(
     pipe: IO[str],
     sink: list[str],
     log: logging.Logger,
     level: int,
     label: str | None,
+    throttle: _OutputThrottle | None = None,
+    collapse_progress: bool = False,
 ) -> None:
-    """Reader-thread body: accumulate `pipe`'s lines and forward each to `log`.
+    r"""Reader-thread body: accumulate `pipe`'s lines and forward each to `log`.
 
-    Each line is appended raw to `sink` (so the caller reassembles the exact
+    Each line is appended to `sink` (so the caller reassembles the exact
     capture `communicate()` would have produced), then echoed to the logger
     stripped of ANSI codes and trailing whitespace. Blank lines are accumulated
-    but not logged. The loop ends at `EOF`, when every writer of the pipe has
-    closed it.
+    but not logged, and no line is stripped at all while `log` ignores `level`.
+    The loop ends at `EOF`, when every writer of the pipe has closed it.
+
+    `pipe` must be opened with `newline=""`, so a line ended by a bare `\r`
+    (a progress redraw) can be told apart from a full line. Both `\r\n` and
+    `\r` are translated to `\n` before reaching `sink`, as universal-newlines
+    mode would have done.
+
+    With `collapse_progress`, redraws are forwarded at most once per
+    {data}`_PROGRESS_INTERVAL`. The latest one is held back otherwise, and is
+    dropped by the next full line, which usually carries the final state of the
+    bar. A redraw still held at `EOF` is forwarded. Lines go through `throttle`
+    when one is set.
 
     `label` rides each record as its `label` attribute, which
     {class}`click_extra.logging.Formatter` renders glued to the level name
     (`debug:mas: ...`) rather than polluting the message text itself.
     """
     extra = {"label": label} if label else None
-    for line in pipe:
-        sink.append(line)
-        text = strip_ansi(line).rstrip()
-        if text:
+    if throttle is not None:
+        forward = throttle.forward
+    else:
+
+        def forward(text: str) -> None:
             log.log(level, text, extra=extra)
 
+    held: str | None = None
+    last_progress = float("-inf")
+    try:
+        for line in pipe:
+            progress = False
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
+            elif line.endswith("\r"):
+                line = line[:-1] + "\n"
+                progress = True
+            sink.append(line)
+            if not log.isEnabledFor(level):
+                continue
+            text = strip_ansi(line).rstrip()
+            if not text:
+                continue
+            if collapse_progress:
+                if progress:
+                    now = time.monotonic()
+                    if now - last_progress < _PROGRESS_INTERVAL:
+                        held = text
+                        continue
+                    last_progress = now
+                held = None
+            forward(text)
+        if held is not None:
+            forward(held)
+    finally:
+        if throttle is not None:
+            throttle.close()
+
 
 def _drain_readers(readers: Iterable[threading.Thread], timeout: float | None) -> bool:
     """Join the reader threads, bounded by `timeout` seconds shared among them.
@@ -1068,6 +1208,8 @@ def run_cli(
     command_level: int = logging.INFO,
     output_level: int = logging.DEBUG,
     log: logging.Logger | None = None,
+    max_output_rate: int | None = None,
+    collapse_progress: bool = False,
 ) -> subprocess.CompletedProcess[str]:
     """Run a CLI in a subprocess, disclosing the call and streaming its output live.
 
@@ -1101,11 +1243,11 @@ def run_cli(
     `stdin`, and never opens a console window on Windows.
 
     ```{note}
-    The pipes are opened in universal-newlines text mode, so a bare `\\r`
-    (a child redrawing a progress bar in place) terminates a line just like
-    `\\n`: each redraw is streamed as its own log line, and the captured
-    text normalizes both to `\\n`, exactly as
-    {meth}`subprocess.Popen.communicate` does.
+    A bare `\\r` (a child redrawing a progress bar in place) terminates a line
+    just like `\\n`: each redraw is streamed as its own log line, unless
+    `collapse_progress` is set, and the captured text normalizes both to
+    `\\n`, exactly as {meth}`subprocess.Popen.communicate` does in
+    universal-newlines mode.
     ```
 
     :param args: the command line. Nested iterables are flattened, `None`
@@ -1164,6 +1306,19 @@ def run_cli(
         {data}`logging.DEBUG`.
     :param log: destination logger. Defaults to the root logger, whose level the
         {class}`~click_extra.logging.VerbosityOption` family manages.
+    :param max_output_rate: maximum number of output lines forwarded to the
+        logger per second, `stdout` and `stderr` combined. Lines past the quota
+        are dropped from the log, and each second with dropped lines ends with a
+        `Suppressed N output lines.` record carrying the same `label`. `None`,
+        the default, forwards every line.
+    :param collapse_progress: forward at most one carriage-return redraw per
+        second, instead of one record per frame of a progress bar. The full
+        line closing the bar is still forwarded.
+
+    ```{note}
+    `max_output_rate` and `collapse_progress` only thin out the log: the
+    returned `stdout` and `stderr` always hold every line.
+    ```
     """
     if log is None:
         log = logging.getLogger()
@@ -1185,14 +1340,13 @@ def run_cli(
     # Session isolation is a POSIX concept: force it off on Windows, whose kill
     # path already covers the whole tree through taskkill.
     start_new_session = start_new_session and not is_windows()
+    # The pipes are opened in binary mode, and decoded by the readers.
     process = subprocess.Popen(
         clean_args,
         # Prevents the child from blocking on stdin reads.
         stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT if merge_streams else subprocess.PIPE,
-        encoding="utf-8",
-        errors=errors,
         env=cast("subprocess._ENV", env_copy(extra_env)),
         cwd=cwd,
         creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
@@ -1217,13 +1371,36 @@ def run_cli(
     # interpreter shutdown.
     out_lines: list[str] = []
     err_lines: list[str] = []
+    pipes = [
+        (pipe, sink)
+        for pipe, sink in ((process.stdout, out_lines), (process.stderr, err_lines))
+        if pipe is not None
+    ]
+    throttle = None
+    if max_output_rate is not None:
+        throttle = _OutputThrottle(
+            log,
+            output_level,
+            {"label": label} if label else None,
+            max_output_rate,
+            len(pipes),
+        )
     readers = []
-    for pipe, sink in ((process.stdout, out_lines), (process.stderr, err_lines)):
-        if pipe is None:
-            continue
+    for pipe, sink in pipes:
+        # newline="" keeps the line endings for _pump_stream to translate, so it
+        # can recognize carriage-return redraws.
+        text_pipe = io.TextIOWrapper(pipe, encoding="utf-8", errors=errors, newline="")
         reader = threading.Thread(
             target=_pump_stream,
-            args=(pipe, sink, log, output_level, label),
+            args=(
+                text_pipe,
+                sink,
+                log,
+                output_level,
+                label,
+                throttle,
+                collapse_progress,
+            ),
             daemon=True,
         )
         reader.start()
@@ -38,10 +38,11 @@ at `DEBUG`/`CRITICAL`.
 from __future__ import annotations
 
 import inspect
+import json
 import logging
 import sys
 from contextlib import nullcontext
-from enum import IntEnum
+from enum import Enum, IntEnum
 from gettext import gettext as _
 from logging import (
     FileHandler,
@@ -62,7 +63,7 @@ from .types import EnumChoice
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable, Mapping, Sequence
+    from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
     from logging import LogRecord
     from typing import IO, Any, ClassVar, Literal
 
@@ -94,6 +95,19 @@ class LogLevel(IntEnum):
         return self.name
 
 
+class LogFormat(Enum):
+    """Rendering styles of log records, as selected by {class}`LogFormatOption`."""
+
+    TEXT = "text"
+    """Human-oriented lines, colored by {class}`Formatter`."""
+
+    JSON = "json"
+    """One compact JSON object per record, rendered by {class}`JSONFormatter`."""
+
+    def __str__(self):
+        return self.value
+
+
 DEFAULT_LEVEL: LogLevel = LogLevel.WARNING
 """{data}`WARNING <logging.WARNING>` is the default level we expect any loggers to starts their lives at.
 
@@ -238,6 +252,58 @@ class Formatter(logging.Formatter):
             record.levelname = original_levelname
 
 
+_json_encode: Callable[[Any], str] = json.JSONEncoder(
+    ensure_ascii=False,
+    check_circular=False,
+    separators=(",", ":"),
+).encode
+"""Compact JSON encoder, built once and shared by every {class}`JSONFormatter`."""
+
+
+class JSONFormatter(logging.Formatter):
+    """Log formatter rendering each record as one line of compact JSON.
+
+    Meant for log pipelines rather than humans, every record produces an object
+    with the same keys:
+
+    - `timestamp`: creation time of the record, in seconds since the epoch,
+    - `level`: the level name, like `WARNING`,
+    - `logger`: the name of the logger that emitted the record,
+    - `label`: the label {func}`~click_extra.execution.run_cli` tags the lines
+      it streams from a subprocess with, or `null`,
+    - `pid`: the ID of the process that emitted the record,
+    - `message`: the formatted message, stripped of any ANSI escape,
+
+    plus `exc_info` and `stack_info` when the record carries a traceback or a
+    stack.
+
+    Unlike {class}`Formatter`, the format string is ignored, and no theme is
+    looked up: nothing is styled.
+    """
+
+    def format(self, record: LogRecord) -> str:
+        """Serialize *record* to a single line of JSON."""
+        message = record.getMessage()
+        if "\x1b" in message:
+            message = strip_ansi(message)
+        payload = {
+            "timestamp": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "label": getattr(record, "label", None),
+            "pid": record.process,
+            "message": message,
+        }
+        # Cache the traceback on the record, like logging.Formatter.format does.
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return _json_encode(payload)
+
+
 def basicConfig(
     *,
     # Arguments from Python's standard library's basicConfig:
@@ -329,7 +395,8 @@ def basicConfig(
         {class}`logging.FileHandler`.
     :param formatter_class: A :py:class:`logging.Formatter` class of the formatter that
         will be used in {func}`logging.basicConfig` to setup the default formatter. Defaults to
-        :py:class:`Formatter`.
+        :py:class:`Formatter`. Pass :py:class:`JSONFormatter` to emit one JSON object
+        per record.
 
     ```{note}
     I don't like the camel-cased name of this function and would have called it
@@ -526,6 +593,9 @@ class _VerbosityOption(ExtraOption):
         first lands on the final level directly instead of applying a louder
         intermediate that a later `-q` would have to walk back. See
         {data}`_COUNTER_SCANNED`.
+
+        The `--log-format` of a {class}`LogFormatOption` is applied in the same
+        pass, whatever its position on the command line.
         """
         if not ctx.resilient_parsing and not context.get(ctx, _COUNTER_SCANNED):
             context.set(ctx, _COUNTER_SCANNED, True)
@@ -537,6 +607,15 @@ class _VerbosityOption(ExtraOption):
                 if option is not None:
                     value, _ = option.consume_value(ctx, opts)
                     context.set(ctx, key, value)
+            # Switch the log format before any level is applied too, so the
+            # debug trace of the verbosity options is rendered in it.
+            format_option = last_param(ctx.command.params, LogFormatOption)
+            if isinstance(format_option, LogFormatOption):
+                value, _ = format_option.consume_value(ctx, opts)
+                if value is not None:
+                    format_option.apply_format(
+                        ctx, format_option.type_cast_value(ctx, value)
+                    )
 
         return super().handle_parse_result(  # type: ignore[no-any-return]
             ctx, opts, args
@@ -827,3 +906,97 @@ class QuietOption(_CounterOption):
         if not param_decls:
             param_decls = ("--quiet", "-q")
         super().__init__(param_decls=param_decls, **kwargs)
+
+
+class LogFormatOption(ExtraOption):
+    """`--log-format [text|json]` option to select the rendering style of log
+    records.
+
+    `text`, the default, leaves logging as configured. `json` swaps the
+    {class}`Formatter` of the handlers set up by {func}`new_logger` or
+    {func}`basicConfig` for a {class}`JSONFormatter`, on the `root` and
+    `click_extra` loggers, and on the loggers managed by the
+    {class}`VerbosityOption` family of the same command. Handlers with a foreign
+    formatter are left alone. The original formatters are restored when the
+    context closes.
+
+    The selected {class}`LogFormat` is saved in the context in
+    `ctx.meta[click_extra.context.LOG_FORMAT]`.
+
+    ```{note}
+    The verbosity options apply the format themselves before setting any level,
+    so their own debug messages already come out as JSON, even when
+    `--log-format` is passed after them on the command line.
+    ```
+    """
+
+    def managed_loggers(self, ctx: click.Context) -> Generator[Logger, None, None]:
+        """Yield the loggers whose handlers are switched to the selected format.
+
+        The `root` and `click_extra` loggers come first, then the loggers of the
+        verbosity options declared on the command, each yielded once.
+        """
+        names = {logging.root.name: None, "click_extra": None}
+        for param in ctx.command.params:
+            if isinstance(param, _VerbosityOption):
+                names[param.logger_name] = None
+        for name in names:
+            yield getLogger(name)
+
+    def apply_format(self, ctx: click.Context, log_format: LogFormat) -> None:
+        """Record *log_format* on the context and reformat the managed handlers.
+
+        Idempotent: the option's callback and the verbosity options' pre-scan
+        both flow through here, and only the first call does the swap.
+        """
+        if ctx.resilient_parsing or context.get(ctx, context.LOG_FORMAT) is not None:
+            return
+        context.set(ctx, context.LOG_FORMAT, log_format)
+        if log_format is LogFormat.TEXT:
+            return
+
+        swapped: list[tuple[Handler, logging.Formatter]] = []
+        formatter = JSONFormatter()
+        for managed_logger in self.managed_loggers(ctx):
+            for handler in managed_logger.handlers:
+                if isinstance(handler.formatter, Formatter):
+                    swapped.append((handler, handler.formatter))
+                    handler.setFormatter(formatter)
+
+        def restore() -> None:
+            for handler, original in swapped:
+                handler.setFormatter(original)
+
+        ctx.call_on_close(restore)
+        logger.debug(f"Render logs as {log_format} in {len(swapped)} handlers.")
+
+    def set_format(
+        self, ctx: click.Context, param: click.Parameter, value: LogFormat
+    ) -> None:
+        """Apply the format, unless a verbosity option already did."""
+        self.apply_format(ctx, value)
+
+    def __init__(
+        self,
+        param_decls: Sequence[str] | None = None,
+        type=EnumChoice(LogFormat),
+        default=LogFormat.TEXT,
+        expose_value=False,
+        is_eager=True,
+        help=_("Rendering style of log messages."),
+        **kwargs,
+    ) -> None:
+        if not param_decls:
+            param_decls = ("--log-format",)
+
+        kwargs.setdefault("callback", self.set_format)
+
+        super().__init__(
+            param_decls=param_decls,
+            type=type,
+            default=default,
+            expose_value=expose_value,
+            is_eager=is_eager,
+            help=help,
+            **kwargs,
+        )
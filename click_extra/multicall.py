@@ -224,6 +224,11 @@ class MulticallGroup(Group):
             listing every invocation name the binary answers to. Register your
             own `personalities` subcommand to override it.
         """
+        # Set ahead of the parent constructor, whose auto-injected commands
+        # already go through add_command().
+        self._personality_cache: dict[
+            tuple[str | None, tuple[str, ...]], click.Command
+        ] = {}
         super().__init__(*args, **kwargs)
         self.personalities: dict[str, tuple[str, ...]] = {}
         for name, tokens in (personalities or {}).items():
@@ -231,6 +236,20 @@ class MulticallGroup(Group):
         if personalities_command and "personalities" not in self.commands:
             self.add_command(_make_personalities_command())
 
+    def add_command(  # type: ignore[override]
+        self,
+        cmd: click.Command,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Like `Group.add_command`, but drops the memoized personalities.
+
+        A personality is built from the subcommand registered under its name,
+        so replacing or adding a subcommand must not leave a stale one behind.
+        """
+        super().add_command(cmd, name, **kwargs)
+        self._personality_cache.clear()
+
     def resolve_invocation_name(self, prog_name: str | None = None) -> str | None:
         """The name this binary was invoked under.
 
@@ -294,7 +313,7 @@ class MulticallGroup(Group):
         if tokens is None:
             return super().main(args=args, prog_name=prog_name, **kwargs)
 
-        personality = self.build_personality(name, tokens)
+        personality = self.get_personality(name, tokens)
         if args is None:
             args = sys.argv[1:]
         return personality.main(
@@ -303,6 +322,28 @@ class MulticallGroup(Group):
             **kwargs,
         )
 
+    def get_personality(
+        self,
+        name: str | None,
+        tokens: tuple[str, ...],
+    ) -> click.Command:
+        """The standalone command for the *name* personality, built once.
+
+        Memoizes {meth}`build_personality` per `(name, tokens)` pair for the
+        lifetime of the group, so a process dispatching the same personality
+        repeatedly pays for the parameter deep-copies, the command
+        re-instantiation and the constraint rebinding only on the first call.
+        Reusing the instance is safe for the same reason reusing the group is:
+        Click keeps per-invocation state on the context, not on the command.
+        The memo is dropped whenever a subcommand is registered.
+        """
+        key = (name, tokens)
+        personality = self._personality_cache.get(key)
+        if personality is None:
+            personality = self.build_personality(name, tokens)
+            self._personality_cache[key] = personality
+        return personality
+
     def build_personality(
         self,
         name: str | None,
@@ -329,6 +370,9 @@ class MulticallGroup(Group):
         and subcommand's `envvar` attributes and leak that back into group
         mode. This is the same class of leaky state
         {func}`~click_extra.commands.default_params` warns about.
+
+        Always builds a fresh command: dispatch goes through the memoized
+        {meth}`get_personality` instead.
         """
         sub_name = tokens[0]
         sub = self._get_personality_subcommand(sub_name)
@@ -488,6 +488,26 @@ class ParamStructure:
 
         return dive(path)
 
+    @staticmethod
+    def insert_tree_value(tree_dict: dict[str, Any], *path: str, leaf: Any) -> None:
+        """Place `leaf` at the `path` of `tree_dict`, in place.
+
+        The incremental counterpart of merging an {meth}`init_tree_dict` branch
+        into `tree_dict` with `always_merger`, with the same outcome: missing
+        levels are created, intermediate non-dict values are replaced by dicts,
+        and a value already at `path` is merged with `leaf`. But it descends
+        with direct lookups, so each insertion costs one walk down its own
+        path instead of a recursive merge.
+        """
+        node = tree_dict
+        for key in path[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = node[key] = {}
+            node = child
+        key = path[-1]
+        node[key] = always_merger.merge(node[key], leaf) if key in node else leaf
+
     @staticmethod
     def get_tree_value(tree_dict: dict[str, Any], *path: str) -> Any:
         """Get in the `tree_dict` the value located at the `path`.
@@ -606,9 +626,7 @@ class ParamStructure:
             if PARAM_PATH_SEP.join(keys) in self.excluded_params:
                 continue
 
-            objects = always_merger.merge(
-                objects, self.init_tree_dict(*keys, leaf=[param])
-            )
+            self.insert_tree_value(objects, *keys, leaf=[param])
 
         return objects
 
@@ -638,6 +656,30 @@ class ParamStructure:
         """
         return self.build_param_trees()
 
+    @cached_property
+    def params_types(self) -> dict[tuple[str, ...], tuple[type, ...]]:
+        """Index the Python types of {attr}`params_objects` by parameter path.
+
+        Each path, as a tuple of keys, maps to the deduplicated types of the
+        parameters sharing it, in declaration order: one type when they agree.
+        Derived once, so a configuration loader resolves each of its values
+        with a single lookup instead of descending the tree and mapping Click
+        types again.
+        """
+        index: dict[tuple[str, ...], tuple[type, ...]] = {}
+
+        def walk(tree: dict[str, Any], path: tuple[str, ...]) -> None:
+            for key, value in tree.items():
+                if isinstance(value, dict):
+                    walk(value, (*path, key))
+                else:
+                    index[(*path, key)] = tuple(
+                        dict.fromkeys(self.get_param_type(p) for p in value)
+                    )
+
+        walk(self.params_objects, ())
+        return index
+
 
 def get_param_spec(param: click.Parameter, ctx: click.Context) -> str | None:
     """Extract the option-spec string (like `-v, --verbose`) from a parameter.
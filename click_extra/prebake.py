@@ -46,34 +46,76 @@ import ast
 import logging
 import sys
 from pathlib import Path
+from typing import NamedTuple
 
 if sys.version_info >= (3, 11):
     import tomllib
 else:
     import tomli as tomllib  # type: ignore[import-not-found]
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
 logger = logging.getLogger(__name__)
 
 
-def _find_dunder_str(source: str, name: str) -> ast.Constant | None:
-    """Find a top-level dunder string constant in parsed source.
+def _find_str_constants(source: str) -> dict[str, ast.Constant]:
+    """Find every top-level string constant in parsed source.
 
-    Locates the first top-level `name = "..."` assignment and returns
-    the {class}`ast.Constant` node for the string value. Returns
-    `None` if no matching assignment is found.
+    Parses *source* once and maps each top-level `name = "..."` assignment to
+    the {class}`ast.Constant` node of its string value, dunder placeholders
+    included. When a name is assigned several times, the first assignment wins.
     """
-    tree = ast.parse(source)
-    for node in ast.iter_child_nodes(tree):
+    found: dict[str, ast.Constant] = {}
+    for node in ast.iter_child_nodes(ast.parse(source)):
         if (
             isinstance(node, ast.Assign)
             and len(node.targets) == 1
             and isinstance(node.targets[0], ast.Name)
-            and node.targets[0].id == name
             and isinstance(node.value, ast.Constant)
             and isinstance(node.value.value, str)
         ):
-            return node.value
-    return None
+            found.setdefault(node.targets[0].id, node.value)
+    return found
+
+
+def _find_dunder_str(source: str, name: str) -> ast.Constant | None:
+    """Find a top-level dunder string constant in parsed source.
+
+    Locates the first top-level `name = "..."` assignment and returns
+    the {class}`ast.Constant` node for the string value. Returns
+    `None` if no matching assignment is found.
+    """
+    return _find_str_constants(source).get(name)
+
+
+def _replace_str_literals(
+    source: str,
+    edits: Sequence[tuple[ast.Constant, str]],
+) -> str:
+    """Replace the content of several string literals in *source*.
+
+    Uses each AST node's line/column positions to swap the text between the
+    opening and closing quotes, preserving quoting style and all surrounding
+    content. Edits are applied from the end of the source backwards, so the
+    offsets of the ones still pending stay valid.
+    """
+    lines = source.splitlines(keepends=True)
+    for node, new_value in sorted(
+        edits,
+        key=lambda edit: (edit[0].end_lineno, edit[0].col_offset),
+        reverse=True,
+    ):
+        col_offset = node.col_offset
+        end_lineno = node.end_lineno
+        col_end = node.end_col_offset
+        assert col_offset is not None
+        assert end_lineno is not None and col_end is not None
+        line = lines[end_lineno - 1]
+        # Replace everything between the opening and closing quotes.
+        lines[end_lineno - 1] = line[: col_offset + 1] + new_value + line[col_end - 1 :]
+    return "".join(lines)
 
 
 def _rewrite_str_literal(
@@ -84,21 +126,23 @@ def _rewrite_str_literal(
 ) -> None:
     """Replace a string literal's content in a source file.
 
-    Uses the AST node's line/column positions to swap the text between
-    the opening and closing quotes, preserving quoting style and all
-    surrounding content.
+    Single-edit shorthand for {func}`_replace_str_literals` that writes the
+    result back to *file_path*.
     """
-    col_offset = node.col_offset
-    end_lineno = node.end_lineno
-    col_end = node.end_col_offset
-    assert col_offset is not None
-    assert end_lineno is not None and col_end is not None
-    lines = source.splitlines(keepends=True)
-    line = lines[end_lineno - 1]
-    # Replace everything between the opening and closing quotes.
-    new_line = line[: col_offset + 1] + new_value + line[col_end - 1 :]
-    lines[end_lineno - 1] = new_line
-    file_path.write_text("".join(lines), encoding="utf-8")
+    file_path.write_text(
+        _replace_str_literals(source, ((node, new_value),)), encoding="utf-8"
+    )
+
+
+def _local_version(version: str, local_version: str) -> str | None:
+    """Append *local_version* to a `.dev` *version* lacking a local identifier.
+
+    Returns `None` when *version* is a release or already carries a `+`
+    suffix, the two cases {func}`prebake_version` leaves untouched.
+    """
+    if ".dev" not in version or "+" in version:
+        return None
+    return f"{version}+{local_version}"
 
 
 def prebake_version(
@@ -130,23 +174,18 @@ def prebake_version(
     version = node.value
     assert isinstance(version, str)
 
-    if ".dev" not in version:
-        logger.info(
-            "Release version %r in %s — skipping.",
-            version,
-            file_path,
-        )
-        return None
-
-    if "+" in version:
-        logger.info(
-            "Version %r in %s already has a local identifier — skipping.",
-            version,
-            file_path,
-        )
+    new_version = _local_version(version, local_version)
+    if new_version is None:
+        if ".dev" not in version:
+            logger.info("Release version %r in %s — skipping.", version, file_path)
+        else:
+            logger.info(
+                "Version %r in %s already has a local identifier — skipping.",
+                version,
+                file_path,
+            )
         return None
 
-    new_version = f"{version}+{local_version}"
     _rewrite_str_literal(file_path, source, node, new_version)
 
     logger.info(
@@ -212,6 +251,72 @@ def prebake_dunder(
     return value
 
 
+class BakedField(NamedTuple):
+    """Outcome of one dunder placeholder in {func}`prebake_fields`."""
+
+    current: str
+    """Value of the literal before baking."""
+
+    baked: str | None
+    """New value written to the file, or `None` when left untouched."""
+
+
+def prebake_fields(
+    file_path: Path,
+    fields: Mapping[str, Callable[[], str | None]],
+    local_version: str | None = None,
+) -> dict[str, BakedField]:
+    """Pre-bake several dunder placeholders of a source file in one pass.
+
+    The multi-field counterpart of {func}`prebake_dunder` and
+    {func}`prebake_version`: *file_path* is read and parsed once, every
+    substitution is applied to that single parse, and the file is written at
+    most once. A file with nothing left to bake is never rewritten.
+
+    :param fields: maps each dunder name (like `__git_tag_sha__`) to a callable
+        producing its value. A callable is only invoked for a placeholder that
+        exists in the file and is still empty, so costly resolvers (like the
+        `git` ones) run only when their value is needed.
+    :param local_version: when set, `__version__` gets it appended as a PEP 440
+        local version identifier, with the same rules as
+        {func}`prebake_version`.
+    :return: every requested dunder found in the file (`__version__` included
+        when *local_version* is set), mapped to its {class}`BakedField`.
+    """
+    source = file_path.read_text(encoding="utf-8")
+    nodes = _find_str_constants(source)
+
+    results: dict[str, BakedField] = {}
+    edits: list[tuple[ast.Constant, str]] = []
+
+    version_node = nodes.get("__version__")
+    if local_version and version_node is not None:
+        version = str(version_node.value)
+        new_version = _local_version(version, local_version)
+        results["__version__"] = BakedField(version, new_version)
+        if new_version is not None:
+            edits.append((version_node, new_version))
+
+    for name, resolve in fields.items():
+        node = nodes.get(name)
+        if node is None:
+            continue
+        current = str(node.value)
+        value = None if current else resolve()
+        results[name] = BakedField(current, value or None)
+        if value:
+            edits.append((node, value))
+
+    if edits:
+        file_path.write_text(_replace_str_literals(source, edits), encoding="utf-8")
+        for name, (current, baked) in results.items():
+            if baked is not None:
+                logger.info(
+                    "Pre-baked %s in %s: %r → %r", name, file_path, current, baked
+                )
+    return results
+
+
 def discover_package_init_files() -> list[Path]:
     """Discover `__init__.py` files from `[project.scripts]`.
 
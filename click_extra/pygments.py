@@ -80,10 +80,15 @@ from .styling import (
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
-    from typing import ClassVar
+    from typing import ClassVar, TypeAlias
 
     from pygments.token import _TokenType
 
+    # Hashable snapshot of the SGR state of an `AnsiColorLexer`: the flag of each
+    # text attribute, in `_SGR_ATTR_ON` order, then the foreground and background
+    # color components.
+    _SgrState: TypeAlias = tuple[tuple[bool, ...], str | None, str | None]
+
 
 # --- Color palettes ---
 
@@ -268,6 +273,16 @@ Alternatives in priority order:
 7. Plain text: captured and emitted with the current styling token.
 """
 
+_SGR_TRANSITIONS: dict[tuple[bool, _SgrState, str], tuple[_SgrState, _TokenType]] = {}
+"""Memo of SGR transitions, shared by all `AnsiColorLexer` instances.
+
+Maps the `true_color` setting, a state and an SGR parameter string to the state
+the sequence leads to and the compound token of that state.
+"""
+
+_SGR_TRANSITIONS_MAX_SIZE = 4096
+"""Number of transitions after which `_SGR_TRANSITIONS` is emptied."""
+
 
 class AnsiColorLexer(Lexer):
     """Lexer for text containing ANSI escape sequences.
@@ -312,11 +327,44 @@ class AnsiColorLexer(Lexer):
 
     def _reset_state(self) -> None:
         """Reset all SGR and link state to defaults."""
+        self._reset_sgr_state()
+        self._link_active = False
+
+    def _reset_sgr_state(self) -> None:
+        """Reset all SGR state to defaults, leaving any open hyperlink open."""
         self._attrs = dict.fromkeys(_SGR_ATTR_ON.values(), False)
         self.fg_color: str | None = None
         self.bg_color: str | None = None
         self._token_dirty = True
-        self._link_active = False
+
+    def _sgr_state(self) -> _SgrState:
+        """Snapshot the SGR state as a hashable tuple."""
+        return tuple(self._attrs.values()), self.fg_color, self.bg_color
+
+    def _transition(
+        self, state: _SgrState, params: str
+    ) -> tuple[_SgrState, _TokenType]:
+        """Return the state reached from *state* by an SGR sequence, and its token.
+
+        Terminal sessions cycle through a handful of styles, so the same
+        sequences keep landing on the same states: transitions are memoized in
+        `_SGR_TRANSITIONS`, and `_process_sgr` only runs on the first occurrence
+        of each one.
+        """
+        key = (self.true_color, state, params)
+        transition = _SGR_TRANSITIONS.get(key)
+        if transition is None:
+            attrs, self.fg_color, self.bg_color = state
+            self._attrs = dict(zip(self._attrs, attrs))
+            self._token_dirty = True
+            self._process_sgr(params)
+            if len(_SGR_TRANSITIONS) >= _SGR_TRANSITIONS_MAX_SIZE:
+                _SGR_TRANSITIONS.clear()
+            transition = _SGR_TRANSITIONS[key] = (
+                self._sgr_state(),
+                self._current_token,
+            )
+        return transition
 
     @property
     def _current_token(self) -> _TokenType:
@@ -358,7 +406,7 @@ class AnsiColorLexer(Lexer):
         An empty parameter string is equivalent to SGR 0 (reset all).
         """
         if not params:
-            self._reset_state()
+            self._reset_sgr_state()
             return
 
         try:
@@ -372,7 +420,7 @@ class AnsiColorLexer(Lexer):
 
             # SGR 0: reset all attributes.
             if code == 0:
-                self._reset_state()
+                self._reset_sgr_state()
 
             # Text attributes: set (SGR 1-9, 53) or reset (SGR 22-29, 55).
             elif code in _SGR_ATTR_ON:
@@ -439,13 +487,15 @@ class AnsiColorLexer(Lexer):
         sequences are consumed and stripped.
         """
         self._reset_state()
+        state = self._sgr_state()
+        token = self._current_token
         for match in _ANSI_ESCAPE_RE.finditer(text):
-            sgr_params = match.group("sgr_params")
-            osc8_uri = match.group("osc8_uri")
-            plain = match.group("text")
+            sgr_params, osc8_uri, plain = match.group("sgr_params", "osc8_uri", "text")
 
-            if sgr_params is not None:
-                self._process_sgr(sgr_params)
+            if plain is not None:
+                yield match.start(), token, plain
+            elif sgr_params is not None:
+                state, token = self._transition(state, sgr_params)
             elif osc8_uri is not None:
                 pos = match.start()
                 if osc8_uri:
@@ -459,8 +509,6 @@ class AnsiColorLexer(Lexer):
                     # OSC 8 close: emit link end.
                     yield pos, _AnsiLinkEnd, ""
                     self._link_active = False
-            elif plain is not None:
-                yield match.start(), self._current_token, plain
         # Close any unclosed link at end of input.
         if self._link_active:
             yield len(text), _AnsiLinkEnd, ""
@@ -629,13 +677,6 @@ _LINK_SEP = "\ue001"
 _LINK_CLOSE = "\ue002"
 """Private Use Area marker injected at the end of a hyperlink."""
 
-_LINK_MARKER_RE = re.compile(f"{_LINK_OPEN}([^{_LINK_SEP}]*){_LINK_SEP}")
-"""Regex matching link-open markers in post-processed HTML.
-
-Captures the HTML-escaped URL between `_LINK_OPEN` and `_LINK_SEP` for replacement
-with an `<a href="...">` tag.
-"""
-
 _RGB_FG_OPEN = "\ue010"
 """Private Use Area marker injected before a 24-bit foreground hex value."""
 
@@ -648,13 +689,20 @@ _RGB_SEP = "\ue012"
 _RGB_CLOSE = "\ue013"
 """Private Use Area marker closing a 24-bit color span."""
 
-_RGB_MARKER_RE = re.compile(
-    f"(?P<kind>[{_RGB_FG_OPEN}{_RGB_BG_OPEN}])(?P<hex>[0-9a-f]{{6}}){_RGB_SEP}"
+_MARKER_RE = re.compile(
+    f"{_LINK_OPEN}(?P<url>[^{_LINK_SEP}]*){_LINK_SEP}"
+    f"|(?P<kind>[{_RGB_FG_OPEN}{_RGB_BG_OPEN}])(?P<hex>[0-9a-f]{{6}}){_RGB_SEP}"
+    f"|[{_LINK_CLOSE}{_RGB_CLOSE}]"
 )
-"""Regex matching 24-bit color open markers in post-processed HTML.
+"""Regex matching all link and 24-bit color markers in post-processed HTML.
+
+Alternatives:
 
-Captures the marker kind (foreground or background) and the 6-character hex value for
-replacement with a `<span style="...">` tag.
+1. Link open marker: captures the HTML-escaped URL between `_LINK_OPEN` and
+   `_LINK_SEP`, for replacement with an `<a href="...">` tag.
+2. 24-bit color open marker: captures the marker kind (foreground or background)
+   and the 6-character hex value, for replacement with a `<span style="...">` tag.
+3. Link or 24-bit color close marker, for replacement with the matching end tag.
 """
 
 
@@ -690,6 +738,7 @@ class AnsiHtmlFormatter(HtmlFormatter):
 
         super().__init__(**kwargs)
         self._ansi_css_cache: dict[_TokenType, str] = {}
+        self._rgb_markers_cache: dict[_TokenType, tuple[_TokenType, str, str]] = {}
 
     def format_unencoded(self, tokensource, outfile) -> None:
         """Render tokens to HTML, converting OSC 8 link and 24-bit RGB markers to tags.
@@ -697,33 +746,34 @@ class AnsiHtmlFormatter(HtmlFormatter):
         Replaces `Token.AnsiLinkStart` / `Token.AnsiLinkEnd` with Unicode Private
         Use Area markers, strips `FG_/BG_` 24-bit RGB components from compound tokens
         and replaces them with PUA markers carrying the hex value, delegates to Pygments'
-        HTML rendering, then post-processes the output to swap markers for `<a>` and
-        inline-styled `<span>` tags.
+        HTML rendering, then post-processes the output in a single pass to swap
+        markers for `<a>` and inline-styled `<span>` tags.
         """
         buffer = StringIO()
         super().format_unencoded(
             self._inject_link_markers(self._inject_rgb_markers(tokensource)),
             buffer,
         )
-        html = buffer.getvalue()
-        html = _LINK_MARKER_RE.sub(lambda m: f'<a href="{m.group(1)}">', html)
-        html = html.replace(_LINK_CLOSE, "</a>")
-        html = _RGB_MARKER_RE.sub(self._rgb_marker_to_span, html)
-        html = html.replace(_RGB_CLOSE, "</span>")
-        outfile.write(html)
+        outfile.write(_MARKER_RE.sub(self._marker_to_tag, buffer.getvalue()))
 
     @staticmethod
-    def _rgb_marker_to_span(match: re.Match) -> str:
-        """Replace a 24-bit RGB open marker with a `<span>` tag carrying inline style.
+    def _marker_to_tag(match: re.Match) -> str:
+        """Replace a link or 24-bit color marker with its HTML tag.
 
         `_RGB_FG_OPEN` produces a `color` declaration; `_RGB_BG_OPEN` produces a
         `background-color` declaration.
         """
-        prop = "color" if match.group("kind") == _RGB_FG_OPEN else "background-color"
-        return f'<span style="{prop}: #{match.group("hex")}">'
+        url = match.group("url")
+        if url is not None:
+            return f'<a href="{url}">'
+        kind = match.group("kind")
+        if kind is not None:
+            prop = "color" if kind == _RGB_FG_OPEN else "background-color"
+            return f'<span style="{prop}: #{match.group("hex")}">'
+        return "</a>" if match.group() == _LINK_CLOSE else "</span>"
 
-    @staticmethod
     def _inject_rgb_markers(
+        self,
         tokensource: Iterable[tuple[_TokenType, str]],
     ) -> Iterator[tuple[_TokenType, str]]:
         """Strip `FG_/BG_` components from Ansi tokens and wrap text in PUA markers.
@@ -734,47 +784,62 @@ class AnsiHtmlFormatter(HtmlFormatter):
         post-processing. Non-RGB token components (Bold, named colors, palette indices)
         survive on the rebuilt token and continue to render through the standard CSS
         class mechanism.
+
+        The rewrite of each token type is computed once by `_split_rgb_components`
+        and cached, like `_get_css_classes` does for CSS classes.
         """
+        cache = self._rgb_markers_cache
         for ttype, value in tokensource:
-            # Only Ansi compound tokens may carry FG_/BG_ components.
-            if len(ttype) <= 1 or ttype[0] != "Ansi":
-                yield ttype, value
-                continue
-
-            fg_hex: str | None = None
-            bg_hex: str | None = None
-            kept: list[str] = []
-            for component in ttype[1:]:
-                if component.startswith("FG_") and len(component) == 9:
-                    fg_hex = component[3:]
-                elif component.startswith("BG_") and len(component) == 9:
-                    bg_hex = component[3:]
-                else:
-                    kept.append(component)
-
-            if fg_hex is None and bg_hex is None:
-                yield ttype, value
-                continue
-
-            # Rebuild the token without the RGB components. An empty result collapses
-            # to `Text` so Pygments emits no surrounding span: the inline-style span
-            # produced by the marker post-processing is the only wrapper needed.
-            new_ttype: _TokenType = Text
-            if kept:
-                new_ttype = Ansi
-                for component in kept:
-                    new_ttype = getattr(new_ttype, component)
-
-            prefix = ""
-            suffix = ""
-            if fg_hex is not None:
-                prefix += f"{_RGB_FG_OPEN}{fg_hex}{_RGB_SEP}"
-                suffix = _RGB_CLOSE + suffix
-            if bg_hex is not None:
-                prefix += f"{_RGB_BG_OPEN}{bg_hex}{_RGB_SEP}"
-                suffix = _RGB_CLOSE + suffix
-
-            yield new_ttype, prefix + value + suffix
+            rewrite = cache.get(ttype)
+            if rewrite is None:
+                rewrite = cache[ttype] = self._split_rgb_components(ttype)
+            new_ttype, prefix, suffix = rewrite
+            yield new_ttype, prefix + value + suffix if prefix else value
+
+    @staticmethod
+    def _split_rgb_components(ttype: _TokenType) -> tuple[_TokenType, str, str]:
+        """Return the token type left once `FG_/BG_` components are stripped from
+        *ttype*, and the markers to wrap its text in.
+
+        Tokens without 24-bit RGB components are returned unchanged, with empty
+        markers.
+        """
+        # Only Ansi compound tokens may carry FG_/BG_ components.
+        if len(ttype) <= 1 or ttype[0] != "Ansi":
+            return ttype, "", ""
+
+        fg_hex: str | None = None
+        bg_hex: str | None = None
+        kept: list[str] = []
+        for component in ttype[1:]:
+            if component.startswith("FG_") and len(component) == 9:
+                fg_hex = component[3:]
+            elif component.startswith("BG_") and len(component) == 9:
+                bg_hex = component[3:]
+            else:
+                kept.append(component)
+
+        if fg_hex is None and bg_hex is None:
+            return ttype, "", ""
+
+        # Rebuild the token without the RGB components. An empty result collapses
+        # to `Text` so Pygments emits no surrounding span: the inline-style span
+        # produced by the marker post-processing is the only wrapper needed.
+        new_ttype: _TokenType = Text
+        if kept:
+            new_ttype = Ansi
+            for component in kept:
+                new_ttype = getattr(new_ttype, component)
+
+        prefix = ""
+        suffix = ""
+        if fg_hex is not None:
+            prefix += f"{_RGB_FG_OPEN}{fg_hex}{_RGB_SEP}"
+            suffix = _RGB_CLOSE + suffix
+        if bg_hex is not None:
+            prefix += f"{_RGB_BG_OPEN}{bg_hex}{_RGB_SEP}"
+            suffix = _RGB_CLOSE + suffix
+        return new_ttype, prefix, suffix
 
     @staticmethod
     def _inject_link_markers(
@@ -55,6 +55,7 @@ import subprocess
 import zlib
 from enum import Enum
 from functools import cache
+from hashlib import sha256
 from html import escape
 from importlib import metadata
 from math import ceil, cos, hypot, pi, sin
@@ -796,6 +797,9 @@ def grid(text: str, columns: int) -> list[list[tuple[Style, str, int]]]:
     Returning the column with each run is what lets {func}`render_svg` place a
     run without measuring anything back out of its own output.
 
+    Lines of printable ASCII, the bulk of any CLI's output, skip the
+    per-character width lookups: each of their characters is one cell.
+
     :param text: captured output, ANSI escape sequences included.
     :param columns: width of the grid, in cells.
     :return: one list of `(style, text, column)` runs per row.
@@ -809,6 +813,21 @@ def grid(text: str, columns: int) -> list[list[tuple[Style, str, int]]]:
                 column = 0
             if not line:
                 continue
+            if line.isascii() and line.isprintable():
+                # Fast path: every printable ASCII character is one cell wide,
+                # so the line is sliced at the grid's edge instead of being
+                # measured one character at a time.
+                while line:
+                    # Same wrap rule as below: `and column` keeps a grid
+                    # narrower than one cell from wrapping onto empty rows.
+                    if column >= columns and column:
+                        rows.append([])
+                        column = 0
+                    take = max(columns - column, 1)
+                    piece, line = line[:take], line[take:]
+                    rows[-1].append((run_style, piece, column))
+                    column += len(piece)
+                continue
             kept: list[str] = []
             start = column
             for char in line:
@@ -1586,6 +1605,50 @@ def render_html(
     )
 
 
+@cache
+def _renderer_digest() -> str:
+    """Fingerprint of the code turning a capture into a document.
+
+    Hashes the sources of this module, of the terminal presets and of the ANSI
+    parser in {mod}`click_extra.styling`, so a change to any of them changes
+    every {func}`render_digest`, even within a single development release. A
+    build with no readable source (a compiled binary) falls back to the package
+    version.
+    """
+    # Lazy-imported: only the digest needs to locate the sources.
+    from pathlib import Path
+
+    from . import screenshot_presets, styling
+
+    digest = sha256(metadata.version("click-extra").encode())
+    for source in (__file__, screenshot_presets.__file__, styling.__file__):
+        try:
+            digest.update(Path(source).read_bytes())
+        except (OSError, TypeError):
+            continue
+    return digest.hexdigest()
+
+
+def render_digest(text: str, **options: Any) -> str:
+    """Content address of the document {func}`render` produces.
+
+    Hashes the captured `text`, every keyword argument `render` is called with,
+    and the rendering code itself (see {func}`_renderer_digest`). Two calls
+    sharing a digest render byte-identical documents, so a caller keeping the
+    digest of what it last wrote can skip rendering the same capture again.
+
+    :param text: captured output, ANSI escape sequences included.
+    :param options: the keyword arguments passed to {func}`render`. Their values
+        are hashed through their `repr`, which enums, named tuples and scalars
+        keep stable across processes.
+    :return: a hexadecimal SHA-256 digest.
+    """
+    digest = sha256(_renderer_digest().encode())
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    digest.update(repr(sorted(options.items())).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
 def render(
     text: str,
     *,
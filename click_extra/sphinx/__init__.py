@@ -138,6 +138,15 @@ instead of aborting the build with {exc}`io.UnsupportedOperation`. Ignored on Cl
 releases older than 8.4, which lack the parameter.
 """
 
+RUN_CACHE_CONFIG = "click_extra_run_cache"
+"""Name of the `conf.py` value letting `click:run` reuse its previous output.
+
+`False` by default. Set to `True`, each block's captured output is stored under
+Sphinx's doctree directory and reused by the next build whose block, preceding
+blocks, executed modules and click-extra release are all unchanged. See
+{meth}`~click_extra.sphinx.click.ClickRunner.run_cli` for what the key covers.
+"""
+
 
 def _register_exec_directives(app: Sphinx, config: Config) -> None:
     """Register the `click:*` and `python:*` directives if opted in.
@@ -240,6 +249,8 @@ def setup(app: Sphinx) -> ExtensionMetadata:
     app.add_config_value(EXEC_DIRECTIVES_OPT_IN, False, "env", types=[bool])
     # Stream-capture mode for executed click:run/click:tree CLIs (see click.py).
     app.add_config_value(RUN_CAPTURE_CONFIG, "fd", "env", types=[str])
+    # Reuse of unchanged click:run output across builds (see click.py).
+    app.add_config_value(RUN_CACHE_CONFIG, False, "env", types=[bool])
     # Where a `click:run` `:screenshot:` capture is written (see click.py).
     app.add_config_value(SCREENSHOT_DIR_CONFIG, "assets", "env", types=[str])
     # Terminal every capture is drawn as, unless a block says otherwise.
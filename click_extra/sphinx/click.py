@@ -35,14 +35,18 @@ from __future__ import annotations
 import ast
 import contextlib
 import inspect
+import json
 import re
 import shlex
 import subprocess
 import sys
 import tempfile
 from dataclasses import is_dataclass
-from functools import cached_property, partial
+from functools import cache, cached_property, partial
+from hashlib import sha256
 from pathlib import Path
+from types import ModuleType
+from typing import cast
 
 import click
 from click.testing import CliRunner, EchoingStdin
@@ -52,6 +56,7 @@ from sphinx.directives import SphinxDirective, directives
 from sphinx.directives.code import CodeBlock
 from sphinx.util import logging
 
+from .. import __version__
 from ..blocks import OPTION_LINE_RE, fence_spans, marker_res, update_blocks
 from ..color import forced_color
 from ..execution import format_cli_prompt
@@ -63,6 +68,7 @@ from ..screenshot import (
     CaptureBackground,
     number_lines,
     render,
+    render_digest,
 )
 from ..screenshot_presets import PRESETS, TerminalPreset
 from ..theme import NOCOLOR_THEME
@@ -113,6 +119,22 @@ Relative to the documentation source root. Overridden by the
 `click_extra_screenshot_dir` `conf.py` value.
 """
 
+SCREENSHOT_STAMP_DIR = "click_extra_screenshots"
+"""Directory, under Sphinx's doctree directory, holding the render stamps.
+
+One `<screenshot>.sha256` file per `:screenshot:` capture, recording the
+{func}`~click_extra.screenshot.render_digest` of its last render next to the
+digest of the asset that render wrote.
+"""
+
+RUN_CACHE_DIR = "click_extra_runs"
+"""Directory, under Sphinx's doctree directory, holding cached `click:run` output.
+
+One `<key>.json` file per block, written when the `click_extra_run_cache`
+`conf.py` value is on. See {meth}`ClickRunner.run_cli` for what the key covers.
+"""
+
+
 SCREENSHOT_MARKER_START = "<!-- screenshot -->"
 """Opening marker of a `click:run` `:mirror:` region.
 
@@ -302,6 +324,48 @@ def program_from_command_line(command_line: str) -> str:
     return command_line
 
 
+@cache
+def _file_digest(path: str, mtime_ns: int) -> str:
+    """Hash the content of the file at `path`.
+
+    `mtime_ns` is only there to key the cache: a build reads each imported
+    module once, however many blocks reference it.
+    """
+    return sha256(Path(path).read_bytes()).hexdigest()
+
+
+def namespace_module_files(namespace: dict[str, Any]) -> dict[str, str]:
+    """Map to its source file each module `namespace` draws its objects from.
+
+    A value counts through the module it is, or the module it was defined in.
+    Objects a block defines itself resolve to no file, and are covered by the
+    block's own source instead.
+    """
+    files: dict[str, str] = {}
+    for value in namespace.values():
+        module = (
+            value
+            if inspect.ismodule(value)
+            else sys.modules.get(getattr(value, "__module__", None) or "")
+        )
+        path = getattr(module, "__file__", None)
+        if path:
+            files[cast(ModuleType, module).__name__] = path
+    return files
+
+
+def module_files_digest(files: dict[str, str]) -> str:
+    """Hash the content of the module `files`, as mapped by their module name."""
+    digest = sha256()
+    for name, path in sorted(files.items()):
+        try:
+            mtime_ns = Path(path).stat().st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{name} {_file_digest(path, mtime_ns)}\n".encode())
+    return digest.hexdigest()
+
+
 class ClickRunner(CliRunner):
     """A sub-class of {class}`click.testing.CliRunner` for Sphinx directive execution.
 
@@ -339,6 +403,12 @@ class ClickRunner(CliRunner):
         else:
             super().__init__(echo_stdin=True)
         self.namespace = {"click": click, "__file__": "dummy.py"}
+        # Chained digest of every block executed in the namespace so far, as a
+        # block's output depends on the definitions its predecessors left.
+        self.source_digest = sha256()
+        # click:run blocks served from the cache, not executed yet. They are
+        # replayed, in order, before the next block that does execute.
+        self.deferred_blocks: list[SphinxDirective] = []
 
     @contextlib.contextmanager
     def isolation(self, *args, **kwargs):
@@ -445,9 +515,41 @@ class ClickRunner(CliRunner):
     def execute_source(self, directive: SphinxDirective) -> None:
         """Execute the given code, adding it to the runner's namespace."""
         code = compile_directive(directive)
+        self.source_digest.update(directive_source(directive)[0].encode())
+        self.replay_deferred()
         with patch_subprocess():
             exec(code, self.namespace)  # noqa: S102
 
+    def run_locals(
+        self, directive: SphinxDirective, buffer: list[str]
+    ) -> dict[str, Any]:
+        """Functions available as local variables when executing a block."""
+        return {
+            "invoke": partial(
+                self.invoke,
+                _output_lines=buffer,
+                # Read off the directive rather than the runner: one runner
+                # serves every block of a document, so the flag has to travel
+                # per-invocation.
+                _show_prompt=directive.show_prompt,
+            ),
+            "isolated_filesystem": self.isolated_filesystem,
+        }
+
+    def replay_deferred(self) -> None:
+        """Execute the blocks served from the cache so far, discarding their output.
+
+        Leaves the namespace in the state those blocks put it in, which the
+        block about to execute may depend on.
+        """
+        while self.deferred_blocks:
+            directive = self.deferred_blocks.pop(0)
+            exec(
+                compile_directive(directive),
+                self.namespace,
+                self.run_locals(directive, []),
+            )
+
     def run_cli(self, directive: SphinxDirective) -> list[str]:
         """Execute the given `source_code`.
 
@@ -463,23 +565,30 @@ class ClickRunner(CliRunner):
 
         If any local variable in the provided `source_code` conflicts with these
         functions, a {class}`RuntimeError` is raised to help you pinpoint the issue.
+
+        With the `click_extra_run_cache` `conf.py` value on, the returned lines
+        are also stored under {data}`RUN_CACHE_DIR`, and a later build reuses
+        them instead of executing the block again. They are keyed on the
+        block's source, the source of every block executed before it on the
+        page, whether the prompt is shown, the capture mode and the click-extra
+        version, and only reused while the source files of the modules the
+        namespace drew its objects from once the block ran are unchanged.
+
+        A block served from the cache is executed, its output discarded, only
+        once a later block of the page has to run: what it leaves in the
+        namespace is then in place as if it had run in the first place.
+
+        ```{caution}
+        Until then a block served from the cache does not run: assertions it
+        holds are not checked. Output depending on anything outside the key,
+        like the clock, an environment variable or a data file, is replayed
+        as it was first captured.
+        ```
         """
         source_code, location = directive_source(directive)
 
         buffer: list[str] = []
-
-        # Functions available as local variables when executing the code.
-        local_vars = {
-            "invoke": partial(
-                self.invoke,
-                _output_lines=buffer,
-                # Read off the directive rather than the runner: one runner
-                # serves every block of a document, so the flag has to travel
-                # per-invocation.
-                _show_prompt=directive.show_prompt,
-            ),
-            "isolated_filesystem": self.isolated_filesystem,
-        }
+        local_vars = self.run_locals(directive, buffer)
 
         # Check for local variable conflicts.
         tree = ast.parse(source_code, location)
@@ -504,8 +613,42 @@ class ClickRunner(CliRunner):
                     f"Line: {python_line}"
                 )
 
+        cache_file = None
+        if directive.config.click_extra_run_cache:
+            key = sha256(
+                json.dumps((
+                    __version__,
+                    self.source_digest.hexdigest(),
+                    source_code,
+                    directive.show_prompt,
+                    directive.config.click_extra_run_capture,
+                )).encode()
+            ).hexdigest()
+            cache_file = Path(directive.env.doctreedir) / RUN_CACHE_DIR / f"{key}.json"
+        self.source_digest.update(source_code.encode())
+
+        if cache_file and cache_file.exists():
+            entry = json.loads(cache_file.read_text(encoding="utf-8"))
+            if module_files_digest(entry["modules"]) == entry["digest"]:
+                self.deferred_blocks.append(directive)
+                return cast("list[str]", entry["lines"])
+
         code = compile_directive(directive)
+        self.replay_deferred()
         exec(code, self.namespace, local_vars)  # noqa: S102
+
+        if cache_file:
+            # Taken after the run, to cover the modules the block imported too.
+            modules = namespace_module_files(self.namespace)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps({
+                    "modules": modules,
+                    "digest": module_files_digest(modules),
+                    "lines": buffer,
+                }),
+                encoding="utf-8",
+            )
         return buffer
 
 
@@ -915,6 +1058,11 @@ class ClickDirective(SphinxDirective):
         `unique_id` is pinned to the asset's name, so an unchanged CLI rewrites
         byte-identical bytes and leaves the working tree clean.
 
+        A capture whose text, options and renderer all match the previous
+        build's (see {func}`~click_extra.screenshot.render_digest`) is not
+        rendered again, provided the asset on disk is still the one that build
+        wrote. The stamps recording both live in Sphinx's doctree directory.
+
         ```{note}
         That refresh only happens when the document carrying the block is
         re-parsed: Sphinx's environment cache skips unchanged sources. A
@@ -947,15 +1095,32 @@ class ClickDirective(SphinxDirective):
             / self.env.config.click_extra_screenshot_dir
             / f"{self.screenshot}.svg"
         )
+        text = "\n".join(lines)
+        options = {
+            "columns": self.screenshot_columns,
+            "unique_id": self.screenshot,
+            "background": self.screenshot_background,
+            **self.screenshot_frame,
+        }
+        # The stamp pairs the content address of this capture with the digest of
+        # the file it produced. Both matching means the asset on disk is already
+        # what rendering would write, so the render is skipped altogether.
+        stamp_path = (
+            Path(self.env.doctreedir)
+            / SCREENSHOT_STAMP_DIR
+            / f"{self.screenshot}.sha256"
+        )
+        input_digest = render_digest(text, **options)
+        if path.exists() and stamp_path.exists():
+            stamp = f"{input_digest} {sha256(path.read_bytes()).hexdigest()}"
+            if stamp_path.read_text(encoding="utf-8") == stamp:
+                return
+        document = render(text, **options)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            render(
-                "\n".join(lines),
-                columns=self.screenshot_columns,
-                unique_id=self.screenshot,
-                background=self.screenshot_background,
-                **self.screenshot_frame,
-            ),
+        path.write_text(document, encoding="utf-8")
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        stamp_path.write_text(
+            f"{input_digest} {sha256(path.read_bytes()).hexdigest()}",
             encoding="utf-8",
         )
 
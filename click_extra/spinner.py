@@ -52,10 +52,14 @@ conhost) already have it on; this just covers older consoles.
 from __future__ import annotations
 
 import functools
+import heapq
+import itertools
 import os
+import shutil
 import sys
 import threading
 import time
+from collections import deque
 from gettext import gettext as _
 from typing import TypeVar, cast
 
@@ -87,13 +91,23 @@ if TYPE_CHECKING:
 
         The shared surface {func}`_active_line` exposes so a concurrent writer
         (the logging bridge, a trail) can print above whichever live line owns
-        the terminal right now, be it a {class}`Spinner` or an
-        {class}`OperationTrail`'s progress-bar indicator.
+        the terminal right now, be it a {class}`Spinner`, an
+        {class}`OperationTrail` or the trail's progress-bar indicator.
         """
 
         def _resolve_stream(self) -> IO[str]: ...
         def echo(self, message: str) -> None: ...
 
+    class _Animated(Protocol):
+        """A live line the shared {class}`_Renderer` draws frames for.
+
+        The renderer calls {meth}`_frame` from its thread whenever a frame falls
+        due; the line draws under its own lock, so a frame never interleaves
+        with a concurrent {meth}`~Spinner.echo`.
+        """
+
+        def _frame(self) -> None: ...
+
     class _AggregateIndicator(Protocol):
         """The live aggregate indicator an {class}`OperationTrail` drives.
 
@@ -195,6 +209,292 @@ def _stream_enabled(enabled: bool | None, stream: IO[str]) -> bool:
     return is_a_tty(stream)
 
 
+_CURSOR_SKIP_COST = 4
+"""Length of the shortest cursor-forward sequence (`ESC [ n C`).
+
+{func}`_line_update` rewrites an unchanged stretch shorter than this instead of
+skipping over it, since the skip would cost more than the characters it saves.
+"""
+
+
+def _line_update(
+    previous: str | None,
+    line: str,
+    paint: Callable[[str], str] = str,
+) -> str:
+    r"""Return what to write to turn the drawn `previous` line into `line`.
+
+    Only the stretches of characters that changed are written, the cursor
+    skipping forward over the unchanged ones, and the line is cleared past its
+    new end if it shrank. An unchanged line yields an empty string: a frame that
+    looks like the last one writes nothing at all, which matters on a slow link
+    (SSH, a serial console) where every byte of a redraw competes with the
+    program's real output.
+
+    Falls back to a full ``\r{line}\x1b[K`` redraw when there is no `previous`
+    line (a first frame, or one erased by an {meth}`~Spinner.echo`), when either
+    line holds a character that is not exactly one column wide (a wide glyph, a
+    control code), or when the diff would not be shorter anyway.
+
+    `paint` styles each written stretch. Every character of a live line shares a
+    single style, so painting stretches one by one renders the same as painting
+    the whole line.
+    """
+    full = f"\r{paint(line)}\x1b[K"
+    if previous is None:
+        return full
+    if previous == line:
+        return ""
+    if wcswidth(previous) != len(previous) or wcswidth(line) != len(line):
+        return full
+
+    # Collect the [start, end) stretches to rewrite, merging those separated by
+    # a gap too short to be worth a cursor skip.
+    common = min(len(previous), len(line))
+    runs: list[list[int]] = []
+    for index in range(common):
+        if previous[index] != line[index]:
+            if runs and index - runs[-1][1] < _CURSOR_SKIP_COST:
+                runs[-1][1] = index + 1
+            else:
+                runs.append([index, index + 1])
+    if len(line) > common:
+        if runs and common - runs[-1][1] < _CURSOR_SKIP_COST:
+            runs[-1][1] = len(line)
+        else:
+            runs.append([common, len(line)])
+
+    parts = ["\r"]
+    column = 0
+    for start, end in runs:
+        if start > column:
+            parts.append(f"\x1b[{start - column}C")
+        parts.append(paint(line[start:end]))
+        column = end
+    if len(line) < len(previous):
+        if len(line) > column:
+            parts.append(f"\x1b[{len(line) - column}C")
+        parts.append("\x1b[K")
+    update = "".join(parts)
+    return update if len(update) < len(full) else full
+
+
+_MAX_FRAME_RATE = 30
+"""Most frames per second the shared {class}`_Renderer` draws for one live line.
+
+However short a spinner's `interval`, and however fast an
+{class}`OperationTrail`'s workers mark outcomes, a line never redraws more often
+than this: a burst of marks between two frames coalesces into the next one.
+"""
+
+_FRAME_BUDGET = 0.1
+"""Share of wall-clock time a live line may spend writing its frames.
+
+The {class}`_Renderer` times each frame's write and flush. Where they block (a
+saturated SSH link, a slow serial console), the line's frame interval stretches
+until its writes fit this share, and shrinks back as writes speed up again.
+"""
+
+_SLOWEST_FRAME_INTERVAL = 1.0
+"""Longest interval, in seconds, the adaptive frame rate backs off to."""
+
+_FRAME_COST_SMOOTHING = 0.3
+"""Weight of the latest frame's write time in a line's moving average.
+
+Smooths the adaptive frame rate over a few frames, so a single stalled write
+does not halve the animation speed.
+"""
+
+
+class _FrameSchedule:
+    """When a live line draws its next frame, and how often it may draw at all."""
+
+    __slots__ = ("cost", "due", "interval", "last")
+
+    def __init__(self, interval: float | None, delay: float | None) -> None:
+        # Seconds between periodic frames, or None for a line drawing on request.
+        self.interval = interval
+        # Monotonic deadline of the next frame, or None when none is pending.
+        self.due = None if delay is None else time.monotonic() + delay
+        # When the last frame started, and the moving average of its write time.
+        self.last = float("-inf")
+        self.cost = 0.0
+
+    def pace(self) -> float:
+        """Shortest gap between two frames: the frame-rate cap, or longer on a slow
+        link (see {data}`_FRAME_BUDGET`)."""
+        return min(
+            max(1 / _MAX_FRAME_RATE, self.cost / _FRAME_BUDGET),
+            _SLOWEST_FRAME_INTERVAL,
+        )
+
+    def request(self, now: float) -> None:
+        """Schedule a frame as soon as the pace allows, keeping an earlier one."""
+        due = max(now, self.last + self.pace())
+        if self.due is None or due < self.due:
+            self.due = due
+
+    def drawn(self, started: float, cost: float) -> None:
+        """Account for a frame drawn at `started` in `cost` seconds."""
+        self.last = started
+        self.cost += (cost - self.cost) * _FRAME_COST_SMOOTHING
+        floor = started + self.pace()
+        # A request landing mid-frame waits out the pace like any other.
+        if self.due is not None:
+            self.due = max(self.due, floor)
+        if self.interval is not None:
+            periodic = started + max(self.interval, self.pace())
+            self.due = periodic if self.due is None else min(self.due, periodic)
+
+
+class _Renderer:
+    """The single daemon thread drawing every live terminal line.
+
+    A {class}`Spinner` or an {class}`OperationTrail` progress-bar indicator
+    runs no thread of its own: it {meth}`add`s itself here with its frame
+    interval, and this thread calls its `_frame()` whenever a frame falls due.
+    A line that changes between frames (a bar stepped by a mark) {meth}`request`s
+    a frame instead of drawing, so any number of changes between two frames
+    coalesce into one redraw, capped at {data}`_MAX_FRAME_RATE` per second and
+    slowed further when writes block (see {class}`_FrameSchedule`).
+
+    The thread starts with the first line added and exits once the last one is
+    removed, so an idle program keeps no render thread around.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget every line and the render thread, with a fresh lock.
+
+        Also run in a forked child, which inherits the parent's state but not its
+        render thread, and possibly a lock the parent held at fork time.
+        """
+        self._cond = threading.Condition()
+        self._schedules: dict[_Animated, _FrameSchedule] = {}
+        self._drawing: _Animated | None = None
+        self._thread: threading.Thread | None = None
+
+    def add(
+        self,
+        line: _Animated,
+        interval: float | None,
+        delay: float | None,
+    ) -> threading.Thread:
+        """Start drawing `line`, returning the render thread that draws it.
+
+        :param interval: seconds between periodic frames, or `None` for a line
+            that only draws when it {meth}`request`s a frame.
+        :param delay: seconds before the first frame, or `None` to wait for a
+            request.
+        """
+        with self._cond:
+            self._schedules[line] = _FrameSchedule(interval, delay)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="click-extra-renderer",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._cond.notify_all()
+            return self._thread
+
+    def remove(self, line: _Animated) -> None:
+        """Stop drawing `line`. Idempotent.
+
+        Returns only once any frame of `line` in flight has been drawn, so the
+        caller can tear the line down without a late frame landing behind it.
+        """
+        with self._cond:
+            self._schedules.pop(line, None)
+            self._cond.notify_all()
+            if threading.current_thread() is not self._thread:
+                while self._drawing is line:
+                    self._cond.wait()
+
+    def request(self, line: _Animated) -> None:
+        """Ask for a frame of `line` as soon as its pace allows."""
+        with self._cond:
+            schedule = self._schedules.get(line)
+            if schedule is not None:
+                schedule.request(time.monotonic())
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        """Draw due frames, one line at a time, until no line is left."""
+        try:
+            self._draw_frames()
+        finally:
+            # However the loop ended, let the next add() start a fresh thread.
+            with self._cond:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _draw_frames(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._schedules:
+                        self._thread = None
+                        return
+                    pending = [
+                        (schedule.due, line, schedule)
+                        for line, schedule in self._schedules.items()
+                        if schedule.due is not None
+                    ]
+                    now = time.monotonic()
+                    if pending:
+                        due, line, schedule = min(pending, key=lambda item: item[0])
+                        if due <= now:
+                            break
+                        self._cond.wait(due - now)
+                    else:
+                        self._cond.wait()
+                schedule.due = None
+                self._drawing = line
+
+            started = time.monotonic()
+            failed = True
+            try:
+                line._frame()
+                failed = False
+            except (OSError, ValueError):
+                # The stream was closed or detached mid-draw; nothing left to
+                # draw for this line.
+                pass
+            except Exception as exc:  # noqa: BLE001
+                # A broken frame (a raising `timer=` callable) retires its own
+                # line only: the thread lives on for every other one. Report it
+                # as the uncaught exception of a thread of its own would be.
+                threading.excepthook(
+                    threading.ExceptHookArgs((
+                        type(exc),
+                        exc,
+                        exc.__traceback__,
+                        threading.current_thread(),
+                    ))
+                )
+            finally:
+                cost = time.monotonic() - started
+                with self._cond:
+                    self._drawing = None
+                    self._cond.notify_all()
+                    if self._schedules.get(line) is schedule:
+                        if failed:
+                            del self._schedules[line]
+                        else:
+                            schedule.drawn(started, cost)
+
+
+_RENDERER = _Renderer()
+"""The process-wide render thread shared by every live line."""
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_RENDERER._reset)
+
+
 class Spinner:
     """A thread-animated, indeterminate progress spinner usable as a context
     manager.
@@ -202,8 +502,12 @@ class Spinner:
     The animation runs on a background daemon thread, leaving the calling thread
     free to block on the actual work. Entering the context (or calling
     {meth}`start`) begins the animation; leaving it (or calling {meth}`stop`)
-    halts the thread and erases the spinner line so it never lingers above the
-    next output.
+    halts it and erases the spinner line so it never lingers above the next
+    output.
+
+    All spinners and progress bars share that one render thread, which redraws
+    only the characters that changed since the previous frame and slows the
+    frame rate down when writing to the terminal blocks (a slow SSH link).
 
     ```{note}
     A single {class}`Spinner` instance drives one animation at a time. mpm
@@ -331,9 +635,12 @@ class Spinner:
             except (TypeError, ValueError) as error:
                 raise ValueError(f"Invalid spinner style: {error}") from error
 
-        self._stop = threading.Event()
         self._thread: threading.Thread | None = None
         self._lock = threading.Lock()
+        self._stream: IO[str] | None = None
+        self._frames: Sequence[str] = self.frames
+        self._frame_index = 0
+        self._last_line: str | None = None
         self._drawn = False
         self._cursor_hidden = False
         self._color_enabled = False
@@ -474,11 +781,13 @@ class Spinner:
                 pass
 
     def start(self) -> None:
-        """Begin animating on a background thread, unless the spinner is disabled.
+        """Begin animating on the shared render thread, unless the spinner is
+        disabled.
 
         A disabled spinner (non-TTY stream, or `enabled=False`) returns at once
-        without spawning a thread or emitting anything (but still records the
-        start time, so a later {meth}`ok` / {meth}`fail` can report a duration).
+        without touching the render thread or emitting anything (but still
+        records the start time, so a later {meth}`ok` / {meth}`fail` can report
+        a duration).
         """
         # Time the operation even when the spinner is silenced, and resolve color
         # here on the calling thread: the animation thread never sees the Click
@@ -492,18 +801,18 @@ class Spinner:
         # The spinner is about to emit ANSI control codes: make sure a Windows
         # console will interpret rather than echo them.
         self._enable_windows_ansi(stream)
-        self._stop.clear()
+        self._stream = stream
+        # Resolve the rotation direction once: `reverse` flips the frame order.
+        self._frames = tuple(reversed(self.frames)) if self.reverse else self.frames
+        self._frame_index = 0
+        self._last_line = None
         self._drawn = False
         self._cursor_hidden = False
         # Advertise the animation so concurrent writers (the logging bridge, see
         # _active_line()) print through echo() instead of over the frame.
         _register_line(self)
-        self._thread = threading.Thread(
-            target=self._animate,
-            args=(stream,),
-            daemon=True,
-        )
-        self._thread.start()
+        # A call that finishes within `delay` never draws anything.
+        self._thread = _RENDERER.add(self, self.interval, self.delay)
 
     def stop(self) -> None:
         """Halt the animation and erase the spinner line.
@@ -520,13 +829,12 @@ class Spinner:
         _deregister_line(self)
         if self._thread is None:
             return
-        self._stop.set()
-        self._thread.join()
+        _RENDERER.remove(self)
         self._thread = None
 
-        # The animation thread has joined, so the draw lock is now free: take it
-        # so a concurrent `echo()` from another thread cannot interleave with the
-        # final cleanup. Joining before acquiring avoids deadlocking against the
+        # No frame is in flight anymore, so the draw lock is now free: take it so
+        # a concurrent `echo()` from another thread cannot interleave with the
+        # final cleanup. Removing before acquiring avoids deadlocking against the
         # lock-holding frame write.
         with self._lock:
             # Undo only what was actually emitted: erase the line if a frame was
@@ -545,6 +853,7 @@ class Spinner:
                 stream.write(cleanup)
                 stream.flush()
                 self._cursor_hidden = False
+            self._last_line = None
 
     def echo(self, message: str = "") -> None:
         """Print `message` on its own line above the running spinner.
@@ -563,9 +872,11 @@ class Spinner:
         """
         stream = self._resolve_stream()
         with self._lock:
-            # Erase the in-progress frame so the message starts at column 0.
+            # Erase the in-progress frame so the message starts at column 0; the
+            # next frame then redraws the whole line, not a diff of it.
             if self._drawn:
                 stream.write("\r\x1b[K")
+                self._last_line = None
             stream.write(f"{message}\n")
             stream.flush()
 
@@ -627,46 +938,32 @@ class Spinner:
             stream.write(f"{marker}{label}{clock}\n")
             stream.flush()
 
-    def _animate(self, stream: IO[str]) -> None:
-        """Frame loop run on the background thread.
+    def _frame(self) -> None:
+        """Draw the next animation frame, called by the shared render thread.
 
-        Waits `delay` before the first frame, then writes one frame every
-        `interval` until {meth}`stop` is called. Every wait goes through the
-        stop {class}`~threading.Event`, so the spinner reacts to `stop()`
-        immediately instead of sleeping out the current interval. Stream errors
-        (a closed terminal) end the loop quietly rather than surfacing a
-        traceback from the background thread.
+        Hides the cursor ahead of the first frame, then writes only what changed
+        since the previous one (see {func}`_line_update`): with a static label,
+        that is the glyph alone, and a frame identical to the last writes
+        nothing.
         """
-        # A call that finishes within `delay` never draws anything.
-        if self._stop.wait(self.delay):
-            return
-        # Resolve the rotation direction once: `reverse` flips the frame order.
-        frames = tuple(reversed(self.frames)) if self.reverse else self.frames
-        try:
-            if self.hide_cursor:
-                stream.write("\x1b[?25l")
+        stream = self._stream
+        assert stream is not None
+        frame = self._frames[self._frame_index % len(self._frames)]
+        self._frame_index += 1
+        label = f" {self.label}" if self.label else ""
+        line = f"{frame}{label}{self._clock()}"
+        # Hold the draw lock so a concurrent `echo()` cannot interleave with a
+        # half-written frame.
+        with self._lock:
+            update = _line_update(self._last_line, line, self._style)
+            if self.hide_cursor and not self._cursor_hidden:
+                update = f"\x1b[?25l{update}"
                 self._cursor_hidden = True
+            if update:
+                stream.write(update)
                 stream.flush()
-            index = 0
-            while not self._stop.is_set():
-                frame = frames[index % len(frames)]
-                label = f" {self.label}" if self.label else ""
-                clock = self._clock()
-                content = self._style(f"{frame}{label}{clock}")
-                # Hold the draw lock so a concurrent `echo()` cannot interleave
-                # with a half-written frame. Return to the line start, then
-                # clear to end-of-line so a shrinking label leaves no stale
-                # characters behind.
-                with self._lock:
-                    stream.write(f"\r{content}\x1b[K")
-                    stream.flush()
-                    self._drawn = True
-                index += 1
-                if self._stop.wait(self.interval):
-                    break
-        except (OSError, ValueError):
-            # The stream was closed or detached mid-spin; nothing left to draw.
-            return
+            self._last_line = line
+            self._drawn = True
 
     def __enter__(self) -> Self:
         self.start()
@@ -849,7 +1146,7 @@ class _SpinnerIndicator:
 
 
 # How often the bar refreshes to keep its running elapsed clock ticking. The bar
-# has no animation thread of its own (unlike the spinner), so a daemon ticker
+# has no animation of its own (unlike the spinner), so the shared render thread
 # redraws it at this cadence in `clock="elapsed"` mode; matches the spinner's
 # default frame interval.
 _BAR_TICK_INTERVAL = 0.1
@@ -863,15 +1160,16 @@ class _BarIndicator:
     carries a real ``{label} [####----] {done}/{total}`` bar (the trail knows
     its `total`), with completed outcomes streaming above it exactly as they
     do over a spinner. It drives Click's bar directly rather than iterating it:
-    {meth}`advance` steps and redraws it, {meth}`echo` erases it to slip a
-    persistent line above, then redraws it below.
+    {meth}`advance` steps it, {meth}`echo` erases it to slip a persistent line
+    above, and both leave the redraw to the shared {class}`_Renderer`, so a
+    burst of outcomes costs one redraw per frame rather than one per outcome.
 
     ```{note}
-    Click's {meth}`~click._termui_impl.ProgressBar.render_progress` skips a
-    redraw whose line is unchanged, so {meth}`_draw` clears the bar's
-    `_last_line` cache to force the post-`echo` redraw. Cursor hiding is left
-    to Click (its `BEFORE_BAR` / `AFTER_BAR`); this only restores the cursor
-    when it tears the bar down early.
+    Click's {meth}`~click._termui_impl.ProgressBar.render_progress` always
+    rewrites the whole line, so {meth}`_draw` only borrows the bar's
+    {meth}`~click._termui_impl.ProgressBar.format_progress_line` and writes the
+    characters that changed itself, hiding the cursor on the first draw and
+    restoring it when the bar is torn down.
     ```
     """
 
@@ -901,8 +1199,12 @@ class _BarIndicator:
         self._finished = False
         self._start = 0.0
         self._bar: ProgressBar[int] | None = None
-        self._stop_tick = threading.Event()
-        self._ticker: threading.Thread | None = None
+        self._last_line: str | None = None
+        self._dirty = False
+        self._subscribed = False
+        # An elapsed clock must keep ticking between outcomes: the render thread
+        # then redraws the bar periodically, not just on request.
+        self._tick_interval = _BAR_TICK_INTERVAL if self._elapsed_clock() else None
 
     def _resolve_stream(self) -> IO[str]:
         return self._stream if self._stream is not None else sys.stderr
@@ -941,11 +1243,8 @@ class _BarIndicator:
             if self._delay <= 0:
                 with self._lock:
                     self._draw()
-            # An elapsed clock must keep ticking between outcomes; the bar has no
-            # animation thread, so drive periodic redraws from a daemon ticker.
-            if self._elapsed_clock():
-                self._ticker = threading.Thread(target=self._tick, daemon=True)
-                self._ticker.start()
+            _RENDERER.add(self, self._tick_interval, self._tick_interval)
+            self._subscribed = True
         return self
 
     def __exit__(
@@ -961,10 +1260,18 @@ class _BarIndicator:
         return self._drawn
 
     def _draw(self) -> None:
-        """Force a bar redraw, defeating Click's unchanged-line dedup."""
+        """Redraw the bar, writing only what changed since the last draw."""
         assert self._bar is not None
-        self._bar._last_line = None
-        self._bar.render_progress()
+        line = self._bar.format_progress_line()
+        update = _line_update(self._last_line, line)
+        if not self._drawn:
+            update = f"\x1b[?25l{update}"
+        if update:
+            stream = self._resolve_stream()
+            stream.write(update)
+            stream.flush()
+        self._last_line = line
+        self._dirty = False
         self._drawn = True
 
     def _elapsed_clock(self) -> bool:
@@ -983,27 +1290,28 @@ class _BarIndicator:
             return f"{clock}  {self._unit}" if self._unit else clock
         return self._unit or None
 
-    def _tick(self) -> None:
-        """Redraw periodically so the running elapsed clock keeps ticking.
+    def _frame(self) -> None:
+        """Redraw a pending change, or tick the running elapsed clock.
 
-        The bar, unlike the spinner, has no animation thread; without this the
-        elapsed clock would freeze between outcomes. Runs only in elapsed mode:
-        an ETA needs no ticking, since Click recomputes it on each step.
+        Called by the shared render thread, on request after an {meth}`advance`
+        or {meth}`echo`, and periodically in elapsed mode so the clock does not
+        freeze between outcomes. An ETA needs no ticking, since Click recomputes
+        it on each step.
         """
-        while not self._stop_tick.wait(_BAR_TICK_INTERVAL):
-            with self._lock:
-                if self._drawn and not self._finished:
-                    self._draw()
+        with self._lock:
+            if self._finished:
+                return
+            if self._dirty or (self._drawn and self._tick_interval is not None):
+                self._draw()
 
-    def _stop_ticker(self) -> None:
-        """Stop and join the elapsed-clock ticker. Idempotent."""
-        if self._ticker is not None:
-            self._stop_tick.set()
-            self._ticker.join()
-            self._ticker = None
+    def _unsubscribe(self) -> None:
+        """Stop the render thread drawing the bar. Idempotent."""
+        if self._subscribed:
+            _RENDERER.remove(self)
+            self._subscribed = False
 
     def advance(self, done: int) -> None:
-        """Step the bar to `done` and redraw it, once past the initial delay."""
+        """Step the bar to `done`, redrawn on the next frame once past the delay."""
         if not self._on:
             return
         assert self._bar is not None
@@ -1014,23 +1322,31 @@ class _BarIndicator:
                 self._bar.pos = done
                 return
             self._bar.make_step(done - self._bar.pos)
-            self._draw()
+            self._dirty = True
+        _RENDERER.request(self)
 
     def echo(self, message: str) -> None:
-        """Print `message` as a persistent line above the bar, then redraw it."""
+        """Print `message` as a persistent line above the bar.
+
+        The bar is redrawn below it on the next frame, so outcomes echoed in a
+        burst share a single redraw.
+        """
         stream = self._resolve_stream()
         with self._lock:
             if self._drawn:
                 stream.write("\r\x1b[K")  # Erase the bar line.
+                self._last_line = None
+                self._dirty = True
             stream.write(f"{message}\n")  # Persistent line above.
-            if self._drawn:
-                self._draw()  # Redraw the bar below.
             stream.flush()
+            redraw = self._dirty
+        if redraw:
+            _RENDERER.request(self)
 
     def finish(self, ok: bool, summary: str) -> None:
         """Replace the bar with a kept `✓`/`✘` ``summary`` line, elapsed included."""
         _deregister_line(self)
-        self._stop_ticker()
+        self._unsubscribe()
         with self._lock:
             self._finished = True
             if not self._drawn:
@@ -1054,7 +1370,7 @@ class _BarIndicator:
         `with` block, where {meth}`finish` never ran).
         """
         _deregister_line(self)
-        self._stop_ticker()
+        self._unsubscribe()
         with self._lock:
             if self._finished or not self._drawn:
                 self._finished = True
@@ -1066,6 +1382,32 @@ class _BarIndicator:
             self._finished = True
 
 
+_TRAIL_DRAIN_INTERVAL = 1 / _MAX_FRAME_RATE
+"""Seconds between two render ticks collecting an {class}`OperationTrail`'s marks.
+
+Outcomes marked by workers wait at most this long before their trail line is
+echoed and the aggregate indicator's tally moves.
+"""
+
+
+class _TrailLane:
+    """One thread's share of an {class}`OperationTrail`'s outcomes.
+
+    Only the owning thread writes to it, so {meth}`OperationTrail.mark` records
+    an outcome without taking any lock: it bumps {attr}`ok` and appends to the
+    {attr}`pending` deque, whose appends and pops are thread-safe. The trail's
+    render tick collects and formats the pending outcomes of every lane.
+    """
+
+    __slots__ = ("ok", "pending")
+
+    def __init__(self) -> None:
+        # How many of this thread's outcomes succeeded.
+        self.ok = 0
+        # Outcomes not yet collected, each keyed by its mark's sequence number.
+        self.pending: deque[tuple[int, bool, str]] = deque()
+
+
 class OperationTrail:
     """A `✓`/`✘` progress trail and finisher for a batch of operations.
 
@@ -1096,9 +1438,14 @@ class OperationTrail:
     `✓` tally is kept as outcomes land ({attr}`ok_count`), so a caller computes
     no counts of its own.
 
-    Thread-safe: {meth}`mark` may be called from worker threads. Use it as a
-    context manager whenever it may run concurrently, to bound the aggregate
-    spinner's life; a purely sequential caller may construct it bare.
+    Thread-safe: {meth}`mark` may be called from worker threads, and never
+    blocks them on a lock. Each thread records its outcomes in its own lane,
+    which the shared render thread collects on its next tick, echoing the
+    lines in the order they were marked and advancing the tally once for the
+    whole lot. A record logged meanwhile drains the lanes first, so it never
+    prints above a line marked before it. Use it as a context manager whenever
+    it may run concurrently, to bound the aggregate indicator's life; a purely
+    sequential caller may construct it bare.
 
     ```{code-block} python
 
@@ -1203,10 +1550,17 @@ class OperationTrail:
         self.stream = stream
         self._delay = delay
         self._lock = threading.Lock()
-        self._done = 0
-        self._ok = 0
         self._start = time.monotonic()
         self._indicator: _AggregateIndicator | None = None
+        self._live = False
+        # Per-thread lanes, and the global order marks are taken in: next() on
+        # an itertools.count is atomic, so workers number their lines lock-free.
+        self._local = threading.local()
+        self._lanes: list[_TrailLane] = []
+        self._sequence = itertools.count()
+        # Collected lines still out of order, and how many went out in order.
+        self._reorder: list[tuple[int, bool, str]] = []
+        self._done = 0
         self._buffer: list[str] = []
         # An aggregate indicator (a progress bar, or a spinner for a concurrent
         # batch) owns the live line; the plain sequential echo runs only when
@@ -1245,6 +1599,15 @@ class OperationTrail:
             )
         if self._indicator is not None:
             self._indicator.__enter__()
+            # Collect marks on the render tick, unless nothing will ever draw
+            # them: a disabled indicator only needs the tally.
+            stream = self.stream if self.stream is not None else sys.stderr
+            self._live = _stream_enabled(self.enabled, stream)
+            if self._live:
+                _RENDERER.add(self, _TRAIL_DRAIN_INTERVAL, _TRAIL_DRAIN_INTERVAL)
+                # Own the live line above the indicator, so a log record drains
+                # the lines marked before it instead of overtaking them.
+                _register_line(self)
         return self
 
     def __exit__(
@@ -1253,6 +1616,10 @@ class OperationTrail:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        if self._live:
+            _deregister_line(self)
+            _RENDERER.remove(self)
+            self._live = False
         if self._indicator is not None:
             self._indicator.__exit__(exc_type, exc_val, exc_tb)
             self._indicator = None
@@ -1260,7 +1627,30 @@ class OperationTrail:
     @property
     def ok_count(self) -> int:
         """How many marked outcomes have succeeded so far."""
-        return self._ok
+        return sum(lane.ok for lane in self._lanes)
+
+    def _lane(self) -> _TrailLane:
+        """Return the calling thread's lane, registering it on first use."""
+        lane: _TrailLane | None = getattr(self._local, "lane", None)
+        if lane is None:
+            lane = self._local.lane = _TrailLane()
+            with self._lock:
+                self._lanes.append(lane)
+        return lane
+
+    def _resolve_stream(self) -> IO[str]:
+        return self.stream if self.stream is not None else sys.stderr
+
+    def echo(self, message: str) -> None:
+        """Print `message` above the live indicator, below the lines marked so far.
+
+        The trail owns the live line while its indicator runs, so
+        {class}`click_extra.logging.StreamHandler` routes records here: the
+        pending lanes are collected first, and a record logged right after a
+        {meth}`mark` lands under that mark's line, not above it.
+        """
+        with self._lock:
+            self._collect(message)
 
     def _echo_line(self, message: str) -> None:
         """Print one rendered line to the trail's stream."""
@@ -1272,6 +1662,10 @@ class OperationTrail:
     def mark(self, ok: bool, message: str, seconds: float | None = None) -> None:
         """Record one `✓`/`✘` outcome: tally it and render its trail line.
 
+        Under an aggregate indicator, the line is echoed by the next render tick
+        rather than right away, so a worker never waits on the terminal. Output
+        routed through {meth}`echo` (log records) still lands below it.
+
         :param seconds: the operation's own elapsed time. When `timer` is on it
             is formatted and appended to `message` as ` (2.3s)`. An
             {meth}`operation` handle fills this in from when it was created;
@@ -1279,25 +1673,65 @@ class OperationTrail:
         """
         if self.timer and seconds is not None:
             message = f"{message} ({_format_timer(self.timer, seconds)})"
-        with self._lock:
-            self._done += 1
-            if ok:
-                self._ok += 1
-            if self._indicator is not None:
-                self._buffer.append(trail_line(ok, message))
-                self._indicator.advance(self._done)
-                self._flush()
-            elif self._echo:
+        lane = self._lane()
+        if ok:
+            lane.ok += 1
+        if self._live:
+            lane.pending.append((next(self._sequence), ok, message))
+        elif self._indicator is None and self._echo:
+            with self._lock:
                 self._echo_line(trail_line(ok, message))
 
+    def _frame(self) -> None:
+        """Collect every lane's pending lines, called by the shared render thread.
+
+        Lines go out in the order their marks were taken, even across threads:
+        a line whose predecessor is still being appended by a preempted worker
+        waits for it, at most a tick. The whole lot then advances the tally once.
+        """
+        with self._lock:
+            self._collect()
+
+    def _collect(self, message: str | None = None) -> None:
+        # Caller holds the lock. Drain the lanes into the buffer, then append
+        # `message` after them, so it goes out below every line marked before.
+        for lane in self._lanes:
+            pending = lane.pending
+            while pending:
+                heapq.heappush(self._reorder, pending.popleft())
+        done = self._done
+        if self._reorder and self._reorder[0][0] == done:
+            # Paint both glyphs once per tick, not once per line.
+            glyphs = {True: trail_glyph(True), False: trail_glyph(False)}
+            while self._reorder and self._reorder[0][0] == self._done:
+                _, ok, line = heapq.heappop(self._reorder)
+                self._buffer.append(f"{glyphs[ok]} {line}")
+                self._done += 1
+        if self._indicator is None:
+            if message is not None:
+                self._echo_line(message)
+            return
+        if self._done != done:
+            self._indicator.advance(self._done)
+        if message is not None:
+            if not self._indicator.shown:
+                # Nothing buffered can precede it on screen yet: print it now,
+                # as the indicator would, rather than hold it for a first draw
+                # that may never come.
+                self._indicator.echo(message)
+                return
+            self._buffer.append(message)
+        self._flush()
+
     def _flush(self) -> None:
         # Caller holds the lock. Drain buffered lines once the indicator is
         # drawing; before that, writing would leak into a stream the delayed
         # (or disabled) indicator may never touch.
-        if self._indicator is None or not self._indicator.shown:
+        if self._indicator is None or not self._indicator.shown or not self._buffer:
             return
-        for text in self._buffer:
-            self._indicator.echo(text)
+        # One echo for the whole batch: a single write, and a single redraw of
+        # the indicator below it.
+        self._indicator.echo("\n".join(self._buffer))
         self._buffer.clear()
 
     def finish(self, ok: bool, summary: str) -> None:
@@ -1310,8 +1744,12 @@ class OperationTrail:
         (the default).
         """
         if self._indicator is not None:
-            with self._lock:
-                self._flush()
+            # Stop the render tick, then collect the last marks ourselves.
+            if self._live:
+                _deregister_line(self)
+                _RENDERER.remove(self)
+                self._live = False
+                self._frame()
             self._indicator.finish(ok, summary)
         elif self._echo:
             if self.timer:
@@ -1356,6 +1794,369 @@ class _Operation:
         self._trail.mark(ok, message, seconds=time.monotonic() - self._start)
 
 
+_LANE_BAR_WIDTH = 20
+"""Width, in cells, of each lane's bar in a {class}`LaneProgress` display."""
+
+
+class _LaneTally:
+    """One lane's progress, issued by {meth}`LaneProgress.lane`.
+
+    Only the worker running the lane writes to it ({meth}`begin`, then one
+    {meth}`step` per finished item), so it is fed without any lock; the render
+    thread only reads it.
+    """
+
+    __slots__ = ("done", "end", "label", "start", "total")
+
+    def __init__(self, label: str, total: int) -> None:
+        self.label = label
+        self.total = total
+        self.done = 0
+        # Monotonic times the lane started and finished running, once it has.
+        self.start: float | None = None
+        self.end: float | None = None
+
+    def begin(self) -> None:
+        """Mark the lane as running, starting its throughput clock."""
+        self.start = time.monotonic()
+        if not self.total:
+            self.end = self.start
+
+    def step(self) -> None:
+        """Count one more of the lane's items as done."""
+        self.done += 1
+        if self.done >= self.total:
+            self.end = time.monotonic()
+
+    @property
+    def running(self) -> bool:
+        """Whether the lane has started but not finished."""
+        return self.start is not None and self.end is None
+
+    def rate(self, now: float) -> float:
+        """Items per second since the lane started, `0.0` until one is done."""
+        if self.start is None or not self.done:
+            return 0.0
+        elapsed = (self.end if self.end is not None else now) - self.start
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta(self, now: float) -> float | None:
+        """Seconds left at the lane's current rate, or `None` until one is done."""
+        rate = self.rate(now)
+        return (self.total - self.done) / rate if rate else None
+
+
+class LaneProgress:
+    """A live multi-line display of per-lane progress for
+    {func}`~click_extra.execution.run_lanes`.
+
+    Where {class}`OperationTrail` tallies a batch as a whole, `LaneProgress`
+    gives each lane its own line: a bar, the `done/total` count, the lane's
+    throughput in items per second and its ETA. The running lane expected to
+    finish last is flagged `(slowest)`, so the bottleneck lane stands out.
+    Finished lanes keep a `✓` line with their duration and rate, and the whole
+    block stays on screen as a report once the display closes.
+
+    ```{code-block} python
+
+    from click_extra.execution import run_lanes
+    from click_extra.spinner import LaneProgress
+
+    with LaneProgress(label=lambda lane: lane[0].manager, unit="packages") as progress:
+        for result in run_lanes(upgrade, lanes, progress=progress):
+            ...
+    ```
+
+    {func}`~click_extra.execution.run_lanes` feeds it: each lane is announced
+    through {meth}`lane` as it is materialized (listed as waiting until a worker
+    picks it up), and the worker running it counts every finished item on the
+    lane's own tally. Workers never take a lock or touch the terminal; the
+    shared render thread redraws the block, writing only what changed.
+
+    On a stream that cannot move the cursor (a pipe, a CI log, `TERM=dumb`)
+    the display degrades to one summary line every `summary_interval` seconds,
+    listing each running lane's progress, plus a last one on close if any was
+    written. `enabled=False` silences it altogether, `enabled=True` forces the
+    live display.
+
+    ```{note}
+    A block taller than the terminal cannot be redrawn in place, so past that
+    height only the running lanes are listed, under a one-line count of the
+    finished and waiting ones.
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        label: Callable[[Sequence[Any]], str] | None = None,
+        unit: str = "items",
+        summary_interval: float = 10.0,
+        enabled: bool | None = None,
+        stream: IO[str] | None = None,
+    ) -> None:
+        """Configure (but do not start) the display.
+
+        :param label: names a lane from its items (`lambda lane:
+            lane[0].manager`). Defaults to `lane 1`, `lane 2`, ... in
+            announcement order.
+        :param unit: the noun counted on each lane's line (`"packages"`).
+        :param summary_interval: seconds between two summary lines, when the
+            stream cannot host the live display.
+        :param enabled: force the live display on (`True`) or silence the
+            display altogether (`False`). `None` (the default) draws live on an
+            interactive terminal and writes summary lines anywhere else.
+        :param stream: where to render; defaults to {data}`sys.stderr` so the
+            display never mixes into `stdout` data.
+        """
+        self.label = label
+        self.unit = unit
+        self.summary_interval = summary_interval
+        self.enabled = enabled
+        self.stream = stream
+        self._tallies: list[_LaneTally] = []
+        self._lock = threading.Lock()
+        self._mode: Literal["live", "summary"] | None = None
+        # The block's lines as drawn on screen, and the row the cursor sits on.
+        self._lines: list[str] = []
+        self._row = 0
+        self._cursor_hidden = False
+        self._frame_index = 0
+        self._summaries = 0
+
+    def _resolve_stream(self) -> IO[str]:
+        return self.stream if self.stream is not None else sys.stderr
+
+    def lane(self, items: Sequence[Any]) -> _LaneTally:
+        """Announce a lane of `items`, returning the tally its worker feeds."""
+        label = (
+            self.label(items)
+            if self.label is not None
+            else f"lane {len(self._tallies) + 1}"
+        )
+        tally = _LaneTally(label, len(items))
+        self._tallies.append(tally)
+        return tally
+
+    def __enter__(self) -> Self:
+        stream = self._resolve_stream()
+        if self.enabled is False:
+            return self
+        if _stream_enabled(self.enabled, stream):
+            self._mode = "live"
+            Spinner._enable_windows_ansi(stream)
+            # Log records then print above the block instead of through it.
+            _register_line(self)
+            _RENDERER.add(self, _BAR_TICK_INTERVAL, 0.0)
+        else:
+            self._mode = "summary"
+            _RENDERER.add(self, self.summary_interval, self.summary_interval)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._mode is None:
+            return
+        _RENDERER.remove(self)
+        _deregister_line(self)
+        stream = self._resolve_stream()
+        with self._lock:
+            if self._mode == "live":
+                # Draw the final state, then park the cursor below the block,
+                # which stays on screen as the run's report.
+                self._draw(stream)
+                tail = ""
+                if self._lines:
+                    last = len(self._lines) - 1
+                    if last > self._row:
+                        tail += f"\x1b[{last - self._row}B"
+                    tail += "\n"
+                if self._cursor_hidden:
+                    tail += "\x1b[?25h"
+                    self._cursor_hidden = False
+                if tail:
+                    stream.write(tail)
+                    stream.flush()
+                self._lines = []
+                self._row = 0
+            elif self._summaries:
+                self._summarize(stream)
+            self._mode = None
+
+    def echo(self, message: str) -> None:
+        """Print `message` as a persistent line above the live block.
+
+        The block is erased, `message` written in its place, and the block
+        redrawn below it on the next frame. Off the live display, a plain write.
+        """
+        stream = self._resolve_stream()
+        with self._lock:
+            live = self._mode == "live"
+            if live and self._lines:
+                erase = "\r"
+                if self._row:
+                    erase += f"\x1b[{self._row}A"
+                stream.write(f"{erase}\x1b[J")
+                self._lines = []
+                self._row = 0
+            stream.write(f"{message}\n")
+            stream.flush()
+        if live:
+            _RENDERER.request(self)
+
+    def _frame(self) -> None:
+        """Redraw the live block, or write a summary line, from the render thread."""
+        stream = self._resolve_stream()
+        with self._lock:
+            if self._mode == "live":
+                self._draw(stream)
+            elif self._mode == "summary":
+                self._summarize(stream)
+
+    def _census(self, tallies: list[_LaneTally]) -> str:
+        """Count the lanes by state: `5 lanes: 2 done, 2 running, 1 waiting`."""
+        done = sum(1 for tally in tallies if tally.end is not None)
+        waiting = sum(1 for tally in tallies if tally.start is None)
+        running = len(tallies) - done - waiting
+        lanes = "lane" if len(tallies) == 1 else "lanes"
+        return (
+            f"{len(tallies)} {lanes}: {done} done, {running} running, {waiting} waiting"
+        )
+
+    def _slowest(self, tallies: list[_LaneTally], now: float) -> _LaneTally | None:
+        """The running lane expected to finish last, when two or more run."""
+        estimates = [
+            (eta, index)
+            for index, tally in enumerate(tallies)
+            if tally.running and (eta := tally.eta(now)) is not None
+        ]
+        if len(estimates) < 2:
+            return None
+        return tallies[max(estimates)[1]]
+
+    def _lane_line(
+        self,
+        tally: _LaneTally,
+        width: int,
+        now: float,
+        slowest: bool,
+    ) -> str:
+        """Render one lane's line of the live block."""
+        label = tally.label.ljust(width)
+        unit = f" {self.unit}" if self.unit else ""
+        if tally.start is None:
+            return f"  {label}  {tally.total}{unit} waiting"
+        rate = f"{tally.rate(now):.1f}/s"
+        if tally.end is not None:
+            # Lazy import to avoid a circular dependency with theme, as
+            # trail_glyph does. The glyph stays unpainted: every character of
+            # the block keeps one column and one style, so it can be diffed.
+            from .theme import OK_GLYPH
+
+            elapsed = format_duration(tally.end - tally.start)
+            count = f"{tally.done}/{tally.total}{unit}"
+            return f"{OK_GLYPH} {label}  {count} in {elapsed}  {rate}"
+        filled = _LANE_BAR_WIDTH * tally.done // tally.total
+        bar = "#" * filled + "-" * (_LANE_BAR_WIDTH - filled)
+        glyph = SPINNER_FRAMES[self._frame_index % len(SPINNER_FRAMES)]
+        count = f"{tally.done}/{tally.total}{unit}"
+        line = f"{glyph} {label}  [{bar}]  {count}  {rate}"
+        eta = tally.eta(now)
+        if eta is not None:
+            line += f"  ETA {format_duration(eta)}"
+        if slowest:
+            line += "  (slowest)"
+        return line
+
+    def _block(self, now: float, height: int) -> list[str]:
+        """Render the live block's lines, folded to fit `height` rows."""
+        tallies = list(self._tallies)
+        if not tallies:
+            return []
+        slowest = self._slowest(tallies, now)
+        if len(tallies) > height:
+            shown = [tally for tally in tallies if tally.running][: max(height - 1, 0)]
+            header = [self._census(tallies)]
+        else:
+            shown = tallies
+            header = []
+        width = max((len(tally.label) for tally in shown), default=0)
+        return header + [
+            self._lane_line(tally, width, now, tally is slowest) for tally in shown
+        ]
+
+    def _draw(self, stream: IO[str]) -> None:
+        """Redraw the live block, rewriting only the characters that changed.
+
+        Each line is diffed against what is on screen with {func}`_line_update`,
+        and the cursor hops between rows only to reach a line that changed. The
+        block never shrinks: rows it no longer needs are blanked, so the lines
+        below the cursor always belong to it. Caller holds the lock.
+        """
+        size = shutil.get_terminal_size()
+        lines = [
+            line[: size.columns - 1]
+            for line in self._block(time.monotonic(), size.lines - 1)
+        ]
+        self._frame_index += 1
+        lines.extend("" for _ in range(len(self._lines) - len(lines)))
+
+        parts = []
+        row = self._row
+        for index, line in enumerate(lines):
+            previous = self._lines[index] if index < len(self._lines) else None
+            update = _line_update(previous, line)
+            if not update:
+                continue
+            if index < row:
+                parts.append(f"\x1b[{row - index}A")
+            elif index > row:
+                # Step down over the block's existing rows, then open new ones.
+                existing = max(min(index, len(self._lines) - 1), row)
+                if existing > row:
+                    parts.append(f"\x1b[{existing - row}B")
+                parts.append("\n" * (index - existing))
+            parts.append(update)
+            row = index
+        self._lines = lines
+        self._row = row
+
+        if parts and not self._cursor_hidden:
+            parts.insert(0, "\x1b[?25l")
+            self._cursor_hidden = True
+        if parts:
+            stream.write("".join(parts))
+            stream.flush()
+
+    def _summarize(self, stream: IO[str]) -> None:
+        """Write one summary line of every running lane's progress.
+
+        The off-terminal rendering: `3 lanes: 1 done, 2 running, 0 waiting; apt
+        3/10 packages (0.5/s, ETA 14.0s); npm 1/4 packages (0.3/s, ETA 10.0s)`.
+        Caller holds the lock.
+        """
+        now = time.monotonic()
+        tallies = list(self._tallies)
+        unit = f" {self.unit}" if self.unit else ""
+        parts = [self._census(tallies)]
+        for tally in tallies:
+            if not tally.running:
+                continue
+            progress = f"{tally.label} {tally.done}/{tally.total}{unit}"
+            details = f"{tally.rate(now):.1f}/s"
+            eta = tally.eta(now)
+            if eta is not None:
+                details += f", ETA {format_duration(eta)}"
+            parts.append(f"{progress} ({details})")
+        stream.write("; ".join(parts) + "\n")
+        stream.flush()
+        self._summaries += 1
+
+
 class ProgressOption(ExtraOption):
     """A pre-configured `--progress`/`--no-progress` flag gating spinner display.
 
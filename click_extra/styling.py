@@ -51,15 +51,16 @@ from __future__ import annotations
 import os
 import re
 import textwrap
-from dataclasses import dataclass, fields, replace
+from dataclasses import dataclass, fields
 from functools import lru_cache
 
+import click
 import cloup
 from boltons.strutils import strip_ansi
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from typing import Any
 
 
@@ -454,9 +455,8 @@ class Style(cloup.Style):
         """Convert `#rrggbb` shorthand strings on `fg`/`bg` to RGB tuples.
 
         Frozen dataclass: must use {func}`object.__setattr__` to bypass the
-        frozen guard. Runs once at construction; cloup's lazy
-        `_style_kwargs` cache (built on first `__call__`) picks up the
-        converted values.
+        frozen guard. Runs once at construction, before the escape sequences
+        are compiled on first `__call__` (see {meth}`_sgr_codes`).
         """
         if isinstance(self.fg, str) and self.fg.startswith("#"):
             object.__setattr__(self, "fg", _hex_to_rgb(self.fg))
@@ -466,23 +466,55 @@ class Style(cloup.Style):
     def __call__(self, text: str) -> str:
         """Apply the style, quantizing 24-bit colors when truecolor is unavailable.
 
-        On a truecolor terminal (see {func}`supports_truecolor`) this is cloup's
-        unchanged behavior: RGB `fg` / `bg` emit `38;2;r;g;b` sequences. When
+        On a truecolor terminal (see {func}`supports_truecolor`) this renders
+        like cloup: RGB `fg` / `bg` emit `38;2;r;g;b` sequences. When
         the terminal does not advertise truecolor, RGB colors are downsampled to the
         nearest `38;5;n` 256-color index so a branded theme degrades instead of
         relying on the terminal to convert. Named and palette-index colors are
         unaffected either way.
+
+        The escape sequences framing the text are compiled once per color depth
+        (see {meth}`_sgr_codes`), so styling a string boils down to wrapping it.
+        """
+        opening, closing = self._sgr_codes(supports_truecolor())
+        if self.text_transform:
+            text = self.text_transform(text)
+        return f"{opening}{text}{closing}"
+
+    def _sgr_codes(self, truecolor: bool) -> tuple[str, str]:
+        """Opening and closing escape sequences of this style at a color depth.
+
+        Rendered by {func}`click.style` on first use, then memoized on the
+        instance, one entry per depth: a style is frozen, so its sequences never
+        change. The memo sits outside the dataclass fields, which keeps it out
+        of equality, hashing, {func}`dataclasses.replace` and serialization.
         """
-        if supports_truecolor():
-            return super().__call__(text)
-        fg = _quantize_color(self.fg)
-        bg = _quantize_color(self.bg)
-        if fg is self.fg and bg is self.bg:
-            return super().__call__(text)
-        # Quantize on a transient copy. `replace` resets cloup's lazy
-        # `_style_kwargs` cache (the field is `init=False`), so the singleton
-        # theme styles keep their truecolor cache intact for the next call.
-        return replace(self, fg=fg, bg=bg)(text)
+        compiled: dict[bool, tuple[str, str]] | None = self.__dict__.get("_sgr_cache")
+        if compiled is None:
+            compiled = {}
+            # The dataclass is frozen: its own __setattr__ refuses the memo.
+            object.__setattr__(self, "_sgr_cache", compiled)  # noqa: PLC2801
+        codes = compiled.get(truecolor)
+        if codes is None:
+            fg, bg = self.fg, self.bg
+            if not truecolor:
+                fg, bg = _quantize_color(fg), _quantize_color(bg)
+            opening = click.style(
+                "",
+                fg=fg,
+                bg=bg,
+                bold=self.bold,
+                dim=self.dim,
+                underline=self.underline,
+                overline=self.overline,
+                italic=self.italic,
+                blink=self.blink,
+                reverse=self.reverse,
+                strikethrough=self.strikethrough,
+                reset=False,
+            )
+            codes = compiled[truecolor] = (opening, click.style(""))
+        return codes
 
     def __repr__(self) -> str:
         """Compact repr that lists only the attributes actually set."""
@@ -815,6 +847,117 @@ def _strip_unsupported_ansi(text: str) -> str:
     return strip_ansi(_OSC_HYPERLINK_RE.sub("", text))
 
 
+_MAX_ESCAPE_LENGTH = 4096
+"""Longest escape sequence {func}`split_ansi_stream` holds back at a chunk boundary.
+
+An unterminated sequence at the end of a chunk is carried over to the next
+one, in case its terminator is still to come. An OSC 8 hyperlink carries a
+whole URI, but a sequence longer than this is treated as the garbage it most
+likely is, so a stray escape cannot make the parser buffer the rest of the
+stream.
+"""
+
+_CSI_PREFIX_RE: re.Pattern[str] = re.compile(r"\x1b\[[0-?]*[ -/]*")
+"""Parameter and intermediate bytes of a CSI sequence, missing its final byte."""
+
+_OSC_HYPERLINK_PREFIX_RE: re.Pattern[str] = re.compile(r"\x1b\]8;[^\x1b\x07]*")
+"""An OSC 8 hyperlink marker missing its terminator."""
+
+
+def _escape_boundary(text: str) -> int:
+    """Offset of the escape sequence left unterminated at the end of *text*.
+
+    Returns `len(text)` when *text* ends outside any escape, so it can be
+    processed whole. Only the sequences {func}`split_ansi` interprets or strips
+    are considered: CSI sequences (SGR included), OSC 8 hyperlink markers and
+    two-byte escapes.
+    """
+    end = len(text)
+    start = text.rfind("\x1b")
+    if start < 0 or end - start > _MAX_ESCAPE_LENGTH:
+        return end
+    if start == end - 1:
+        # A lone trailing ESC may open a sequence, or terminate an OSC 8 marker
+        # with the `ESC \` string terminator.
+        previous = text.rfind("\x1b", 0, start)
+        if previous >= 0 and end - previous <= _MAX_ESCAPE_LENGTH:
+            marker = _OSC_HYPERLINK_PREFIX_RE.match(text, previous)
+            if marker is not None and marker.end() == start:
+                return previous
+        return start
+    introducer = text[start + 1]
+    if introducer == "[":
+        match = _CSI_PREFIX_RE.match(text, start)
+        if match is not None and match.end() == end:
+            return start
+    elif introducer == "]":
+        if "\x1b]8;".startswith(text[start:]):
+            return start
+        match = _OSC_HYPERLINK_PREFIX_RE.match(text, start)
+        if match is not None and match.end() == end:
+            return start
+    return end
+
+
+_MAX_CACHED_STYLES = 256
+"""Number of distinct styles a {class}`_AnsiSplitter` keeps built."""
+
+
+class _AnsiSplitter:
+    """SGR stream parser state, carried across the chunks fed to it."""
+
+    def __init__(self) -> None:
+        self.state: dict[str, Any] = {}
+        self.current = Style()
+        # Snapshot of the state `current` was built from. The SGR appliers keep
+        # the state dict canonical (attributes are popped on reset, never set
+        # falsy, and values arrive in one spelling each), so two runs share a
+        # style exactly when their state dicts are equal: comparing dicts is
+        # what lets the hot loop skip a Style construction, and its
+        # field-walking equality, for every escape that lands back on the same
+        # state (a reset closing an unstyled run, a style re-opened
+        # identically).
+        self.current_state: dict[str, Any] = {}
+        # Styles already built, by state. A stream usually cycles through a
+        # handful of states, so each one is turned into a Style only once.
+        self.styles: dict[frozenset[tuple[str, Any]], Style] = {
+            frozenset(): self.current,
+        }
+
+    def feed(self, text: str) -> Iterator[tuple[Style, str]]:
+        """Yield the runs of *text*, the last one included.
+
+        *text* must not end inside an escape sequence: see
+        {func}`_escape_boundary`.
+        """
+        state = self.state
+        buffer: list[str] = []
+        pos = 0
+        for match in _ANSI_SGR_RE.finditer(text):
+            segment = _strip_unsupported_ansi(text[pos : match.start()])
+            pos = match.end()
+            if segment:
+                buffer.append(segment)
+            _apply_sgr_codes(_sgr_params(match.group(1)), state)
+            if state != self.current_state:
+                if buffer:
+                    yield self.current, "".join(buffer)
+                    buffer = []
+                key = frozenset(state.items())
+                style = self.styles.get(key)
+                if style is None:
+                    if len(self.styles) >= _MAX_CACHED_STYLES:
+                        self.styles.clear()
+                    style = self.styles[key] = Style(**state)
+                self.current = style
+                self.current_state = dict(state)
+        tail = _strip_unsupported_ansi(text[pos:])
+        if tail:
+            buffer.append(tail)
+        if buffer:
+            yield self.current, "".join(buffer)
+
+
 def split_ansi(text: str) -> Iterator[tuple[Style, str]]:
     """Split *text* into `(style, text)` runs at ANSI SGR escape boundaries.
 
@@ -827,36 +970,34 @@ def split_ansi(text: str) -> Iterator[tuple[Style, str]]:
 
     Non-SGR escapes carry no style information and are removed from the
     yielded text, per {func}`_strip_unsupported_ansi`.
+
+    To tokenize text arriving in chunks, see {func}`split_ansi_stream`.
     """
-    state: dict[str, Any] = {}
-    current = Style()
-    # Snapshot of the state `current` was built from. The SGR appliers keep the
-    # state dict canonical (attributes are popped on reset, never set falsy, and
-    # values arrive in one spelling each), so two runs share a style exactly
-    # when their state dicts are equal: comparing dicts is what lets the hot
-    # loop skip a Style construction, and its field-walking equality, for every
-    # escape that lands back on the same state (a reset closing an unstyled
-    # run, a style re-opened identically).
-    current_state: dict[str, Any] = {}
-    buffer: list[str] = []
-    pos = 0
-    for match in _ANSI_SGR_RE.finditer(text):
-        segment = _strip_unsupported_ansi(text[pos : match.start()])
-        pos = match.end()
-        if segment:
-            buffer.append(segment)
-        _apply_sgr_codes(_sgr_params(match.group(1)), state)
-        if state != current_state:
-            if buffer:
-                yield current, "".join(buffer)
-                buffer = []
-            current = Style(**state)
-            current_state = dict(state)
-    tail = _strip_unsupported_ansi(text[pos:])
-    if tail:
-        buffer.append(tail)
-    if buffer:
-        yield current, "".join(buffer)
+    return _AnsiSplitter().feed(text)
+
+
+def split_ansi_stream(chunks: Iterable[str]) -> Iterator[tuple[Style, str]]:
+    """Incremental {func}`split_ansi`, tokenizing text as its *chunks* arrive.
+
+    *chunks* is any iterable of strings: the lines of a text file, the blocks
+    of its successive `read()` calls, or the output of a subprocess. Chunks
+    may cut through an escape sequence: its start is carried over to the next
+    chunk, up to {data}`_MAX_ESCAPE_LENGTH` characters.
+
+    Runs are yielded as soon as each chunk is parsed, so memory stays bounded
+    by the chunk size whatever the length of the stream. The price is that a
+    run crossing a chunk boundary is yielded in two parts with the same style,
+    where {func}`split_ansi` would merge them.
+    """
+    splitter = _AnsiSplitter()
+    carry = ""
+    for chunk in chunks:
+        text = carry + chunk
+        boundary = _escape_boundary(text)
+        carry = text[boundary:]
+        yield from splitter.feed(text[:boundary])
+    if carry:
+        yield from splitter.feed(carry)
 
 
 def render_ansi(text: str, emitter: Callable[[Style, str], str]) -> str:
@@ -869,18 +1010,52 @@ def render_ansi(text: str, emitter: Callable[[Style, str], str]) -> str:
     keeps line-oriented markup (LaTeX rows, wiki tables) well-formed even when
     a style spans multiple lines.
     """
+    return "".join(_render_runs(split_ansi(text), emitter))
+
+
+def render_ansi_stream(
+    chunks: Iterable[str],
+    emitter: Callable[[Style, str], str],
+) -> Iterator[str]:
+    """Incremental {func}`render_ansi`, converting text as its *chunks* arrive.
+
+    Reads *chunks* through {func}`split_ansi_stream` and yields the converted
+    markup piece by piece. Joined, the pieces are exactly what
+    {func}`render_ansi` returns for the joined chunks: the only thing held back
+    between two chunks is the unfinished line of a styled run, so memory stays
+    bounded by the chunk size and the line length.
+    """
+    return _render_runs(split_ansi_stream(chunks), emitter)
+
+
+def _render_runs(
+    runs: Iterable[tuple[Style, str]],
+    emitter: Callable[[Style, str], str],
+) -> Iterator[str]:
+    """Markup of *runs*, styled lines wrapped by *emitter* one by one.
+
+    A styled line may arrive split across consecutive runs of the same style:
+    its start is held until the end of the line, or of the run, shows up.
+    """
     plain = Style()
-    chunks: list[str] = []
-    for style, run in split_ansi(text):
+    held_style = plain
+    held = ""
+    for style, run in runs:
+        if held and style is not held_style and style != held_style:
+            yield emitter(held_style, held)
+            held = ""
         if style == plain:
-            chunks.append(run)
+            yield run
             continue
-        for index, line in enumerate(run.split("\n")):
-            if index:
-                chunks.append("\n")
+        *lines, last = (held + run).split("\n")
+        for line in lines:
             if line:
-                chunks.append(emitter(style, line))
-    return "".join(chunks)
+                yield emitter(style, line)
+            yield "\n"
+        held_style = style
+        held = last
+    if held:
+        yield emitter(held_style, held)
 
 
 def _slice_ansi_runs(
@@ -980,6 +1155,14 @@ def ansi_to_html(text: str) -> str:
     return render_ansi(text, _html_emitter)
 
 
+def ansi_to_html_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """Incremental {func}`ansi_to_html`, converting text as its *chunks* arrive.
+
+    Suited to logs too large to hold in memory: see {func}`render_ansi_stream`.
+    """
+    return render_ansi_stream(chunks, _html_emitter)
+
+
 def _jira_emitter(style: Style, text: str) -> str:
     """Wrap *text* in Jira wiki markup.
 
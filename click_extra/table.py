@@ -18,15 +18,25 @@
 from __future__ import annotations
 
 import csv
+import heapq
+import json
 import os
+import pickle
 import re
 import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack
 from dataclasses import dataclass
 from enum import Enum
 from functools import cache, partial
 from gettext import gettext as _
 from io import StringIO
+from itertools import chain, islice
 from types import SimpleNamespace
+from typing import overload
 
 import click
 from boltons.strutils import strip_ansi
@@ -48,8 +58,8 @@ from .types import EnumChoice, MultiChoice
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping, Sequence
-    from typing import Any, Final, Literal
+    from collections.abc import Callable, Iterable, Mapping
+    from typing import IO, Any, Final, Literal
 
     ColumnWidth = int | Literal["auto"] | None
     """Width limit of a single column: a character count, `auto`, or no limit."""
@@ -153,6 +163,7 @@ class TableFormat(Enum):
     JSON = "json"
     JSON5 = "json5"
     JSONC = "jsonc"
+    JSONL = "jsonl"
     LATEX = "latex"
     LATEX_BOOKTABS = "latex-booktabs"
     LATEX_LONGTABLE = "latex-longtable"
@@ -230,6 +241,7 @@ MARKUP_FORMATS = frozenset(
         TableFormat.JSON,
         TableFormat.JSON5,
         TableFormat.JSONC,
+        TableFormat.JSONL,
         TableFormat.LATEX,
         TableFormat.LATEX_BOOKTABS,
         TableFormat.LATEX_LONGTABLE,
@@ -294,7 +306,7 @@ verdict, format by format:
   from rendered Markdown, so translated HTML spans would not display any
   color there. Raw ANSI can still be forced with `--color` for
   terminal Markdown viewers which support escape sequences.
-- `hjson`, `json`, `json5`, `jsonc`, `toml`, `xml`,
+- `hjson`, `json`, `json5`, `jsonc`, `jsonl`, `toml`, `xml`,
   `yaml`: structured serialization formats meant for programmatic
   consumption. Styling is presentation, not data.
 - `moinmoin`: MoinMoin wiki markup has no standard inline color
@@ -323,6 +335,7 @@ SERIALIZATION_FORMATS = frozenset(
         TableFormat.JSON,
         TableFormat.JSON5,
         TableFormat.JSONC,
+        TableFormat.JSONL,
         TableFormat.TOML,
         TableFormat.XML,
         TableFormat.YAML,
@@ -331,6 +344,38 @@ SERIALIZATION_FORMATS = frozenset(
 """Structured serialization formats whose renderers escape raw ESC bytes, making
 post-render `strip_ansi()` ineffective."""
 
+CSV_FORMATS = frozenset(
+    {
+        TableFormat.CSV,
+        TableFormat.CSV_EXCEL,
+        TableFormat.CSV_EXCEL_TAB,
+        TableFormat.CSV_UNIX,
+    },
+)
+"""Formats rendered by Python's {mod}`csv` module, one dialect each."""
+
+STREAMING_FORMATS = CSV_FORMATS | {
+    TableFormat.JSON,
+    TableFormat.JSON5,
+    TableFormat.JSONC,
+    TableFormat.JSONL,
+    TableFormat.XML,
+}
+"""Formats whose rows are serialized independently of one another.
+
+{func}`print_table` writes these to the console row by row, instead of
+rendering the whole table to a string first. Fed an iterator of rows, it never
+gathers them either.
+"""
+
+STREAM_FLUSH_INTERVAL: Final = 0.1
+"""Seconds between two flushes of the console while streaming rows.
+
+Piped output is block-buffered: without flushing, a downstream `jq` would sit
+idle until a buffer fills. Flushing on every row would cost a system call per
+record instead, so the stream is flushed at most this often.
+"""
+
 AUTO_WIDTH: Final = "auto"
 """Sentinel asking for a column width derived from the space left on the terminal.
 
@@ -431,15 +476,31 @@ def _render_csv(
     StringIO is used to capture CSV output in memory. [Hard-coded to default to UTF-8](https://github.com/python/cpython/blob/9291095/Lib/_pyio.py#L2652).
     ```
     """
+    with StringIO(newline="") as output:
+        _write_csv(output, table_data, headers, table_format, **kwargs)
+        return output.getvalue()
+
+
+def _write_csv(
+    output: IO[str],
+    table_data: Iterable[Sequence[str | None]],
+    headers: Sequence[str | None] | None = None,
+    table_format: TableFormat | None = None,
+    **kwargs,
+) -> None:
+    """Write a table in CSV format to `output`, row by row.
+
+    Shared by {func}`_render_csv` and the streaming path of
+    {func}`print_table`, which writes rows to the console as an iterator
+    yields them.
+    """
     defaults = {"dialect": _get_csv_dialect(table_format)}
     defaults.update(kwargs)
 
-    with StringIO(newline="") as output:
-        writer = csv.writer(output, **defaults)  # type: ignore[arg-type]
-        if headers:
-            writer.writerow(headers)
-        writer.writerows(table_data)
-        return output.getvalue()
+    writer = csv.writer(output, **defaults)  # type: ignore[arg-type]
+    if headers:
+        writer.writerow(headers)
+    writer.writerows(table_data)
 
 
 def _rows_as_dicts(
@@ -450,9 +511,44 @@ def _rows_as_dicts(
 
     Falls back to a list of lists when no headers are provided.
     """
+    return list(_iter_rows_as_dicts(table_data, headers))  # type: ignore[return-value]
+
+
+def _iter_rows_as_dicts(
+    table_data: Iterable[Sequence[str | None]],
+    headers: Sequence[str | None] | None = None,
+) -> Iterator[dict[str, str | None] | list[str | None]]:
+    """Lazy counterpart of {func}`_rows_as_dicts`, converting rows as they come."""
     if headers:
-        return [{str(k): v for k, v in zip(headers, row)} for row in table_data]
-    return [list(row) for row in table_data]
+        keys = [str(k) for k in headers]
+        for row in table_data:
+            yield dict(zip(keys, row))
+    else:
+        for row in table_data:
+            yield list(row)
+
+
+def _jsonl_lines(records: Iterable[Any], **kwargs) -> Iterator[str]:
+    """Encode each record as a single-line, newline-terminated JSON document."""
+    dumps_kwargs = {"ensure_ascii": False, **kwargs}
+    for record in records:
+        yield json.dumps(record, **dumps_kwargs) + "\n"
+
+
+def _write_lines(output: IO[str], lines: Iterable[str]) -> None:
+    """Write `lines` to `output` as they come, flushing it periodically.
+
+    See {data}`STREAM_FLUSH_INTERVAL` for the flushing policy. A final flush
+    always follows the last line.
+    """
+    last_flush = time.monotonic()
+    for line in lines:
+        output.write(line)
+        now = time.monotonic()
+        if now - last_flush >= STREAM_FLUSH_INTERVAL:
+            output.flush()
+            last_flush = now
+    output.flush()
 
 
 def _render_json(
@@ -460,10 +556,46 @@ def _render_json(
     headers: Sequence[str | None] | None = None,
     **kwargs,
 ) -> str:
-    """Render a table as JSON."""
-    return serialize_content(
-        ConfigFormat.JSON, _rows_as_dicts(table_data, headers), **kwargs
-    )
+    """Render a table as JSON.
+
+    Serializer options in `kwargs` go through {func}`serialize_content`.
+    Without any, the document is assembled record by record by
+    {func}`_iter_json_chunks`, to the same bytes.
+    """
+    if kwargs:
+        return serialize_content(
+            ConfigFormat.JSON, _rows_as_dicts(table_data, headers), **kwargs
+        )
+    return "".join(_iter_json_chunks(table_data, headers))
+
+
+def _iter_json_chunks(
+    table_data: Iterable[Sequence[str | None]],
+    headers: Sequence[str | None] | None = None,
+) -> Iterator[str]:
+    """Serialize a table as a JSON array, yielding it one record at a time.
+
+    Reproduces the default output of {func}`serialize_content` (two-space
+    indent, non-ASCII kept as-is) byte for byte: each record is dumped on its
+    own and shifted one level in, between the array brackets. JSON escapes
+    line breaks inside strings, so every line of a dumped record is safe to
+    indent.
+    """
+    separator = "[\n"
+    for record in _iter_rows_as_dicts(table_data, headers):
+        dumped = json.dumps(record, ensure_ascii=False, indent=2)
+        yield separator + "  " + dumped.replace("\n", "\n  ")
+        separator = ",\n"
+    yield "[]\n" if separator == "[\n" else "\n]\n"
+
+
+def _render_jsonl(
+    table_data: Sequence[Sequence[str | None]],
+    headers: Sequence[str | None] | None = None,
+    **kwargs,
+) -> str:
+    """Render a table as JSON Lines: one JSON object per row and per line."""
+    return "".join(_jsonl_lines(_iter_rows_as_dicts(table_data, headers), **kwargs))
 
 
 def _render_yaml(
@@ -531,31 +663,67 @@ def _render_xml(
 
     `None` values are omitted. Requires the `xmltodict` package (installable
     via the `[xml]` extra).
+
+    Serializer options in `kwargs` go through {func}`serialize_content`.
+    Without any, the document is assembled record by record by
+    {func}`_iter_xml_chunks`, to the same bytes.
     """
+    if kwargs:
+        records = list(_iter_xml_records(table_data, headers))
+        return serialize_content(
+            ConfigFormat.XML, {XML_ROOT_KEY: {RECORD_KEY: records}}, **kwargs
+        )
+    return "".join(_iter_xml_chunks(table_data, headers))
 
-    def _xml_safe_name(name: str) -> str:
-        """Replace characters invalid in XML element names."""
-        safe = "".join(c if c.isalnum() or c in "_.-" else "_" for c in name)
-        return safe.lstrip("0123456789.-") or "_"
 
+def _xml_safe_name(name: str) -> str:
+    """Replace characters invalid in XML element names."""
+    safe = "".join(c if c.isalnum() or c in "_.-" else "_" for c in name)
+    return safe.lstrip("0123456789.-") or "_"
+
+
+def _iter_xml_records(
+    table_data: Iterable[Sequence[str | None]],
+    headers: Sequence[str | None] | None = None,
+) -> Iterator[dict[str, str]]:
+    """Convert rows to the mappings serialized as `<record>` elements."""
     if headers:
-        records = [
-            {
-                _xml_safe_name(k): v
-                for k, v in zip(headers, row)
-                if v is not None and k is not None
-            }
-            for row in table_data
-        ]
+        keys = [None if k is None else _xml_safe_name(k) for k in headers]
+        for row in table_data:
+            yield {k: v for k, v in zip(keys, row) if v is not None and k is not None}
     else:
-        records = [
-            {str(i): v for i, v in enumerate(row) if v is not None}
-            for row in table_data
-        ]
+        for row in table_data:
+            yield {str(i): v for i, v in enumerate(row) if v is not None}
 
-    return serialize_content(
-        ConfigFormat.XML, {XML_ROOT_KEY: {RECORD_KEY: records}}, **kwargs
-    )
+
+def _iter_xml_chunks(
+    table_data: Iterable[Sequence[str | None]],
+    headers: Sequence[str | None] | None = None,
+) -> Iterator[str]:
+    """Serialize a table as an XML document, yielding it one record at a time.
+
+    Reproduces the default output of {func}`serialize_content` byte for byte.
+    Each record is unparsed by `xmltodict` inside its own single-record root
+    element, which lays it out at the depth it takes in the full document:
+    cutting the root's opening and closing tags off leaves the exact bytes of
+    that record, text nodes untouched.
+    """
+    import xmltodict
+
+    opening = f"<{XML_ROOT_KEY}>\n"
+    closing = f"</{XML_ROOT_KEY}>"
+    empty = True
+    for record in _iter_xml_records(table_data, headers):
+        document = xmltodict.unparse(
+            {XML_ROOT_KEY: {RECORD_KEY: record}},
+            pretty=True,
+            encoding="unicode",
+            full_document=False,
+        )
+        chunk = document[len(opening) : -len(closing)]
+        yield opening + chunk if empty else chunk
+        empty = False
+    yield f"<{XML_ROOT_KEY}></{XML_ROOT_KEY}>\n" if empty else closing + "\n"
 
 
 EMOJI_PRESENTATION_SELECTOR = "\ufe0f"
@@ -652,7 +820,18 @@ def _natural_column_widths(
     Headers participate in the measure, as they widen a column the same way
     cells do.
     """
-    widths: list[int] = []
+    widths: list[int]
+    if isinstance(table_data, TableData):
+        widths = list(table_data.visible_widths)
+        for index, header in enumerate(headers or ()):
+            width = _visible_width(header)
+            if index < len(widths):
+                widths[index] = max(widths[index], width)
+            else:
+                widths.append(width)
+        return widths
+
+    widths = []
     rows = [headers, *table_data] if headers else list(table_data)
     for row in rows:
         for index, cell in enumerate(row):
@@ -952,7 +1131,10 @@ def _resolve_column_widths(
     if not resolved_format.is_wrappable:
         return None
 
-    column_count = max((len(row) for row in table_data), default=0)
+    if isinstance(table_data, TableData):
+        column_count = len(table_data.columns)
+    else:
+        column_count = max((len(row) for row in table_data), default=0)
     if labels:
         column_count = max(column_count, len(labels))
     if not column_count:
@@ -982,8 +1164,7 @@ def _select_table_funcs(
     """
     # Structured serializations and CSV variants embed their own line terminations,
     # so they bypass echo() (which would add an extra line return).
-    is_csv = table_format is not None and table_format.value.startswith("csv")
-    if table_format in SERIALIZATION_FORMATS or is_csv:
+    if table_format in SERIALIZATION_FORMATS or table_format in CSV_FORMATS:
         print_func: Callable[[str], None] = partial(print, end="")
     else:
         print_func = echo
@@ -1000,6 +1181,8 @@ def _select_table_funcs(
             return _render_hjson, print_func
         case TableFormat.JSON | TableFormat.JSON5 | TableFormat.JSONC:
             return _render_json, print_func
+        case TableFormat.JSONL:
+            return _render_jsonl, print_func
         case TableFormat.TOML:
             return _render_toml, print_func
         case TableFormat.XML:
@@ -1012,6 +1195,152 @@ def _select_table_funcs(
             return partial(_render_tabulate, table_format=table_format), print_func
 
 
+def _is_streamable(table_format: TableFormat | None, kwargs: Mapping) -> bool:
+    """Whether {func}`print_table` can stream a table in `table_format`.
+
+    The JSON and XML documents are only assembled record by record with the
+    default serializer options: custom ones (`kwargs`) go through the
+    one-shot renderer.
+    """
+    if table_format not in STREAMING_FORMATS:
+        return False
+    return (
+        not kwargs or table_format in CSV_FORMATS or table_format is TableFormat.JSONL
+    )
+
+
+def _stream_table(
+    table_data: Iterable[Sequence[str | None]],
+    headers: Sequence[str | None] | None,
+    table_format: TableFormat,
+    **kwargs,
+) -> None:
+    """Write a table in one of the {data}`STREAMING_FORMATS` to the console."""
+    if table_format in CSV_FORMATS:
+        _write_csv(sys.stdout, table_data, headers, table_format, **kwargs)
+        return
+    chunks = _iter_table_chunks(table_data, headers, table_format, **kwargs)
+    _write_lines(sys.stdout, chunks)
+
+
+def _iter_table_chunks(
+    table_data: Iterable[Sequence[str | None]],
+    headers: Sequence[str | None] | None,
+    table_format: TableFormat,
+    **kwargs,
+) -> Iterator[str]:
+    """Serialize a table in one of the {data}`STREAMING_FORMATS`, chunk by chunk.
+
+    Each chunk carries the serialization of a single row, plus whatever
+    opening or closing markup the document needs around the rows.
+    """
+    if table_format in CSV_FORMATS:
+        with StringIO(newline="") as buffer:
+            defaults = {"dialect": _get_csv_dialect(table_format), **kwargs}
+            writer = csv.writer(buffer, **defaults)
+            rows = [headers] if headers else []
+            for row in chain(rows, table_data):
+                writer.writerow(row)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    elif table_format is TableFormat.JSONL:
+        yield from _jsonl_lines(_iter_rows_as_dicts(table_data, headers), **kwargs)
+    elif table_format is TableFormat.XML:
+        yield from _iter_xml_chunks(table_data, headers)
+    else:
+        yield from _iter_json_chunks(table_data, headers)
+
+
+def _chomp(chunks: Iterable[str]) -> Iterator[str]:
+    """Pass `chunks` through, minus the newline ending the last one.
+
+    {func}`click.echo_via_pager` terminates the paged text itself.
+    """
+    previous = None
+    for chunk in chunks:
+        if previous is not None:
+            yield previous
+        previous = chunk
+    if previous is not None:
+        yield previous.removesuffix("\n")
+
+
+PAGER_WINDOW_ROWS: Final = 100
+"""Rows rendered at once when {func}`print_table` feeds an aligned table to
+the pager.
+
+Column widths are measured on the first window only, so the first screen shows
+up without waiting for the rest of the table. Later windows are laid out on the
+same widths: a longer cell wraps instead of widening its column.
+"""
+
+
+def _iter_table_windows(
+    table_data: Iterable[Sequence[str | None]],
+    headers: Sequence[str | ColumnSpec | tuple[str, str | None] | None] | None,
+    labels: Sequence[str | None] | None,
+    table_format: TableFormat,
+    max_column_widths: MaxColumnWidths,
+    **kwargs,
+) -> Iterator[str]:
+    """Render a tabulate table window by window, on widths fixed by the first one.
+
+    Every window is rendered as a complete table, topped by a probe row whose
+    cells span exactly the fixed widths, which pins the columns in place.
+    Comparing renders of two different probes locates the lines of the header
+    and of the closing border, so each window contributes its rows only.
+
+    Restricted to the {data}`~click_extra.table.WRAPPABLE_FORMATS` laid out
+    by tabulate, where a cell wider than its column can wrap.
+    """
+    rows = iter(table_data)
+    window = list(islice(rows, PAGER_WINDOW_ROWS))
+    limits = _resolve_column_widths(
+        window, headers, labels, table_format, max_column_widths
+    )
+    if limits is not None:
+        kwargs["max_column_widths"] = limits
+    if not window:
+        yield _render_tabulate(window, labels, table_format, **kwargs)
+        return
+
+    natural = _natural_column_widths(window, labels)
+    widths = [
+        max(width if limit is None else min(width, limit), 1)
+        for width, limit in zip(natural, limits or [None] * len(natural))
+    ]
+    kwargs["max_column_widths"] = widths
+
+    def render(window_rows: list[Sequence[str | None]]) -> list[str]:
+        output = _render_tabulate(window_rows, labels, table_format, **kwargs)
+        return output.splitlines()
+
+    probe = ["x" * width for width in widths]
+    single = render([probe])
+    head = next(
+        index
+        for index, (line, other) in enumerate(
+            zip(single, render([["y" * width for width in widths]]))
+        )
+        if line != other
+    )
+    tail = len(single) - head - 1
+    double = render([probe, probe])
+    gap = len(double) - len(single) - 1
+    separator = double[head + 1 : head + 1 + gap]
+
+    lines = single[:head]
+    while window:
+        rendered = render([probe, *window])
+        lines.extend(rendered[head + 1 + gap : len(rendered) - tail])
+        yield "\n".join(lines)
+        lines = ["", *separator]
+        window = list(islice(rows, PAGER_WINDOW_ROWS))
+    if tail:
+        yield "\n".join(["", *single[-tail:]])
+
+
 def _split_header_defs(
     headers: Sequence[str | ColumnSpec | tuple[str, str | None] | None] | None,
 ) -> tuple[
@@ -1065,32 +1394,176 @@ def _context_sort_key(
     return column_sort_key(header_defs, sort_columns)
 
 
+SPILL_BLOCK_ROWS: Final = 1024
+"""Rows pickled together when a sorted run spills to disk.
+
+Reading a run back block by block bounds the merge's footprint to one block
+per run, while keeping the per-row pickling overhead amortized.
+"""
+
+
+def _spill_run(run: list[Sequence[str | None]], spill_file: IO[bytes]) -> None:
+    """Write a sorted run to `spill_file` as consecutive pickled blocks."""
+    for start in range(0, len(run), SPILL_BLOCK_ROWS):
+        pickle.dump(
+            run[start : start + SPILL_BLOCK_ROWS],
+            spill_file,
+            pickle.HIGHEST_PROTOCOL,
+        )
+    spill_file.seek(0)
+
+
+def _read_run(spill_file: IO[bytes]) -> Iterator[Sequence[str | None]]:
+    """Yield back the rows of a run written by {func}`_spill_run`."""
+    while True:
+        try:
+            block = pickle.load(spill_file)
+        except EOFError:
+            return
+        yield from block
+
+
+def _merge_runs(
+    spill_files: list[IO[bytes]],
+    sort_key: Callable[[Sequence[str | None]], Any],
+) -> Iterator[Sequence[str | None]]:
+    """K-way merge the runs spilled to `spill_files`, then discard them.
+
+    {func}`heapq.merge` resolves ties in favor of the earliest iterable, and
+    runs are cut from the input in order, so the merge is as stable as a
+    single {func}`sorted` call over the whole input.
+    """
+    with ExitStack() as stack:
+        for spill_file in spill_files:
+            stack.callback(spill_file.close)
+        yield from heapq.merge(*map(_read_run, spill_files), key=sort_key)
+
+
+def _external_sort(
+    table_data: Iterable[Sequence[str | None]],
+    sort_key: Callable[[Sequence[str | None]], Any],
+    spill_rows: int,
+) -> Sequence[Sequence[str | None]] | Iterator[Sequence[str | None]]:
+    """Sort rows while holding at most `spill_rows` of them in memory.
+
+    Rows are consumed in runs of `spill_rows`, each sorted and spilled to an
+    anonymous temporary file, then lazily k-way merged. An input fitting in a
+    single run never touches the disk and is returned as a plain list.
+    """
+    rows = iter(table_data)
+    run = sorted(islice(rows, spill_rows), key=sort_key)
+    if len(run) < spill_rows:
+        return run
+
+    spill_files: list[IO[bytes]] = []
+    try:
+        while run:
+            # Outlives this function: _merge_runs closes it once drained.
+            spill_file = tempfile.TemporaryFile()  # noqa: SIM115
+            spill_files.append(spill_file)
+            _spill_run(run, spill_file)
+            run = sorted(islice(rows, spill_rows), key=sort_key)
+    except BaseException:
+        for spilled in spill_files:
+            spilled.close()
+        raise
+    return _merge_runs(spill_files, sort_key)
+
+
+def _sort_rows(
+    table_data: Iterable[Sequence[str | None]],
+    sort_key: Callable[[Sequence[str | None]], Any] | None,
+    limit: int | None,
+    spill_rows: int | None = None,
+) -> Sequence[Sequence[str | None]] | Iterator[Sequence[str | None]]:
+    """Sort rows by `sort_key` and keep the first `limit` of them.
+
+    Both {func}`sorted` and {func}`heapq.nsmallest` decorate each row with its
+    key once, so the ANSI stripping and case folding of the default cell key
+    run a single time per row however many comparisons follow. A `limit`
+    smaller than the table swaps the full sort for a heap-based partial one,
+    which is stable like {func}`sorted`: tied rows keep their original order.
+
+    Without a limit, `spill_rows` switches to {func}`_external_sort`, so an
+    iterable of rows larger than memory can still be sorted.
+    """
+    if isinstance(table_data, TableData):
+        return _sort_table_data(table_data, sort_key, limit)
+    if sort_key is None:
+        if limit is None:
+            return table_data  # type: ignore[return-value]
+        if isinstance(table_data, Sequence):
+            return table_data[:limit]
+        return list(islice(table_data, limit))
+    if limit is not None:
+        return heapq.nsmallest(limit, table_data, key=sort_key)
+    if spill_rows is not None:
+        return _external_sort(table_data, sort_key, spill_rows)
+    return sorted(table_data, key=sort_key)
+
+
+def _sort_table_data(
+    table_data: TableData,
+    sort_key: Callable[[Sequence[str | None]], Any] | None,
+    limit: int | None,
+) -> TableData:
+    """Columnar counterpart of {func}`_sort_rows`.
+
+    Sorts row indices instead of rows, then reorders every column once with
+    {meth}`TableData.take`. The table already sits in memory, so there is no
+    point spilling it to disk.
+    """
+    if sort_key is None:
+        return table_data if limit is None else table_data[:limit]
+    indices = range(len(table_data))
+
+    def index_key(index: int) -> Any:
+        return sort_key(table_data[index])
+
+    if limit is None:
+        return table_data.take(sorted(indices, key=index_key))
+    return table_data.take(heapq.nsmallest(limit, indices, key=index_key))
+
+
 def _resolve_table_inputs(
-    table_data: Sequence[Sequence[str | None]],
+    table_data: Iterable[Sequence[str | None]],
     headers: Sequence[str | ColumnSpec | tuple[str, str | None] | None] | None,
     sort_key: Callable[[Sequence[str | None]], Any] | None,
-) -> tuple[Sequence[Sequence[str | None]], Sequence[str | None] | None]:
-    """Split header definitions and apply the resolved row sort.
+    limit: int | None = None,
+) -> tuple[
+    Sequence[Sequence[str | None]] | Iterator[Sequence[str | None]],
+    Sequence[str | None] | None,
+]:
+    """Split header definitions and apply the resolved row sort and limit.
 
     The shared preamble of {func}`render_table` and {func}`print_table`: the
     render labels are split from the sortable column definitions, the active
     `--sort-by` selection is resolved when no explicit *sort_key* is given,
-    and rows are sorted when a key applies.
+    the `--limit` cap when no explicit *limit* is given, and rows are sorted
+    and truncated accordingly. Truncation happens here, before any width
+    computation or rendering, so rows past the limit are never measured.
     """
+    if headers is None and isinstance(table_data, TableData):
+        headers = table_data.columns
     labels, header_defs = _split_header_defs(headers)
     if sort_key is None and header_defs:
         sort_key = _context_sort_key(header_defs)
-    if sort_key is not None:
-        table_data = sorted(table_data, key=sort_key)
-    return table_data, labels
+    spill_rows = None
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        if limit is None:
+            limit = context.get(ctx, context.TABLE_LIMIT)
+        spill_rows = context.get(ctx, context.SORT_SPILL_ROWS)
+    return _sort_rows(table_data, sort_key, limit, spill_rows), labels
 
 
 def render_table(
-    table_data: Sequence[Sequence[str | None]],
+    table_data: Iterable[Sequence[str | None]],
     headers: Sequence[str | ColumnSpec | tuple[str, str | None] | None] | None = None,
     table_format: TableFormat | None = None,
     sort_key: Callable[[Sequence[str | None]], Any] | None = None,
     max_column_widths: MaxColumnWidths = None,
+    limit: int | None = None,
     **kwargs,
 ) -> str:
     """Render a table and return it as a string.
@@ -1101,6 +1574,9 @@ def render_table(
     selected columns this table carries, and keep their original order when it
     carries none. See {func}`column_sort_key` for the exact semantics.
 
+    `table_data` may also be a columnar {class}`TableData`, whose column
+    definitions then stand in for missing `headers`.
+
     :param sort_key: Optional callable passed to :py:func:`sorted` as the `key`
         argument. When provided, rows are sorted before rendering.
     :param max_column_widths: Width limits, as one entry per column or a single
@@ -1109,8 +1585,12 @@ def render_table(
         Defaults to the `max_width` declared by {class}`ColumnSpec` headers.
         Silently dropped by formats outside
         {data}`~click_extra.table.WRAPPABLE_FORMATS`.
+    :param limit: Maximum number of rows to render, taken after sorting.
+        Defaults to the `--limit` value of the current context, if any.
     """
-    table_data, labels = _resolve_table_inputs(table_data, headers, sort_key)
+    table_data, labels = _resolve_table_inputs(table_data, headers, sort_key, limit)
+    if not isinstance(table_data, Sequence):
+        table_data = list(table_data)
     widths = _resolve_column_widths(
         table_data, headers, labels, table_format, max_column_widths
     )
@@ -1123,19 +1603,22 @@ def render_table(
 def _strip_ansi_cells(
     table_data: Sequence[Sequence[str | None]],
     headers: Sequence[str | None] | None = None,
-) -> tuple[list[list[str | None]], Sequence[str | None] | None]:
+) -> tuple[Sequence[Sequence[str | None]], Sequence[str | None] | None]:
     """Strip ANSI escape codes from all string cells and headers."""
-    cleaned_data: list[list[str | None]] = [
-        [strip_ansi(v) if isinstance(v, str) else v for v in row] for row in table_data
-    ]
-    cleaned_headers = (
-        [strip_ansi(h) if isinstance(h, str) else h for h in headers]
-        if headers
-        else headers
-    )
+    cleaned_data: Sequence[Sequence[str | None]]
+    if isinstance(table_data, TableData):
+        cleaned_data = table_data.strip_ansi()
+    else:
+        cleaned_data = [_strip_ansi_row(row) for row in table_data]
+    cleaned_headers = _strip_ansi_row(headers) if headers else headers
     return cleaned_data, cleaned_headers
 
 
+def _strip_ansi_row(row: Sequence[str | None]) -> list[str | None]:
+    """Strip ANSI escape codes from the string cells of a single row."""
+    return [strip_ansi(v) if isinstance(v, str) else v for v in row]
+
+
 def _color_disabled() -> bool:
     """Whether color output is disabled for the current invocation.
 
@@ -1166,11 +1649,13 @@ def _color_forced() -> bool:
 
 
 def print_table(
-    table_data: Sequence[Sequence[str | None]],
+    table_data: Iterable[Sequence[str | None]],
     headers: Sequence[str | ColumnSpec | tuple[str, str | None] | None] | None = None,
     table_format: TableFormat | None = None,
     sort_key: Callable[[Sequence[str | None]], Any] | None = None,
     max_column_widths: MaxColumnWidths = None,
+    limit: int | None = None,
+    pager: bool = False,
     **kwargs,
 ) -> None:
     """Render a table and print it to the console.
@@ -1181,6 +1666,9 @@ def print_table(
     selected columns this table carries, and keep their original order when it
     carries none. See {func}`column_sort_key` for the exact semantics.
 
+    `table_data` may also be a columnar {class}`TableData`, whose column
+    definitions then stand in for missing `headers`.
+
     ANSI codes carried by cell values and headers depend on the format:
 
     - Markup formats with native styling support (see
@@ -1200,8 +1688,64 @@ def print_table(
         Defaults to the `max_width` declared by {class}`ColumnSpec` headers.
         Silently dropped by formats outside
         {data}`~click_extra.table.WRAPPABLE_FORMATS`.
+    :param limit: Maximum number of rows to render, taken after sorting.
+        Defaults to the `--limit` value of the current context, if any.
+    :param pager: Display the table through the pager, with
+        {func}`~click_extra.accessibility.echo_via_pager`. Rows are fed to
+        the pager as they are rendered, so the first screen shows up before
+        the whole table is: see {data}`~click_extra.table.PAGER_WINDOW_ROWS`.
     """
-    table_data, labels = _resolve_table_inputs(table_data, headers, sort_key)
+    # Imported here because the accessibility module depends on this one.
+    from .accessibility import echo_via_pager
+
+    table_data, labels = _resolve_table_inputs(table_data, headers, sort_key, limit)
+
+    # Formats which need no width measurement, and thus no full view of the
+    # table, write rows straight to the console as they come. Rows still
+    # arriving from an iterator (an externally sorted merge, or the caller's
+    # own generator) are never gathered, and no rendered string is built.
+    if _is_streamable(table_format, kwargs):
+        assert table_format is not None
+        rows: Iterable[Sequence[str | None]] = table_data
+        if not _color_forced():
+            rows = map(_strip_ansi_row, table_data)
+            labels = _strip_ansi_row(labels) if labels else labels
+        try:
+            if pager:
+                chunks = _iter_table_chunks(rows, labels, table_format, **kwargs)
+                echo_via_pager(_chomp(chunks))
+            else:
+                _stream_table(rows, labels, table_format, **kwargs)
+        except ImportError:
+            msg = f"Error: {_missing_extra_message(table_format)}"
+            raise SystemExit(msg) from None
+        return
+
+    # Aligned formats reach the pager window by window, laid out on the
+    # column widths of the first one.
+    resolved_format = table_format if table_format is not None else DEFAULT_FORMAT
+    if (
+        pager
+        and resolved_format.is_wrappable
+        and resolved_format is not TableFormat.VERTICAL
+    ):
+        windowed: Iterable[Sequence[str | None]] = table_data
+        if resolved_format.is_markup and not _color_forced():
+            windowed = map(_strip_ansi_row, table_data)
+            labels = _strip_ansi_row(labels) if labels else labels
+        echo_via_pager(
+            _iter_table_windows(
+                windowed,
+                headers,
+                labels,
+                resolved_format,
+                max_column_widths,
+                **kwargs,
+            )
+        )
+        return
+    if not isinstance(table_data, Sequence):
+        table_data = list(table_data)
 
     ansi_translator: Callable[[str], str] | None = None
     if table_format:
@@ -1232,7 +1776,10 @@ def print_table(
         raise SystemExit(f"Error: {_missing_extra_message(table_format)}") from None
     if ansi_translator is not None:
         output = ansi_translator(output)
-    print_func(output)
+    if pager:
+        echo_via_pager(output.removesuffix("\n"))
+    else:
+        print_func(output)
 
 
 def _missing_extra_message(
@@ -1285,7 +1832,8 @@ def serialize_data(
     combinations) and serializes it to the requested format.
 
     Only formats in :py:data:`~click_extra.table.SERIALIZATION_FORMATS` are
-    supported.
+    supported. The `jsonl` format writes one JSON document per line: one per
+    item of a list, tuple or iterator, or a single one for any other value.
 
     :param data: Arbitrary data to serialize (dicts, lists, scalars).
     :param table_format: Target serialization format.
@@ -1301,7 +1849,13 @@ def serialize_data(
         msg = f"Unsupported serialization format: {table_format}"
         raise ValueError(msg)
 
-    clean = _apply_default(data, default if default is not None else str)
+    if default is None:
+        default = str
+
+    if table_format is TableFormat.JSONL:
+        return "".join(_jsonl_lines(_jsonl_records(data, default), **kwargs))
+
+    clean = _apply_default(data, default)
 
     match table_format:
         case TableFormat.JSON | TableFormat.JSON5 | TableFormat.JSONC:
@@ -1328,6 +1882,21 @@ def serialize_data(
             raise NotImplementedError(msg)
 
 
+def _jsonl_records(data: Any, default: Callable) -> Iterator[Any]:
+    """Iterate over the records `data` holds, one per JSON Lines document.
+
+    Lists, tuples and iterators (generators included) hold one record per
+    item, consumed lazily. Any other value, a mapping typically, is a single
+    record.
+    """
+    if isinstance(data, (list, tuple, Iterator)):
+        records = data
+    else:
+        records = (data,)
+    for record in records:
+        yield _apply_default(record, default)
+
+
 def _apply_default(data: Any, default: Callable) -> Any:
     """Recursively apply a `default` callback to non-native types.
 
@@ -1355,7 +1924,8 @@ def print_data(
     """Serialize arbitrary Python data and print it to the console.
 
     Wraps :py:func:`serialize_data` with user-friendly error handling for missing
-    optional dependencies.
+    optional dependencies. In the `jsonl` format, records are printed as they
+    are serialized, so an iterator of records streams to the console.
 
     :param data: Arbitrary data to serialize.
     :param table_format: Target serialization format.
@@ -1364,6 +1934,11 @@ def print_data(
     :param package: Package name for install instructions in error messages.
     :param kwargs: Extra keyword arguments forwarded to the underlying serializer.
     """
+    if table_format is TableFormat.JSONL:
+        records = _jsonl_records(data, default if default is not None else str)
+        _write_lines(sys.stdout, _jsonl_lines(records, **kwargs))
+        return
+
     try:
         output = serialize_data(
             data,
@@ -1474,7 +2049,10 @@ def _row_sort_key(
     if cell_key is None:
 
         def cell_key(v):
-            return strip_ansi(v).casefold() if v else ""
+            if not v:
+                return ""
+            # Most cells carry no escape sequence: skip the regex pass on them.
+            return (strip_ansi(v) if "\x1b" in v else v).casefold()
 
     def key_func(row: Sequence[str | None]) -> tuple:
         return tuple(cell_key(row[i]) for i in sort_order)
@@ -1647,6 +2225,170 @@ def select_row(
     return tuple(row[col_id] for col_id in ids)
 
 
+class TableData(Sequence):
+    """Column-major table: one tuple of cells per column, rows read as views.
+
+    The row-major `Sequence[Sequence[str | None]]` accepted everywhere else
+    spends one Python container per row, and every stage of the pipeline
+    (ANSI stripping, projection, sorting) builds a fresh set of them. A
+    `TableData` holds one tuple per column instead, and derives new tables by
+    sharing those tuples:
+
+    - {meth}`select` projects and reorders columns, as {func}`select_columns`
+      does on the column definitions, without touching a single cell.
+    - {meth}`take` reorders rows through a list of indices, which is what
+      sorting produces.
+    - {meth}`strip_ansi` only rebuilds the columns actually carrying escape
+      sequences.
+
+    Visible widths and ANSI flags are measured once per column, on first use,
+    and carried over to every table derived by {meth}`select` or {meth}`take`.
+
+    {func}`render_table` and {func}`print_table` accept it in place of rows,
+    and default their `headers` to its {attr}`columns`, which plugs the table
+    into `--sort-by`. Rows are only materialized, as transient tuples, by
+    the renderers iterating over the table.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[ColumnSpec],
+        data: Iterable[Sequence[str | None]],
+        *,
+        _widths: tuple[int, ...] | None = None,
+        _ansi: tuple[bool, ...] | None = None,
+    ) -> None:
+        self.columns: tuple[ColumnSpec, ...] = tuple(columns)
+        """Definitions of the columns, in display order."""
+
+        self.data: tuple[tuple[str | None, ...], ...] = tuple(map(tuple, data))
+        """Cells of the table, as one tuple per column."""
+
+        if len(self.data) != len(self.columns):
+            msg = (
+                f"{len(self.columns)} column definitions for "
+                f"{len(self.data)} columns of data."
+            )
+            raise ValueError(msg)
+        lengths = {len(column) for column in self.data}
+        if len(lengths) > 1:
+            msg = f"Columns have different lengths: {sorted(lengths)}."
+            raise ValueError(msg)
+        self._row_count = lengths.pop() if lengths else 0
+        self._widths = _widths
+        self._ansi = _ansi
+
+    @classmethod
+    def from_rows(
+        cls,
+        columns: Sequence[ColumnSpec],
+        rows: Iterable[Sequence[str | None]],
+    ) -> TableData:
+        """Transpose row-major `rows` into a columnar table."""
+        data = tuple(zip(*rows, strict=True))
+        if not data:
+            data = ((),) * len(columns)
+        return cls(columns, data)
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[str | None, ...]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TableData: ...
+
+    def __getitem__(self, index):
+        """Read a row as a tuple, or slice rows into a new table."""
+        if isinstance(index, slice):
+            return TableData(self.columns, (column[index] for column in self.data))
+        if index < 0:
+            index += self._row_count
+        if not 0 <= index < self._row_count:
+            raise IndexError("table row index out of range")
+        return tuple(column[index] for column in self.data)
+
+    def __iter__(self) -> Iterator[tuple[str | None, ...]]:
+        return zip(*self.data) if self.data else iter(())
+
+    def __repr__(self) -> str:
+        ids = ", ".join(column.id for column in self.columns)
+        return f"<{type(self).__name__} [{ids}] x {self._row_count} rows>"
+
+    @property
+    def visible_widths(self) -> tuple[int, ...]:
+        """Widest visible cell of each column, headers excluded."""
+        if self._widths is None:
+            self._widths = tuple(
+                max(map(_visible_width, column), default=0) for column in self.data
+            )
+        return self._widths
+
+    @property
+    def ansi_flags(self) -> tuple[bool, ...]:
+        """Whether each column carries at least one ANSI escape sequence."""
+        if self._ansi is None:
+            self._ansi = tuple(
+                any(isinstance(cell, str) and "\x1b" in cell for cell in column)
+                for column in self.data
+            )
+        return self._ansi
+
+    def select(self, selected_ids: Sequence[str] | None) -> TableData:
+        """Project and reorder columns by ID, sharing their cells.
+
+        Same semantics as {func}`select_columns`: a falsy `selected_ids`
+        keeps every column, unknown IDs raise `KeyError`.
+        """
+        if not selected_ids:
+            return self
+        positions = {column.id: i for i, column in enumerate(self.columns)}
+        picked = [positions[col_id] for col_id in selected_ids]
+        return TableData(
+            select_columns(self.columns, selected_ids),
+            (self.data[i] for i in picked),
+            _widths=self._pick(self._widths, picked),
+            _ansi=self._pick(self._ansi, picked),
+        )
+
+    def take(self, indices: Iterable[int]) -> TableData:
+        """Build a table of the rows at `indices`, in that order.
+
+        Measurements carry over when `indices` is a permutation, as a sort
+        produces: the set of cells in each column is unchanged.
+        """
+        indices = list(indices)
+        permutation = len(indices) == self._row_count
+        return TableData(
+            self.columns,
+            ([column[i] for i in indices] for column in self.data),
+            _widths=self._widths if permutation else None,
+            _ansi=self._ansi if permutation else None,
+        )
+
+    def strip_ansi(self) -> TableData:
+        """Strip ANSI escape codes, rebuilding only the columns carrying some."""
+        if not any(self.ansi_flags):
+            return self
+        return TableData(
+            self.columns,
+            (
+                _strip_ansi_row(column) if flagged else column
+                for column, flagged in zip(self.data, self.ansi_flags)
+            ),
+            _widths=self._widths,
+            _ansi=(False,) * len(self.data),
+        )
+
+    @staticmethod
+    def _pick(measures: tuple | None, positions: Sequence[int]) -> tuple | None:
+        """Project cached per-column `measures` onto `positions`."""
+        if measures is None:
+            return None
+        return tuple(measures[i] for i in positions)
+
+
 class ColumnsType(MultiChoice):
     """Column-flavored alias of {class}`click_extra.types.MultiChoice`.
 
@@ -1747,6 +2489,54 @@ class ColumnsOption(ExtraOption):
         context.set(ctx, context.COLUMNS, tuple(columns) if columns else ())
 
 
+class LimitOption(ExtraOption):
+    """A `--limit` option capping the number of rows a table renders.
+
+    Stores the cap in `ctx.meta[click_extra.context.TABLE_LIMIT]`, where
+    {func}`render_table` and {func}`print_table` (and their context method
+    counterparts) pick it up. The cap applies after the `--sort-by` sort, so
+    combining both options yields the top rows of the sorted table. A limit
+    smaller than the table switches the sort to a heap-based partial one, and
+    rows past the limit are never measured nor rendered.
+    """
+
+    def __init__(
+        self,
+        param_decls: Sequence[str] | None = None,
+        type=click.IntRange(min=0),
+        default: int | None = None,
+        expose_value: bool = False,
+        metavar: str = "N",
+        help: str = _("Only render the first N rows of tables."),
+        **kwargs,
+    ) -> None:
+        if not param_decls:
+            param_decls = ("--limit",)
+
+        kwargs.setdefault("callback", self.init_limit)
+
+        super().__init__(
+            param_decls=param_decls,
+            type=type,
+            default=default,
+            expose_value=expose_value,
+            metavar=metavar,
+            help=help,
+            **kwargs,
+        )
+
+    def init_limit(
+        self,
+        ctx: click.Context,
+        param: click.Parameter,
+        limit: int | None,
+    ) -> None:
+        """Save the row cap in the context's shared `meta`."""
+        if ctx.resilient_parsing:
+            return
+        context.set(ctx, context.TABLE_LIMIT, limit)
+
+
 def _normalize_column_def(column: ColumnSpec | tuple[str | None, str | None] | str):
     """Coerce a column definition to a `(label, column_id)` tuple.
 
@@ -1833,12 +2623,22 @@ class SortByOption(ExtraOption):
         default: str | Sequence[str] | None = None,
         expose_value: bool = False,
         cell_key: Callable[[str | None], Any] | None = None,
+        spill_rows: int | None = None,
         help: str = _("Sort table by this column. Repeat to set priority."),
         **kwargs,
     ) -> None:
         if not param_decls:
             param_decls = ("--sort-by",)
 
+        if spill_rows is not None and spill_rows < 1:
+            msg = f"spill_rows must be a positive row count, got {spill_rows!r}."
+            raise ValueError(msg)
+        self.spill_rows = spill_rows
+        """Row count above which sorts spill sorted runs to temporary files.
+
+        `None` keeps the whole sort in memory. See {meth}`init_sort`.
+        """
+
         # Accept a shared `columns=` registry (the same `ColumnSpec` tuple
         # passed to `--columns`) or positional definitions. Each entry may be a
         # `ColumnSpec`, a raw `(label, column_id)` tuple, or a bare column ID
@@ -1907,11 +2707,20 @@ class SortByOption(ExtraOption):
         so no key is published: only the selection lands on the context
         (`ctx.meta` is shared with every subcommand), resolved per table by
         {func}`print_table` from the column IDs its headers carry.
+
+        The `spill_rows` threshold is published alongside, under
+        `ctx.meta[click_extra.context.SORT_SPILL_ROWS]`. Tables fed past it
+        are sorted externally: runs of `spill_rows` rows are sorted and
+        written to temporary files, then k-way merged with the same sort key.
+        Paired with an iterator of rows and a CSV format, {func}`print_table`
+        then streams the merge to the output, holding one run in memory at
+        most.
         """
         if ctx.resilient_parsing:
             return
 
         context.set(ctx, context.SORT_BY, sort_columns)
+        context.set(ctx, context.SORT_SPILL_ROWS, self.spill_rows)
 
         if self.field_vocabulary:
             return
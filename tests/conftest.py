@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import os
+from unittest.mock import patch
 
 import pytest
 from extra_platforms.pytest import skip_windows
@@ -68,6 +69,35 @@ def _isolate_color_envvars():
     os.environ.update(saved)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_entry_points_index(tmp_path_factory):
+    """Keep the ``console_scripts`` index ``wrap`` caches out of the user's home.
+
+    One file for the whole session: each test starting from an empty cache
+    would rebuild the index on its first resolution.
+
+    Patched without ``monkeypatch``, whose teardown would ``chdir`` back to the
+    directory the ``runner`` fixture already deleted (see its docstring).
+    """
+    index_path = tmp_path_factory.getbasetemp() / "entry-points.json"
+    with patch("click_extra.cli_wrapper.entry_points_index_path", lambda: index_path):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _isolate_background_cache(tmp_path):
+    """Keep the terminal background cache out of the user's home.
+
+    One file per test: a reply cached by one test would otherwise answer the
+    OSC 11 query another test stubs, whenever the suite runs from a terminal.
+    Patched without ``monkeypatch`` for the same reason as
+    ``_isolate_entry_points_index``.
+    """
+    cache_path = tmp_path / "terminal-background.json"
+    with patch("click_extra.color.background_cache_path", lambda: cache_path):
+        yield
+
+
 skip_windows_colors = skip_windows(reason="Click overstrip colors on Windows")
 """Skips color tests on Windows as ``click.testing.invoke`` overzealously strips colors.
 
@@ -28,10 +28,13 @@ import pytest
 from docutils import nodes
 
 from click_extra.screenshot import CAPTURE_BACKGROUND, LIGHT_CAPTURE_BACKGROUND
+from click_extra.sphinx import click as sphinx_click
 from click_extra.sphinx.click import (
     _CLIRUNNER_HAS_CAPTURE,
+    RUN_CACHE_DIR,
     SCREENSHOT_MARKER_END,
     SCREENSHOT_MARKER_START,
+    SCREENSHOT_STAMP_DIR,
     ClickRunner,
     _rewrite_screenshot_regions,
     _screenshot_background,
@@ -1384,6 +1387,154 @@ def test_click_run_screenshot_writes_the_asset(sphinx_app_myst):
     assert "papaya" in html_output
 
 
+def test_click_run_screenshot_skips_unchanged_capture(sphinx_app_myst, monkeypatch):
+    """An unchanged capture is not rendered again on the next build, unless the
+    asset on disk drifted from what the previous build wrote."""
+    document = dedent("""
+        ```{click:source}
+        from click_extra import command, echo
+
+        @command
+        def greet():
+            echo("Hello, papaya!")
+        ```
+
+        ```{click:run}
+        :screenshot: greet-cached
+        result = invoke(greet)
+        ```
+    """)
+    sphinx_app_myst.build_document(document)
+    asset = Path(sphinx_app_myst.app.srcdir) / "assets" / "greet-cached.svg"
+    stamp = (
+        Path(sphinx_app_myst.app.doctreedir)
+        / SCREENSHOT_STAMP_DIR
+        / "greet-cached.sha256"
+    )
+    assert stamp.exists()
+    svg = asset.read_text(encoding="utf-8")
+
+    renders = []
+    original_render = sphinx_click.render
+
+    def counting_render(*args, **kwargs):
+        renders.append(kwargs["unique_id"])
+        return original_render(*args, **kwargs)
+
+    monkeypatch.setattr(sphinx_click, "render", counting_render)
+
+    sphinx_app_myst.build_document(document)
+    assert renders == []
+    assert asset.read_text(encoding="utf-8") == svg
+
+    # A hand-edited asset no longer matches its stamp: it is rendered again.
+    asset.write_text("<svg/>", encoding="utf-8")
+    sphinx_app_myst.build_document(document)
+    assert renders == ["greet-cached"]
+    assert asset.read_text(encoding="utf-8") == svg
+
+
+def test_click_run_cache_reuses_unchanged_output(sphinx_app_myst, monkeypatch):
+    """With the cache on, a block is executed again only once its key changed."""
+    sphinx_app_myst.app.config.click_extra_run_cache = True
+    document = dedent("""
+        ```{click:source}
+        from click_extra import command, echo
+
+        @command
+        def greet():
+            echo("Hello, papaya!")
+        ```
+
+        ```{click:run}
+        result = invoke(greet)
+        ```
+    """)
+    html_output = sphinx_app_myst.build_document(document)
+    assert "Hello, papaya!" in html_output
+    assert list((Path(sphinx_app_myst.app.doctreedir) / RUN_CACHE_DIR).iterdir())
+
+    invocations = []
+    original_invoke = sphinx_click.ClickRunner.invoke
+
+    def counting_invoke(self, cli, *args, **kwargs):
+        invocations.append(cli.name)
+        return original_invoke(self, cli, *args, **kwargs)
+
+    monkeypatch.setattr(sphinx_click.ClickRunner, "invoke", counting_invoke)
+
+    assert sphinx_app_myst.build_document(document) == html_output
+    assert invocations == []
+
+    # Editing a block the run depends on invalidates its entry.
+    html_output = sphinx_app_myst.build_document(document.replace("papaya", "mango"))
+    assert "Hello, mango!" in html_output
+    assert invocations == ["greet"]
+
+
+def test_click_run_cache_replays_skipped_definitions(sphinx_app_myst, monkeypatch):
+    """What a cached block leaves in the namespace is there for a later block."""
+    sphinx_app_myst.app.config.click_extra_run_cache = True
+    document = dedent("""
+        ```{click:source}
+        from click_extra import command, echo
+
+        basket = []
+
+        @command
+        def greet():
+            echo("Hello, papaya!")
+        ```
+
+        ```{click:run}
+        result = invoke(greet)
+        basket.append("papaya")
+        ```
+
+        ```{click:run}
+        assert basket == ["papaya"]
+        result = invoke(greet, args=[])
+        ```
+    """)
+    sphinx_app_myst.build_document(document)
+
+    invocations = []
+    original_invoke = sphinx_click.ClickRunner.invoke
+
+    def counting_invoke(self, cli, *args, **kwargs):
+        invocations.append(cli.name)
+        return original_invoke(self, cli, *args, **kwargs)
+
+    monkeypatch.setattr(sphinx_click.ClickRunner, "invoke", counting_invoke)
+
+    # Only the last block changed: the one before it is replayed to fill the
+    # basket, its output discarded.
+    html_output = sphinx_app_myst.build_document(document.replace("args=[]", "args=()"))
+    # Once in the source block, once per run block.
+    assert html_output.count("Hello, papaya!") == 3
+    assert invocations == ["greet", "greet"]
+
+
+def test_click_run_cache_off_by_default(sphinx_app_myst):
+    """Without the opt-in, nothing is stored and every build executes."""
+    sphinx_app_myst.build_document(
+        dedent("""
+            ```{click:source}
+            from click_extra import command, echo
+
+            @command
+            def greet():
+                echo("Hello, papaya!")
+            ```
+
+            ```{click:run}
+            result = invoke(greet)
+            ```
+        """)
+    )
+    assert not (Path(sphinx_app_myst.app.doctreedir) / RUN_CACHE_DIR).exists()
+
+
 def test_click_run_screenshot_background(sphinx_app_myst):
     """``:screenshot-background:`` draws the capture on the chrome it names."""
     sphinx_app_myst.build_document(
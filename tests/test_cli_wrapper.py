@@ -24,9 +24,11 @@ from pathlib import Path
 import click
 import pytest
 
+from click_extra import cli_wrapper
 from click_extra.cli import demo
 from click_extra.cli_wrapper import (
     _config_args_for_target,
+    console_scripts_index,
     resolve_target,
     resolve_target_command,
     target_prog_name,
@@ -251,6 +253,54 @@ def test_resolve_target(script, expected_module, expected_func):
     assert function_name == expected_func
 
 
+def test_console_scripts_index_is_cached(monkeypatch, tmp_path):
+    """Entry points are enumerated once, until the environment changes."""
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr(cli_wrapper, "entry_points_index_path", lambda: index_path)
+    scans = []
+    original_entry_points = cli_wrapper.metadata.entry_points
+
+    def counting_entry_points():
+        scans.append(True)
+        return original_entry_points()
+
+    monkeypatch.setattr(cli_wrapper.metadata, "entry_points", counting_entry_points)
+
+    assert resolve_target("click-extra") == ("click_extra.__main__", "main")
+    assert index_path.is_file()
+    assert resolve_target("click-extra") == ("click_extra.__main__", "main")
+    assert len(scans) == 1
+
+    # A new sys.path entry changes the fingerprint: the index is rebuilt.
+    monkeypatch.syspath_prepend(tmp_path)
+    assert console_scripts_index()["click-extra"] == "click_extra.__main__:main"
+    assert len(scans) == 2
+
+    # So does a corrupted cache.
+    index_path.write_text("{", encoding="utf-8")
+    assert "click-extra" in console_scripts_index()
+    assert len(scans) == 3
+
+
+def test_wrap_refresh_index(invoke, monkeypatch, tmp_path):
+    """`--refresh-index` alone rebuilds a stale index and exits."""
+    index_path = tmp_path / "index.json"
+    monkeypatch.setattr(cli_wrapper, "entry_points_index_path", lambda: index_path)
+    index_path.write_text(
+        json.dumps({
+            "signature": cli_wrapper._entry_points_signature(),
+            "scripts": {"click-extra": "stale.module:main"},
+        }),
+        encoding="utf-8",
+    )
+    assert resolve_target("click-extra") == ("stale.module", "main")
+
+    result = invoke(demo, ["wrap", "--refresh-index"], color=False)
+    assert result.exit_code == 0
+    assert not result.stdout
+    assert resolve_target("click-extra") == ("click_extra.__main__", "main")
+
+
 def test_resolve_py_file(tmp_path):
     script = tmp_path / "hello.py"
     script.write_text("print('hello')")
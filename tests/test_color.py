@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
 import os
 import sys
@@ -41,8 +42,10 @@ from click_extra import (
 from click_extra.color import (
     COLOR_DISABLING_TERMS,
     COLOR_ENVVARS,
+    _cached_osc_background,
     _is_dark_rgb,
     _parse_osc_rgb,
+    _terminal_session_key,
     forced_color,
     invocation_color,
     is_a_tty,
@@ -648,11 +651,15 @@ def test_resolve_background(monkeypatch, env, expected):
     assert resolve_background() == expected
 
 
+WHITE_OSC_REPLY = b"\x1b]11;rgb:ffff/ffff/ffff\x07"
+"""OSC 11 reply of a terminal with a white background."""
+
+
 def test_resolve_background_query_is_opt_in(monkeypatch):
     """The OSC 11 query runs only when ``allow_query`` is set, below the env vars."""
     for var in ("CLITHEME", "COLORFGBG"):
         monkeypatch.delenv(var, raising=False)
-    monkeypatch.setattr(color, "query_osc_background", lambda: (255, 255, 255))
+    monkeypatch.setattr(color, "_osc_background_reply", lambda: WHITE_OSC_REPLY)
 
     # With no env signal and the query allowed, the live color decides.
     assert resolve_background(allow_query=True) == "light"
@@ -664,7 +671,7 @@ def test_resolve_background_query_below_explicit_env(monkeypatch):
     """An explicit env signal outranks the live query even when querying is allowed."""
     monkeypatch.delenv("COLORFGBG", raising=False)
     monkeypatch.setenv("CLITHEME", "dark")
-    monkeypatch.setattr(color, "query_osc_background", lambda: (255, 255, 255))
+    monkeypatch.setattr(color, "_osc_background_reply", lambda: WHITE_OSC_REPLY)
     assert resolve_background(allow_query=True) == "dark"
 
 
@@ -743,6 +750,112 @@ class _FakeStream:
         pass
 
 
+@pytest.mark.parametrize(
+    ("reply", "rgb"), ((WHITE_OSC_REPLY, (255, 255, 255)), (b"", None))
+)
+def test_osc_background_cached_per_session(monkeypatch, reply, rgb):
+    """Replies and silences alike are cached, until their TTL expires."""
+    calls = []
+
+    def query():
+        calls.append(True)
+        return reply
+
+    monkeypatch.setattr(color, "_osc_background_reply", query)
+    assert _cached_osc_background() == rgb
+    assert _cached_osc_background() == rgb
+    assert len(calls) == 1
+
+    ttl = "_BACKGROUND_CACHE_TTL" if rgb else "_SILENT_TERMINAL_CACHE_TTL"
+    monkeypatch.setattr(color, ttl, 0)
+    assert _cached_osc_background() == rgb
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("reply", (None, b"\x1b]11;garbage\x07"))
+def test_osc_background_unsent_query_not_cached(monkeypatch, reply):
+    """A query never sent, or answered with garbage, leaves the session unmarked."""
+    calls = []
+
+    def query():
+        calls.append(True)
+        return reply
+
+    monkeypatch.setattr(color, "_osc_background_reply", query)
+    assert _cached_osc_background() is None
+    assert _cached_osc_background() is None
+    assert len(calls) == 2
+    assert not color.background_cache_path().exists()
+
+
+@pytest.mark.parametrize("content", ("", "{", '{"rgb": [1, 2]}', '{"rgb": 3}'))
+def test_osc_background_corrupted_cache(monkeypatch, content):
+    """An unreadable cache entry is overwritten by a fresh query."""
+    color.background_cache_path().write_text(content)
+    monkeypatch.setattr(
+        color, "_osc_background_reply", lambda: b"\x1b]11;rgb:01/02/03\x07"
+    )
+    assert _cached_osc_background() == (1, 2, 3)
+    assert json.loads(color.background_cache_path().read_text())["rgb"] == [1, 2, 3]
+
+
+def test_osc_background_cache_outside_terminal(monkeypatch):
+    """Without a terminal session to key on, the query runs uncached."""
+    monkeypatch.setattr(color, "background_cache_path", lambda: None)
+    calls = []
+    monkeypatch.setattr(color, "query_osc_background", lambda: calls.append(True))
+    _cached_osc_background()
+    _cached_osc_background()
+    assert len(calls) == 2
+
+
+@pytest.mark.skipif(os.name != "posix", reason="tty device names are POSIX-only")
+def test_terminal_session_key(monkeypatch):
+    """The session key follows the tty and the per-window variables."""
+    import pty
+
+    monkeypatch.setattr(sys, "__stdin__", _FakeStream(0, tty=False))
+    assert _terminal_session_key() is None
+
+    try:
+        controller, worker = pty.openpty()
+    except OSError as error:  # No pty available (sandboxed or exhausted).
+        pytest.skip(f"no pseudo-terminal available: {error}")
+    try:
+        monkeypatch.setattr(sys, "__stdin__", _FakeStream(worker, tty=True))
+        monkeypatch.setenv("TERM_SESSION_ID", "one")
+        key = _terminal_session_key()
+        assert key is not None
+        assert key.startswith(os.ttyname(worker))
+        monkeypatch.setenv("TERM_SESSION_ID", "two")
+        assert _terminal_session_key() != key
+    finally:
+        os.close(controller)
+        os.close(worker)
+
+
+def test_background_query_joined_by_resolve(monkeypatch):
+    """A pending query answers every resolution until it is finished."""
+    for var in ("CLITHEME", "COLORFGBG"):
+        monkeypatch.delenv(var, raising=False)
+    calls = []
+    monkeypatch.setattr(
+        color,
+        "_osc_background_reply",
+        lambda: calls.append(True) or b"\x1b]11;rgb:00/00/00\x07",
+    )
+    color.start_background_query()
+    # Starting twice keeps the query already in flight.
+    color.start_background_query()
+    try:
+        assert resolve_background(allow_query=True) == "dark"
+        assert resolve_background(allow_query=True) == "dark"
+        assert len(calls) == 1
+    finally:
+        color.finish_background_query()
+    assert color._pending_background_query is None
+
+
 def test_query_osc_background_without_tty(monkeypatch):
     """The OSC query is a no-op when stdin or stdout is not a terminal."""
     not_a_tty = _FakeStream(0, tty=False)
@@ -31,6 +31,7 @@ import click
 import pytest
 from boltons.iterutils import flatten, unique
 from boltons.pathutils import shrinkuser
+from deepmerge import always_merger
 from extra_platforms import (
     is_macos,
     is_unix_not_macos,
@@ -54,14 +55,18 @@ from click_extra import (
     group,
     no_config_option,
     option,
+    parse_content,
     pass_context,
     search_params,
+    serialize_content,
     validate_config_option,
 )
-from click_extra.config import SQLITE_CONFIG_TABLE
+from click_extra.config import SQLITE_CONFIG_TABLE, create_sqlite_config_index
+from click_extra.config.formats import _yaml_dumper, _yaml_loader
 from click_extra.config.schema import (
     _expand_dotted_keys,
 )
+from click_extra.parameters import ParamStructure
 from click_extra.pytest import (
     default_debug_uncolored_log_end,
     default_debug_uncolored_log_start,
@@ -1235,6 +1240,64 @@ def test_format_from_mime_restricted_to_candidates():
     assert format_from_mime("application/json", [ConfigFormat.TOML]) is None
 
 
+YAML_EMITTER_CASES = (
+    pytest.param({"name": "papaya", "count": 3, "tags": ["a", None]}, id="plain"),
+    pytest.param([{"fruit": "水果 éß", "ok": True}], id="bmp"),
+    pytest.param({"emoji": "papaya 🥭"}, id="astral"),
+    pytest.param({"tab": "a\tb" * 40}, id="escaped-fold"),
+    pytest.param({"": "x" * 200}, id="empty-key"),
+    pytest.param("scalar", id="top-level-scalar"),
+)
+
+
+@pytest.fixture(params=("libyaml", "pure-python"))
+def yaml_backend(request, monkeypatch):
+    """Run a test through both PyYAML backends.
+
+    The `pure-python` run hides the C extension's classes, which is what a
+    PyYAML built without `libyaml` looks like.
+    """
+    yaml = pytest.importorskip("yaml")
+    if request.param == "libyaml":
+        if not yaml.__with_libyaml__:
+            pytest.skip("PyYAML was built without libyaml.")
+    else:
+        monkeypatch.delattr(yaml, "CFullLoader")
+        monkeypatch.delattr(yaml, "CDumper")
+    return request.param
+
+
+def test_yaml_backends_parse_alike(yaml_backend):
+    assert parse_content(ConfigFormat.YAML, YAML_FILE) == YAML_DATA
+    assert parse_content(ConfigFormat.YAML, "!!python/tuple [1, 2]") == (1, 2)
+
+
+@pytest.mark.parametrize("data", YAML_EMITTER_CASES)
+def test_yaml_backends_serialize_alike(yaml_backend, data):
+    """Whichever emitter runs, the text is the pure-Python one's."""
+    import yaml
+
+    expected = yaml.dump(
+        data, Dumper=yaml.Dumper, allow_unicode=True, default_flow_style=False
+    )
+    assert serialize_content(ConfigFormat.YAML, data) == expected
+    assert parse_content(ConfigFormat.YAML, expected) == data
+
+
+def test_yaml_libyaml_picked():
+    """The C backend is used whenever PyYAML was built with it."""
+    yaml = pytest.importorskip("yaml")
+    if not yaml.__with_libyaml__:
+        pytest.skip("PyYAML was built without libyaml.")
+
+    data = {
+        f"host-{index}": {"port": index, "tags": ["web", "db"], "debug": False}
+        for index in range(20)
+    }
+    assert _yaml_loader() is yaml.CFullLoader
+    assert _yaml_dumper(data) is yaml.CDumper
+
+
 def test_mime_types_are_unambiguous():
     """No media type is claimed by two formats.
 
@@ -1689,6 +1752,125 @@ def test_sqlite_read_and_parse_conf(tmp_path):
     assert conf == SQLITE_DATA
 
 
+@pytest.mark.parametrize("indexed", [True, False], ids=["indexed", "unindexed"])
+def test_sqlite_app_rows(invoke, tmp_path, indexed):
+    """Only the app's own sections are read from a shared store."""
+    conf_path = tmp_path / "shared.sqlite"
+    # A table keyed without a primary key, the layout the index helper is for.
+    connection = sqlite3.connect(conf_path)
+    connection.execute(f"CREATE TABLE {SQLITE_CONFIG_TABLE} (key TEXT, value TEXT)")
+    connection.commit()
+    connection.close()
+    make_sqlite_config(
+        conf_path,
+        {
+            "shared-cli": {"count": 7, "sub": {"name": "papaya"}},
+            # Same prefix, another app: must not leak into shared-cli's rows.
+            "shared-cli2": {"count": 99},
+            "old-cli": {"label": "legacy"},
+            "other-cli": {"count": 1},
+        },
+        create_table=False,
+    )
+    if indexed:
+        create_sqlite_config_index(conf_path)
+        create_sqlite_config_index(conf_path)
+        connection = sqlite3.connect(conf_path)
+        plan = connection.execute(
+            f"EXPLAIN QUERY PLAN SELECT key, value FROM {SQLITE_CONFIG_TABLE} "
+            "WHERE key = ? OR (key >= ? AND key < ?)",
+            ("a", "a.", "a/"),
+        ).fetchall()
+        connection.close()
+        assert "INDEX" in str(plan)
+
+    @click.command(name="shared-cli")
+    @option("--count", type=int, default=0)
+    @config_option(sqlite_app_rows=True, fallback_sections=("old-cli",))
+    @pass_context
+    def shared_cli(ctx, count):
+        echo(f"count={count!r}")
+        conf_full = ctx.meta["click_extra.conf_full"]
+        echo(f"conf_full={dict(sorted(conf_full.items()))}")
+
+    result = invoke(shared_cli, "--config", str(conf_path), color=False)
+    assert result.stdout == (
+        "count=7\n"
+        "conf_full={'old-cli': {'label': 'legacy'}, "
+        "'shared-cli': {'count': 7, 'sub': {'name': 'papaya'}}}\n"
+    )
+    assert result.exit_code == 0
+
+
+@pytest.mark.once
+def test_sqlite_large_store_matches_merged_branches(tmp_path):
+    """A 50k-key store built by path insertion equals the merge of its branches."""
+    data = {
+        f"app-{app}": {
+            f"section-{section}": {f"key-{key}": key for key in range(50)}
+            for section in range(20)
+        }
+        for app in range(50)
+    }
+    conf_path = make_sqlite_config(tmp_path / "large.sqlite", data)
+    connection = sqlite3.connect(conf_path)
+    rows = connection.execute(
+        f"SELECT key, value FROM {SQLITE_CONFIG_TABLE}"
+    ).fetchall()
+    connection.close()
+    assert len(rows) == 50_000
+
+    def merge_branches():
+        conf: dict = {}
+        for key, raw_value in rows:
+            conf = always_merger.merge(
+                conf,
+                ParamStructure.init_tree_dict(
+                    *key.split("."), leaf=json.loads(raw_value)
+                ),
+            )
+        return conf
+
+    loaded = ConfigOption().load_sqlite_config(conf_path)
+    assert loaded == merge_branches() == data
+
+
+@pytest.mark.once
+def test_ini_large_file_types_indexed_once(invoke, monkeypatch):
+    """A 5k-option INI file is typed from an index derived once per CLI."""
+    options = 5000
+    ini_content = "\n".join(("[big-cli]", *(f"opt_{i} = {i}" for i in range(options))))
+
+    calls = []
+    original = ParamStructure.get_param_type
+
+    def counting_get_param_type(param):
+        calls.append(param.name)
+        return original(param)
+
+    monkeypatch.setattr(
+        ParamStructure, "get_param_type", staticmethod(counting_get_param_type)
+    )
+
+    @command(
+        name="big-cli",
+        params=[click.Option([f"--opt-{i}"], type=int) for i in range(options)],
+    )
+    @pass_context
+    def big_cli(ctx, **kwargs):
+        conf_option = ConfigOption()
+        first = conf_option.load_ini_config(ini_content)
+        second = conf_option.load_ini_config(ini_content)
+        assert first == second
+        echo(sum(first["big-cli"].values()) == sum(range(options)))
+        echo(sorted(set(calls)) == sorted(f"opt_{i}" for i in range(options)))
+        echo(len(calls) == options)
+
+    result = invoke(big_cli, color=False)
+    assert result.stdout == "True\nTrue\nTrue\n"
+    assert result.exit_code == 0
+
+
 @pytest.mark.parametrize(
     "make_db",
     [
@@ -1868,6 +1868,29 @@ def test_run_config_validation_exposes_merged_conf():
     assert "unknown" not in report.merged_conf["my-cli"]
 
 
+def test_run_config_validation_skips_foreign_sections():
+    """Foreign sections are never normalized, so a dotted-key conflict outside
+    the app's entries neither raises in strict mode nor leaks into merged_conf."""
+
+    from click_extra import run_config_validation
+
+    params_template = {"my-cli": {"verbose": None, "sub": {"level": None}}}
+    report = run_config_validation(
+        {
+            "other-tool": {"a": 1, "a.b": 2},
+            "my-cli": {"verbose": True},
+            "my-cli.sub.level": 3,
+        },
+        app_name="my-cli",
+        params_template=params_template,
+        strict=True,
+    )
+    assert report.ok
+    assert report.merged_conf == {"my-cli": {"verbose": True, "sub": {"level": 3}}}
+    # The template is copied, not filled in place.
+    assert params_template == {"my-cli": {"verbose": None, "sub": {"level": None}}}
+
+
 def test_run_config_validation_collects_all_then_short_circuits():
     """collect_all=True gathers errors from every stage in order; collect_all=False
     stops after the first."""
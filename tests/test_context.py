@@ -60,11 +60,14 @@ KEY_CONSTANTS: tuple[tuple[str, str], ...] = (
     ("VERBOSITY", "click_extra.verbosity"),
     ("VERBOSE", "click_extra.verbose"),
     ("QUIET", "click_extra.quiet"),
+    ("LOG_FORMAT", "click_extra.log_format"),
     ("START_TIME", "click_extra.start_time"),
     ("JOBS", "click_extra.jobs"),
     ("TABLE_FORMAT", "click_extra.table_format"),
     ("SORT_BY", "click_extra.sort_by"),
     ("TABLE_SORT_KEY", "click_extra.table_sort_key"),
+    ("SORT_SPILL_ROWS", "click_extra.sort_spill_rows"),
+    ("TABLE_LIMIT", "click_extra.table_limit"),
     ("COLUMNS", "click_extra.columns"),
     ("THEME", "click_extra.theme.active"),
     ("THEME_OVERRIDES", "click_extra.theme.overrides"),
@@ -41,6 +41,7 @@ from click_extra import (
     Command,
     Context,
     JobsOption,
+    LaneProgress,
     command,
     context,
     echo,
@@ -488,6 +489,18 @@ def test_run_lanes_runs_lanes_concurrently():
     assert sorted(run_lanes(work, ([0], [1], [2]), jobs=3)) == [0, 1, 2]
 
 
+@pytest.mark.parametrize("jobs", (1, 3))
+def test_run_lanes_feeds_progress(jobs):
+    """Each lane is announced to the display and its worker counts every item."""
+    progress = LaneProgress(label=lambda lane: f"from {lane[0]}", enabled=False)
+    lanes = ([0, 1], [2], [3, 4, 5])
+    assert list(run_lanes(str, lanes, jobs=jobs, progress=progress)) == list("012345")
+    tallies = progress._tallies
+    assert [tally.label for tally in tallies] == ["from 0", "from 2", "from 3"]
+    assert [(tally.done, tally.total) for tally in tallies] == [(2, 2), (1, 1), (3, 3)]
+    assert all(tally.end is not None for tally in tallies)
+
+
 def test_run_lanes_sequential_is_lazy():
     """With one worker, items run lazily so a caller can stop early."""
     seen = []
@@ -959,6 +972,73 @@ def test_run_cli_streams_output_at_debug_with_label(caplog):
     )
 
 
+def test_run_cli_normalizes_line_endings():
+    r"""`\r\n` and bare `\r` come back as `\n`, as universal newlines do."""
+    code = "import sys; sys.stdout.write('a\\r\\nb\\rc\\n10%\\r100%')"
+    result = run_cli((sys.executable, "-c", code))
+    assert result.stdout == "a\nb\nc\n10%\n100%"
+
+
+def test_run_cli_max_output_rate(caplog):
+    """Lines past the per-second quota are left out of the log, and reported in
+    a summary, while the capture keeps them all."""
+    code = "for i in range(500): print(f'line {i}')"
+    with caplog.at_level(logging.DEBUG):
+        result = run_cli(
+            (sys.executable, "-c", code), label="flood", max_output_rate=10
+        )
+    assert result.stdout == "".join(f"line {i}\n" for i in range(500))
+    streamed = [
+        record.getMessage()
+        for record in caplog.records
+        if getattr(record, "label", None) == "flood"
+    ]
+    forwarded = [message for message in streamed if message.startswith("line ")]
+    summaries = [message for message in streamed if message.startswith("Suppressed ")]
+    assert forwarded[:10] == [f"line {i}" for i in range(10)]
+    assert summaries
+    suppressed = sum(int(message.split()[1]) for message in summaries)
+    assert len(forwarded) + suppressed == 500
+
+
+def test_run_cli_collapse_progress(caplog):
+    """Carriage-return redraws are collapsed; the closing line is kept."""
+    code = dedent("""\
+        import sys
+        print("start")
+        for percent in range(100):
+            sys.stdout.write(f"{percent}%\\r")
+        print("done")
+        """)
+    with caplog.at_level(logging.DEBUG):
+        result = run_cli(
+            (sys.executable, "-c", code), label="bar", collapse_progress=True
+        )
+    assert result.stdout.count("\n") == 102
+    streamed = [
+        record.getMessage()
+        for record in caplog.records
+        if getattr(record, "label", None) == "bar"
+    ]
+    assert streamed[0] == "start"
+    assert streamed[-1] == "done"
+    # The first redraw goes through, the next ones within the second do not.
+    assert streamed[1:-1] == ["0%"]
+
+
+def test_run_cli_collapse_progress_flushes_last_redraw(caplog):
+    """A bar ending on a redraw, with no closing line, still logs its last state."""
+    code = "import sys; [sys.stdout.write(f'{p}%\\r') for p in range(101)]"
+    with caplog.at_level(logging.DEBUG):
+        run_cli((sys.executable, "-c", code), label="bar", collapse_progress=True)
+    streamed = [
+        record.getMessage()
+        for record in caplog.records
+        if getattr(record, "label", None) == "bar"
+    ]
+    assert streamed == ["0%", "100%"]
+
+
 def test_highlight_bin_name():
     """Only the binary's own name is styled; its directory stays plain, whichever
     separator convention the path uses."""
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import random
 import sys
@@ -29,6 +30,7 @@ from click_extra import (
     LogLevel,
     Spinner,
     echo,
+    log_format_option,
     quiet_option,
     verbose_option,
     verbosity_option,
@@ -36,6 +38,8 @@ from click_extra import (
 from click_extra.logging import (
     DEFAULT_LEVEL,
     Formatter,
+    JSONFormatter,
+    LogFormat,
     StreamHandler,
     new_logger,
 )
@@ -747,3 +751,100 @@ def test_stream_handler_routes_through_active_spinner(capsys):
     # With no spinner running, the plain click.echo path takes over.
     handler.emit(record)
     assert capsys.readouterr().err == "WARNING: mind the spinner\n"
+
+
+def test_json_formatter_renders_compact_object(monkeypatch):
+    """One JSON object per record, unstyled, without consulting the theme."""
+
+    def no_theme():
+        raise AssertionError("JSONFormatter must not look the theme up.")
+
+    monkeypatch.setattr("click_extra.logging.get_current_theme", no_theme)
+    record = logging.LogRecord(
+        name="click_extra.execution",
+        level=logging.DEBUG,
+        pathname=__file__,
+        lineno=1,
+        msg="Warning: %s \x1b[31mapps\x1b[0m found",
+        args=("no",),
+        exc_info=None,
+    )
+    record.label = "mas"
+    rendered = JSONFormatter().format(record)
+    assert "\n" not in rendered
+    assert ", " not in rendered
+    assert json.loads(rendered) == {
+        "timestamp": record.created,
+        "level": "DEBUG",
+        "logger": "click_extra.execution",
+        "label": "mas",
+        "pid": record.process,
+        "message": "Warning: no apps found",
+    }
+
+
+def test_json_formatter_keeps_traceback():
+    try:
+        raise ValueError("bad value")
+    except ValueError:
+        record = logging.LogRecord(
+            name="test",
+            level=logging.ERROR,
+            pathname=__file__,
+            lineno=1,
+            msg="failed",
+            args=None,
+            exc_info=sys.exc_info(),
+        )
+    payload = json.loads(JSONFormatter().format(record))
+    assert payload["label"] is None
+    assert payload["exc_info"].startswith("Traceback (most recent call last):")
+    assert payload["exc_info"].endswith("ValueError: bad value")
+
+
+def test_log_format_option_json(invoke):
+    """Every line is JSON, from the first debug message of the verbosity options
+    to the last, even with `--log-format` passed after `--verbosity`."""
+
+    @click.command
+    @verbosity_option
+    @log_format_option
+    @click.pass_context
+    def json_cli(ctx):
+        assert ctx.meta["click_extra.log_format"] is LogFormat.JSON
+        logging.warning("Root logger warning")
+        logging.getLogger("run").info("streamed", extra={"label": "npm"})
+        echo("primary output")
+
+    result = invoke(json_cli, ("--verbosity", "DEBUG", "--log-format", "json"))
+    assert result.exit_code == 0
+    assert result.stdout == "primary output\n"
+    records = [json.loads(line) for line in result.stderr.splitlines()]
+    messages = [(record["level"], record["message"]) for record in records]
+    assert messages[0] == ("DEBUG", "Set <Logger click_extra (DEBUG)> to DEBUG.")
+    assert ("WARNING", "Root logger warning") in messages
+    assert ("DEBUG", "Reset <Logger click_extra (DEBUG)> to WARNING.") in messages
+    assert {
+        "level": "INFO",
+        "logger": "run",
+        "label": "npm",
+        "message": "streamed",
+    }.items() <= records[messages.index(("INFO", "streamed"))].items()
+
+    # The original formatter is back once the invocation is over.
+    assert all(
+        not isinstance(handler.formatter, JSONFormatter)
+        for handler in logging.getLogger().handlers
+    )
+
+
+def test_log_format_option_text_default(invoke):
+    @click.command
+    @verbosity_option
+    @log_format_option
+    def text_cli():
+        logging.warning("Root logger warning")
+
+    result = invoke(text_cli, color=False)
+    assert result.exit_code == 0
+    assert result.stderr == "warning: Root logger warning\n"
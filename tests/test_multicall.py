@@ -398,3 +398,35 @@ def test_version_option_deepcopy_drops_cache():
     assert "package_version" not in clone.__dict__
     # Configuration state survives the copy.
     assert clone.message == version_option.message
+
+
+def test_personality_built_once(runner, monkeypatch):
+    """Repeated dispatch to the same personality reuses one built command."""
+    kitchen = make_kitchen()
+    builds = []
+    original = type(kitchen).build_personality
+
+    def counting_build(self, name, tokens):
+        builds.append(name)
+        return original(self, name, tokens)
+
+    monkeypatch.setattr(type(kitchen), "build_personality", counting_build)
+
+    for temperature in ("200", "210"):
+        result = runner.invoke(
+            kitchen, ["--temperature", temperature], prog_name="bake", color=False
+        )
+        assert result.exit_code == 0
+        assert f"Baking at {temperature}" in result.stdout
+    assert builds == ["bake"]
+    assert kitchen.get_personality("bake", ("bake",)) is kitchen.get_personality(
+        "bake", ("bake",)
+    )
+
+    # Registering a subcommand drops the memo.
+    @kitchen.command()
+    def serve():
+        """Serve the meal."""
+
+    runner.invoke(kitchen, [], prog_name="bake", color=False)
+    assert builds == ["bake", "bake"]
@@ -29,6 +29,7 @@ import click
 import pytest
 from boltons.iterutils import flatten, unique
 from boltons.strutils import strip_ansi
+from deepmerge import always_merger
 from extra_platforms import is_windows
 
 from click_extra import (
@@ -66,6 +67,7 @@ from click_extra import (
 )
 from click_extra.config import NO_CONFIG
 from click_extra.parameters import (
+    ParamStructure,
     iter_params_for_display,
     iter_subcommands,
     make_resilient_context,
@@ -739,7 +741,7 @@ def test_integrated_show_params_option(invoke, create_config):
         ),
         (
             "show-params-cli.table_format",
-            "--table-format [aligned|asciidoc|colon-grid|csv|csv-excel|csv-excel-tab|csv-unix|double-grid|double-outline|fancy-grid|fancy-outline|github|grid|heavy-grid|heavy-outline|hjson|html|jira|json|json5|jsonc|latex|latex-booktabs|latex-longtable|latex-raw|mediawiki|mixed-grid|mixed-outline|moinmoin|orgtbl|outline|pipe|plain|presto|pretty|psql|rounded-grid|rounded-outline|rst|simple|simple-grid|simple-outline|textile|toml|tsv|unsafehtml|vertical|xml|yaml|youtrack]",
+            "--table-format [aligned|asciidoc|colon-grid|csv|csv-excel|csv-excel-tab|csv-unix|double-grid|double-outline|fancy-grid|fancy-outline|github|grid|heavy-grid|heavy-outline|hjson|html|jira|json|json5|jsonc|jsonl|latex|latex-booktabs|latex-longtable|latex-raw|mediawiki|mixed-grid|mixed-outline|moinmoin|orgtbl|outline|pipe|plain|presto|pretty|psql|rounded-grid|rounded-outline|rst|simple|simple-grid|simple-outline|textile|toml|tsv|unsafehtml|vertical|xml|yaml|youtrack]",
             "click_extra.table.TableFormatOption",
             "click_extra.types.EnumChoice",
             "str",
@@ -1263,6 +1265,53 @@ def test_columns_option_rejects_unknown_id(invoke):
     assert "Accepted:" in result.stderr
 
 
+@pytest.mark.parametrize(
+    ("entries",),
+    (
+        pytest.param([(("a", "b"), 1), (("a", "c"), 2)], id="siblings"),
+        pytest.param([(("a",), 1), (("a", "b"), 2)], id="scalar-replaced-by-dict"),
+        pytest.param([(("a", "b"), 2), (("a",), 1)], id="dict-replaced-by-scalar"),
+        pytest.param([(("a",), {"b": 1}), (("a",), {"c": 2})], id="dicts-merged"),
+        pytest.param([(("a", "b"), [1]), (("a", "b"), [2])], id="lists-appended"),
+        pytest.param([(("a", "b", "c"), None), (("a", "d"), "x")], id="deep"),
+    ),
+)
+def test_insert_tree_value_matches_merge(entries):
+    """Inserting in place lands where merging a fresh branch would."""
+    merged: dict = {}
+    inserted: dict = {}
+    for path, leaf in entries:
+        merged = always_merger.merge(
+            merged, ParamStructure.init_tree_dict(*path, leaf=leaf)
+        )
+        ParamStructure.insert_tree_value(inserted, *path, leaf=leaf)
+    assert inserted == merged
+
+
+def test_params_types_index(invoke):
+    """Every parameter path resolves to the Python types of its parameters."""
+    structure = ParamStructure()
+    structure.excluded_params = frozenset()
+    structure.included_params = None
+
+    @group
+    @option("--count", type=int)
+    @option("--name")
+    def indexed_cli(count, name):
+        echo(structure.params_types[("indexed-cli", "count")])
+        echo(structure.params_types[("indexed-cli", "name")])
+        echo(structure.params_types[("indexed-cli", "sub", "ratio")])
+
+    @indexed_cli.command()
+    @option("--ratio", type=float)
+    def sub(ratio):
+        pass
+
+    result = invoke(indexed_cli, "sub", color=False)
+    assert result.stdout == "(<class 'int'>,)\n(<class 'str'>,)\n(<class 'float'>,)\n"
+    assert result.exit_code == 0
+
+
 def test_recurse_subcommands(invoke):
     # ``help_command=False``: the auto-injected ``help`` subcommand is unrelated to
     # what this test covers (recursive parameter introspection) and is tested on its
@@ -1523,7 +1572,7 @@ def test_standalone_table_rendering(invoke, opt1, opt2, table_format):
         ],
         [
             "show-params.table_format",
-            "--table-format [aligned|asciidoc|colon-grid|csv|csv-excel|csv-excel-tab|csv-unix|double-grid|double-outline|fancy-grid|fancy-outline|github|grid|heavy-grid|heavy-outline|hjson|html|jira|json|json5|jsonc|latex|latex-booktabs|latex-longtable|latex-raw|mediawiki|mixed-grid|mixed-outline|moinmoin|orgtbl|outline|pipe|plain|presto|pretty|psql|rounded-grid|rounded-outline|rst|simple|simple-grid|simple-outline|textile|toml|tsv|unsafehtml|vertical|xml|yaml|youtrack]",
+            "--table-format [aligned|asciidoc|colon-grid|csv|csv-excel|csv-excel-tab|csv-unix|double-grid|double-outline|fancy-grid|fancy-outline|github|grid|heavy-grid|heavy-outline|hjson|html|jira|json|json5|jsonc|jsonl|latex|latex-booktabs|latex-longtable|latex-raw|mediawiki|mixed-grid|mixed-outline|moinmoin|orgtbl|outline|pipe|plain|presto|pretty|psql|rounded-grid|rounded-outline|rst|simple|simple-grid|simple-outline|textile|toml|tsv|unsafehtml|vertical|xml|yaml|youtrack]",
             "click_extra.table.TableFormatOption",
             "click_extra.types.EnumChoice",
             "str",
@@ -1749,7 +1798,7 @@ def test_standalone_no_color_rendering(invoke, opt1, opt2, opt3, table_format):
         ],
         [
             "show-params.table_format",
-            "--table-format [aligned|asciidoc|colon-grid|csv|csv-excel|csv-excel-tab|csv-unix|double-grid|double-outline|fancy-grid|fancy-outline|github|grid|heavy-grid|heavy-outline|hjson|html|jira|json|json5|jsonc|latex|latex-booktabs|latex-longtable|latex-raw|mediawiki|mixed-grid|mixed-outline|moinmoin|orgtbl|outline|pipe|plain|presto|pretty|psql|rounded-grid|rounded-outline|rst|simple|simple-grid|simple-outline|textile|toml|tsv|unsafehtml|vertical|xml|yaml|youtrack]",
+            "--table-format [aligned|asciidoc|colon-grid|csv|csv-excel|csv-excel-tab|csv-unix|double-grid|double-outline|fancy-grid|fancy-outline|github|grid|heavy-grid|heavy-outline|hjson|html|jira|json|json5|jsonc|jsonl|latex|latex-booktabs|latex-longtable|latex-raw|mediawiki|mixed-grid|mixed-outline|moinmoin|orgtbl|outline|pipe|plain|presto|pretty|psql|rounded-grid|rounded-outline|rst|simple|simple-grid|simple-outline|textile|toml|tsv|unsafehtml|vertical|xml|yaml|youtrack]",
             "click_extra.table.TableFormatOption",
             "click_extra.types.EnumChoice",
             "str",
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import sys
 import tarfile
+from collections import UserDict
 from importlib import metadata
 from operator import itemgetter
 from pathlib import Path
@@ -41,6 +42,7 @@ from click_extra.pygments import (
     _NAMED_COLORS,
     _PALETTE_256,
     _SGR_ATTR_ON,
+    _SGR_TRANSITIONS,
     DEFAULT_TOKEN_TYPE,
     EXTRA_ANSI_CSS,
     LEXER_MAP,
@@ -1064,6 +1066,55 @@ def test_lexer_resets_between_calls():
     assert tokens2 == [(Text, "plain\n")]
 
 
+def test_sgr_transitions_memo_keyed_on_true_color():
+    """Lexers with different `true_color` settings never share a transition."""
+    text = "\x1b[38;2;255;0;0mred"
+    assert next(iter(AnsiColorLexer().get_tokens(text)))[0] is Ansi.FG_ff0000
+    quantized = next(iter(AnsiColorLexer(true_color=False).get_tokens(text)))[0]
+    assert quantized is getattr(Ansi, f"C{_nearest_256(255, 0, 0)}")
+    assert next(iter(AnsiColorLexer().get_tokens(text)))[0] is Ansi.FG_ff0000
+
+
+def test_sgr_transitions_memo_overflow(monkeypatch):
+    """The memo is emptied once full, without altering the lexed tokens."""
+    text = "a\x1b[1;31mb\x1b[22mc\x1b[44md\x1b[0me\x1b[3mf"
+    expected = lex(text)
+    monkeypatch.setattr(extra_pygments, "_SGR_TRANSITIONS_MAX_SIZE", 2)
+    _SGR_TRANSITIONS.clear()
+    assert lex(text) == expected
+    assert len(_SGR_TRANSITIONS) <= 2
+
+
+def test_sgr_transitions_memo_hits(monkeypatch):
+    """Each distinct SGR transition is parsed once, however often it repeats."""
+    line = (
+        "\x1b[36m2026-10-18 12:00:00\x1b[0m \x1b[1;32mINFO\x1b[0m"
+        " \x1b[38;2;255;121;198mbuilding\x1b[39m wheel 42\n"
+    )
+    text = line * 5000
+    calls = []
+    original = AnsiColorLexer._process_sgr
+
+    def counting_process_sgr(self, params):
+        calls.append(params)
+        return original(self, params)
+
+    monkeypatch.setattr(AnsiColorLexer, "_process_sgr", counting_process_sgr)
+    _SGR_TRANSITIONS.clear()
+    tokens = list(AnsiColorLexer().get_tokens_unprocessed(text))
+    # One parse per sequence of the first line, the memo serves the others.
+    assert len(calls) == 6
+
+    class Forgetful(UserDict):
+        def get(self, key, default=None):
+            return default
+
+    monkeypatch.setattr(extra_pygments, "_SGR_TRANSITIONS", Forgetful())
+    calls.clear()
+    assert list(AnsiColorLexer().get_tokens_unprocessed(text)) == tokens
+    assert len(calls) == 6 * 5000
+
+
 # --- Style dict completeness ---
 
 
@@ -1252,6 +1303,32 @@ def test_formatter_osc8_unsafe_scheme_no_link():
     assert "click" in result
 
 
+def test_formatter_osc8_survives_sgr_reset():
+    """An SGR reset inside a hyperlink leaves the link open until its own close."""
+    formatter = AnsiHtmlFormatter(nowrap=True)
+    text = "\x1b]8;;https://example.com\x07a \x1b[31mred\x1b[0m link\x1b]8;;\x07 z"
+    result = highlight(text, AnsiColorLexer(), formatter)
+    assert result.count('<a href="https://example.com">') == 1
+    assert result.count("</a>") == 1
+    assert result.index("link") < result.index("</a>") < result.index(" z")
+
+
+def test_formatter_rgb_and_link_markers_single_pass():
+    """Link and 24-bit color markers, nested either way, all become tags."""
+    formatter = AnsiHtmlFormatter(nowrap=True)
+    text = (
+        "\x1b[38;2;255;0;0;48;2;0;0;255m\x1b]8;;https://example.com\x07both"
+        "\x1b]8;;\x07\x1b[0m \x1b]8;;https://example.org\x07\x1b[38;2;0;255;0m"
+        "green\x1b[0m\x1b]8;;\x07"
+    )
+    result = highlight(text, AnsiColorLexer(), formatter)
+    assert not any("\ue000" <= char <= "\ue0ff" for char in result)
+    assert '<span style="color: #ff0000">' in result
+    assert '<span style="background-color: #0000ff">' in result
+    assert '<span style="color: #00ff00">green</span>' in result
+    assert result.count("<a href=") == result.count("</a>") == 2
+
+
 # --- Real-world ANSI patterns ---
 #
 # Test cases inspired by:
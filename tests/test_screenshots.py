@@ -40,7 +40,7 @@ from typing import NamedTuple
 
 import pytest
 
-from click_extra import unstyle
+from click_extra import style, unstyle
 from click_extra.cli import screenshot_cmd
 from click_extra.execution import PROMPT
 from click_extra.screenshot import (
@@ -78,6 +78,7 @@ from click_extra.screenshot import (
     number_lines,
     palette_color,
     render,
+    render_digest,
     render_svg,
     trim_lines,
     window_buttons,
@@ -840,6 +841,39 @@ def test_grid_keeps_a_glyph_wider_than_the_grid():
     assert [[run for _, run, _ in row] for row in grid("\u6c34", 1)] == [["\u6c34"]]
 
 
+def test_grid_ascii_fast_path_matches_measured_path():
+    """Printable ASCII runs, sliced without measuring, lay out like the rest.
+
+    The styled run straddles the edge mid-row, and the tab forces its line back
+    onto the character-by-character path.
+    """
+    text = f"ab{style('cdefg', fg='red')}hi\tj\n\u6c34kl"
+    rows = grid(text, 4)
+    assert [[(run, column) for _, run, column in row] for row in rows] == [
+        [("ab", 0), ("cd", 2)],
+        [("efg", 0), ("h", 3)],
+        [("i\tj", 0)],
+        [("\u6c34kl", 0)],
+    ]
+
+
+def test_render_digest_addresses_the_rendering():
+    """The digest follows the text and every render option, nothing else."""
+    digest = render_digest("papaya", columns=40, background=CaptureBackground.DARK)
+    assert digest == render_digest(
+        "papaya", background=CaptureBackground.DARK, columns=40
+    )
+    assert digest != render_digest(
+        "papaya", columns=41, background=CaptureBackground.DARK
+    )
+    assert digest != render_digest(
+        "papaya", columns=40, background=CaptureBackground.LIGHT
+    )
+    assert digest != render_digest(
+        "mango", columns=40, background=CaptureBackground.DARK
+    )
+
+
 @pytest.mark.parametrize(
     ("name", "expected", "unwanted"),
     (
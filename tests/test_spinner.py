@@ -18,7 +18,9 @@ from __future__ import annotations
 
 import io
 import itertools
+import os
 import re
+import signal
 import sys
 import threading
 import time
@@ -40,13 +42,20 @@ from click_extra import (
 )
 from click_extra.cli import demo
 from click_extra.context import PROGRESS, START_TIME
+from click_extra.execution import run_lanes
 from click_extra.spinner import (
+    _MAX_FRAME_RATE,
+    _RENDERER,
+    _SLOWEST_FRAME_INTERVAL,
     _TOUR_CAP,
     _TOUR_CYCLES,
     _TOUR_MIN,
+    LaneProgress,
     OperationTrail,
     _active_line,
     _BarIndicator,
+    _FrameSchedule,
+    _line_update,
     _resolve_timer,
     _SpinnerIndicator,
     _tour_duration,
@@ -89,6 +98,45 @@ def wait_until(predicate: Callable[[], bool], timeout: float = 3.0) -> bool:
     return predicate()
 
 
+def screen(output: str) -> str:
+    """Replay ``output`` on a minimal terminal and return the text left on screen.
+
+    Live lines only rewrite the characters that changed between two frames, so a
+    full line rarely appears verbatim in the raw output. This interprets the
+    carriage returns, newlines, cursor moves (up, down, forward) and line and
+    screen clears they emit, and drops every other control sequence (colors,
+    cursor visibility).
+    """
+    rows: list[list[str]] = [[]]
+    row = column = 0
+    for token in re.split(r"(\x1b\[[0-9;?]*[a-zA-Z]|\r|\n)", output):
+        if token == "\r":
+            column = 0
+        elif token == "\n":
+            row, column = row + 1, 0
+            rows.extend([] for _ in range(row + 1 - len(rows)))
+        elif token.startswith("\x1b["):
+            count = int(token[2:-1]) if token[2:-1].isdigit() else 1
+            if token.endswith("A"):
+                row = max(row - count, 0)
+            elif token.endswith("B"):
+                row = min(row + count, len(rows) - 1)
+            elif token.endswith("C"):
+                column += count
+            elif token == CLEAR_LINE:
+                del rows[row][column:]
+            elif token == "\x1b[J":
+                del rows[row][column:]
+                del rows[row + 1 :]
+        else:
+            line = rows[row]
+            for char in token:
+                line.extend(" " * (column + 1 - len(line)))
+                line[column] = char
+                column += 1
+    return "\n".join("".join(line) for line in rows)
+
+
 def test_spinner_exported_from_root():
     assert click_extra.Spinner is Spinner
 
@@ -994,7 +1042,8 @@ def test_concurrent_spinner_eta_mode():
         assert indicator._eta_bar is not None  # A hidden bar drives the estimate.
         assert indicator._spinner.timer is False  # No elapsed clock while running.
         trail.mark(True, "feed-a fetched", seconds=0.1)
-        assert indicator._eta_bar.pos == 1  # advance() steps the hidden bar.
+        # The render tick collects the mark and steps the hidden bar.
+        assert wait_until(lambda: indicator._eta_bar.pos == 1)
         # Wait for the spinner's first frame: finish() drops its kept line when
         # the spinner has not drawn yet (matching the delay semantics), so
         # without this the summary races the render thread. The GIL usually
@@ -1095,6 +1144,8 @@ def test_progress_bar_trail_renders_bar_and_finisher():
     ) as trail:
         trail.mark(True, "feed-a fetched")
         trail.mark(False, "feed-b failed")
+        # Redraws are coalesced onto the render thread's next frame.
+        assert wait_until(lambda: "2/3" in stream.getvalue())
         trail.mark(True, "feed-c fetched")
         trail.finish(trail.ok_count == 3, f"Fetched {trail.ok_count}/3 feeds")
     output = stream.getvalue()
@@ -1122,7 +1173,7 @@ def test_progress_bar_trail_shows_empty_bar_on_entry():
         assert trail._indicator is not None and trail._indicator.shown
         assert "0/4" in stream.getvalue()
         trail.mark(True, "feed-a fetched")
-    assert "1/4" in stream.getvalue()
+        assert wait_until(lambda: "1/4" in screen(stream.getvalue()))
 
 
 def test_progress_bar_clock_defaults_to_elapsed():
@@ -1136,7 +1187,8 @@ def test_progress_bar_clock_defaults_to_elapsed():
         assert isinstance(indicator, _BarIndicator)
         assert indicator._bar is not None
         assert indicator._bar.show_eta is False  # No Click ETA.
-        assert indicator._ticker is not None  # A ticker drives the clock.
+        # The render thread ticks the clock.
+        assert indicator._tick_interval is not None
         # The elapsed clock is on screen from the start, before any outcome.
         plain = re.sub(r"\x1b\[[0-9;?]*[a-zA-Z]", "", stream.getvalue())
         assert re.search(r"0/3\s+\d\.\ds", plain)
@@ -1157,7 +1209,7 @@ def test_progress_bar_clock_eta_uses_click_eta():
         assert isinstance(indicator, _BarIndicator)
         assert indicator._bar is not None
         assert indicator._bar.show_eta is True
-        assert indicator._ticker is None
+        assert indicator._tick_interval is None
 
 
 def test_progress_bar_elapsed_clock_ticks_between_marks():
@@ -1166,14 +1218,9 @@ def test_progress_bar_elapsed_clock_ticks_between_marks():
     with OperationTrail(
         total=3, progress_bar=True, enabled=True, stream=stream, timer=True
     ):
-        # No mark is made: only the ticker moves the clock past 0.0s.
+        # No mark is made: only the render thread moves the clock past 0.0s.
         assert wait_until(
-            lambda: bool(
-                re.search(
-                    r"0/3\s+0\.[1-9]s",
-                    re.sub(r"\x1b\[[0-9;?]*[a-zA-Z]", "", stream.getvalue()),
-                )
-            )
+            lambda: bool(re.search(r"0/3\s+0\.[1-9]s", screen(stream.getvalue())))
         )
 
 
@@ -1234,11 +1281,463 @@ def test_progress_bar_and_spinner_are_mutually_exclusive():
 
 
 def test_progress_bar_registers_as_active_line_not_spinner():
-    """A drawing bar owns the active line (so logs cooperate), but is no spinner."""
+    """A drawing bar's trail owns the active line (so logs cooperate), but is no
+    spinner."""
     stream = TTYStringIO()
     with OperationTrail(total=3, progress_bar=True, stream=stream) as trail:
-        assert _active_line(stream) is trail._indicator
-        # active_spinner() skips a bar indicator: it is not a Spinner.
+        # The trail sits above its bar, to drain pending marks before a record.
+        assert _active_line(stream) is trail
+        # active_spinner() skips the trail and its bar: neither is a Spinner.
         assert active_spinner(stream) is None
-    # The trail deregisters its indicator on exit.
+    # The trail deregisters itself and its indicator on exit.
     assert _active_line(stream) is None
+
+
+@pytest.mark.parametrize(
+    ("previous", "line", "expected"),
+    (
+        # No previous frame, or an erased one: the whole line is drawn.
+        (None, "⠋ Brewing tea", "\r⠋ Brewing tea\x1b[K"),
+        # An unchanged frame writes nothing at all.
+        ("⠋ Brewing tea", "⠋ Brewing tea", ""),
+        # Only the spinning glyph changed.
+        ("⠋ Brewing tea", "⠙ Brewing tea", "\r⠙"),
+        # The glyph and the clock changed: skip the unchanged label in between.
+        ("⠋ Brewing tea (1.0s)", "⠙ Brewing tea (1.1s)", "\r⠙\x1b[16C1"),
+        # Changes separated by a short gap are rewritten in one go.
+        ("a-b", "c-d", "\rc-d"),
+        # A grown line appends its tail.
+        ("⠋ Brewing", "⠋ Brewing tea", "\r\x1b[9C tea"),
+        # A shrunk line clears past its new end.
+        ("⠋ Roasting coffee", "⠋ Roasting", "\r\x1b[10C\x1b[K"),
+        # Wide characters defeat column arithmetic: fall back to a full redraw.
+        ("🌑 Moon", "🌒 Moon", "\r🌒 Moon\x1b[K"),
+    ),
+)
+def test_line_update(previous, line, expected):
+    assert _line_update(previous, line) == expected
+    if previous is not None:
+        assert screen(previous + expected) == line
+
+
+def test_line_update_paints_each_stretch():
+    """A styled line paints every rewritten stretch, not the skipped ones."""
+    paint = Style(fg="green")
+    update = _line_update("⠋ Brewing tea (1.0s)", "⠙ Brewing tea (1.1s)", paint)
+    assert update == f"\r{paint('⠙')}\x1b[16C{paint('1')}"
+
+
+def test_line_update_replays_to_new_line():
+    """Whatever the two lines, replaying the diff leaves exactly the new one."""
+    words = ("", "a", "ab", "tea", "Brewing", "⠋", "1/10", "10/10", " ", "(2.3s)")
+    for previous, line in itertools.product(
+        (" ".join(pair) for pair in itertools.product(words, repeat=2)),
+        repeat=2,
+    ):
+        update = _line_update(previous, line)
+        assert len(update) <= len(_line_update(None, line))
+        assert screen(f"\r{previous}\x1b[K{update}") == line
+
+
+def test_static_frame_draws_once():
+    """A frame identical to the previous one writes nothing to the terminal."""
+    stream = TTYStringIO()
+    spinner = Spinner("Brewing tea", stream=stream, frames=("*",), interval=0.01)
+    spinner.start()
+    assert wait_until(lambda: spinner._drawn)
+    time.sleep(0.1)
+    spinner.stop()
+    assert stream.getvalue().count("Brewing tea") == 1
+
+
+def test_spinners_share_one_render_thread():
+    """Live lines draw from a single thread, gone once the last one stops."""
+    first = Spinner("Brewing tea", stream=TTYStringIO(), interval=0.02)
+    second = Spinner("Roasting coffee", stream=TTYStringIO(), interval=0.02)
+    with first, second:
+        assert first._thread is not None
+        assert first._thread is second._thread
+        assert wait_until(lambda: first._drawn and second._drawn)
+        thread = first._thread
+    assert wait_until(lambda: not thread.is_alive())
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork() is POSIX-only")
+@pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+def test_forked_child_gets_its_own_render_thread():
+    """A child forked mid-draw, even with the render lock held, still animates."""
+    with Spinner("Brewing tea", stream=TTYStringIO(), interval=0.02):
+        with _RENDERER._cond:
+            pid = os.fork()
+        if pid == 0:
+            drawn = False
+            try:
+                spinner = Spinner("Roasting coffee", stream=TTYStringIO())
+                spinner.start()
+                drawn = wait_until(lambda: spinner._drawn)
+                spinner.stop()
+            finally:
+                os._exit(0 if drawn else 1)
+        deadline = time.monotonic() + 10
+        while (reaped := os.waitpid(pid, os.WNOHANG))[0] == 0:
+            if time.monotonic() > deadline:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                pytest.fail("The forked child never drew its spinner.")
+            time.sleep(0.01)
+    assert os.waitstatus_to_exitcode(reaped[1]) == 0
+
+
+def test_raising_frame_retires_its_line_only(monkeypatch):
+    """A frame that raises drops its own line, not the shared render thread."""
+
+    def broken_timer(seconds: float) -> str:
+        raise RuntimeError("broken timer")
+
+    reported: list[threading.ExceptHookArgs] = []
+
+    def leave() -> None:
+        with Spinner("Broken", stream=TTYStringIO(), timer=broken_timer, interval=0.01):
+            wait_until(lambda: bool(reported))
+
+    monkeypatch.setattr(threading, "excepthook", reported.append)
+    # Leaving the block must not wait forever on a frame that never ends.
+    leaver = threading.Thread(target=leave, daemon=True)
+    leaver.start()
+    leaver.join(timeout=10)
+    assert not leaver.is_alive()
+    assert isinstance(reported[0].exc_value, RuntimeError)
+    # Later lines still get drawn.
+    spinner = Spinner("Roasting coffee", stream=TTYStringIO())
+    spinner.start()
+    assert wait_until(lambda: spinner._drawn)
+    spinner.stop()
+
+
+def test_spinner_frame_rate_is_capped():
+    """However short the interval, a spinner never exceeds the frame-rate cap."""
+    stream = TTYStringIO()
+    spinner = Spinner(stream=stream, frames=("A", "B"), interval=0.001)
+    spinner.start()
+    time.sleep(0.3)
+    spinner.stop()
+    # One extra frame of slack for scheduling jitter, plus the erasing "\r".
+    assert stream.getvalue().count("\r") <= 0.3 * _MAX_FRAME_RATE + 2
+
+
+def test_progress_bar_coalesces_redraws():
+    """A burst of marks from many workers costs a handful of redraws, not one each."""
+    stream = TTYStringIO()
+    total = 2000
+    with OperationTrail(
+        label="Crunching",
+        total=total,
+        jobs=8,
+        progress_bar=True,
+        stream=stream,
+        timer=False,
+    ) as trail:
+        indicator = trail._indicator
+        assert isinstance(indicator, _BarIndicator)
+        draws = 0
+        draw = indicator._draw
+
+        def counting_draw() -> None:
+            nonlocal draws
+            draws += 1
+            draw()
+
+        indicator._draw = counting_draw  # type: ignore[method-assign]
+        workers = [
+            threading.Thread(
+                target=lambda: [trail.mark(True, "done") for _ in range(total // 8)]
+            )
+            for _ in range(8)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert wait_until(lambda: f"{total}/{total}" in screen(stream.getvalue()))
+    assert trail.ok_count == total
+    assert draws < total / 10
+
+
+def test_frame_schedule_backs_off_on_slow_writes():
+    """Slow frame writes stretch the pace, which recovers once writes are fast."""
+    schedule = _FrameSchedule(interval=0.01, delay=0.0)
+    assert schedule.pace() == pytest.approx(1 / _MAX_FRAME_RATE)
+
+    now = 0.0
+    for _ in range(20):
+        schedule.drawn(now, cost=0.5)
+        assert schedule.due is not None
+        now = schedule.due
+    assert schedule.pace() == _SLOWEST_FRAME_INTERVAL
+
+    for _ in range(20):
+        schedule.drawn(now, cost=0.0)
+        assert schedule.due is not None
+        now = schedule.due
+    assert schedule.pace() == pytest.approx(1 / _MAX_FRAME_RATE)
+
+
+def test_frame_schedule_coalesces_requests():
+    """Requests between two frames collapse into one, no sooner than the pace."""
+    schedule = _FrameSchedule(interval=None, delay=None)
+    assert schedule.due is None
+    schedule.drawn(10.0, cost=0.0)
+    assert schedule.due is None  # Drawing on request only: nothing periodic.
+    for offset in (0.0, 0.001, 0.002):
+        schedule.request(10.0 + offset)
+    assert schedule.due == pytest.approx(10.0 + 1 / _MAX_FRAME_RATE)
+
+
+def test_slow_stream_lowers_frame_rate():
+    """A stream whose flush blocks makes the render thread draw less often."""
+
+    class SlowTTY(TTYStringIO):
+        def flush(self) -> None:
+            time.sleep(0.02)
+
+    spinner = Spinner(stream=SlowTTY(), frames=("A", "B"), interval=0.01)
+    spinner.start()
+    assert wait_until(lambda: spinner._frame_index >= 5)
+    with _RENDERER._cond:
+        pace = _RENDERER._schedules[spinner].pace()
+    spinner.stop()
+    assert pace > 1 / _MAX_FRAME_RATE
+
+
+def test_trail_lines_keep_mark_order_across_threads():
+    """Each thread's outcomes echo in the order it marked them."""
+    stream = TTYStringIO()
+    with OperationTrail(
+        total=8 * 50, jobs=8, progress_bar=True, stream=stream, timer=False
+    ) as trail:
+        workers = [
+            threading.Thread(
+                target=lambda worker=worker: [
+                    trail.mark(True, f"w{worker}-{step:02}") for step in range(50)
+                ]
+            )
+            for worker in range(8)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        trail.finish(True, "Done")
+    marked = re.findall(r"w(\d)-(\d\d)", stream.getvalue())
+    assert len(marked) == 8 * 50
+    for worker in range(8):
+        steps = [int(step) for name, step in marked if int(name) == worker]
+        assert steps == list(range(50))
+    assert trail.ok_count == 8 * 50
+
+
+def test_trail_holds_lines_behind_a_pending_mark():
+    """A line waits for an earlier mark still on its way to its lane."""
+    stream = TTYStringIO()
+    with OperationTrail(
+        total=2, progress_bar=True, stream=stream, timer=False
+    ) as trail:
+        # A worker took sequence 0, then was preempted before appending it.
+        late = next(trail._sequence)
+        trail.mark(True, "second")
+        trail._frame()
+        assert "second" not in stream.getvalue()
+        # Once the late outcome lands, both go out in the order they were taken.
+        trail._lane().pending.append((late, True, "first"))
+        trail._frame()
+        output = stream.getvalue()
+        assert output.index("first") < output.index("second")
+        trail.finish(True, "Done")
+
+
+@pytest.mark.once
+@pytest.mark.parametrize("threads", [1, 8, 64])
+def test_trail_marks_from_many_workers_all_land(threads):
+    """Every mark from 1 to 8 to 64 lock-free workers lands once, in order."""
+    marks = 6_400
+    stream = TTYStringIO()
+    with OperationTrail(
+        total=marks, jobs=threads, progress_bar=True, stream=stream, timer=False
+    ) as trail:
+        barrier = threading.Barrier(threads)
+
+        def work(worker: int) -> None:
+            barrier.wait()
+            for index in range(marks // threads):
+                trail.mark(True, f"done {worker}.{index}")
+
+        workers = [
+            threading.Thread(target=work, args=(worker,)) for worker in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        trail.finish(True, "Done")
+    assert trail.ok_count == marks
+    output = screen(stream.getvalue())
+    assert output.count(f"{OK_GLYPH} done ") == marks
+    # Each worker's own lines keep the order it marked them in.
+    for worker in range(threads):
+        indexes = [
+            int(found)
+            for found in re.findall(rf"{OK_GLYPH} done {worker}\.(\d+)", output)
+        ]
+        assert indexes == list(range(marks // threads))
+
+
+def test_trail_log_record_lands_below_pending_mark():
+    """A record logged right after a mark prints under its line, not above it."""
+    stream = TTYStringIO()
+    with OperationTrail(
+        total=2, jobs=2, progress_bar=True, stream=stream, timer=False
+    ) as trail:
+        trail.mark(False, "pkg-a failed")
+        # The logging bridge's path: the innermost live line on the stream.
+        line = _active_line(stream)
+        assert line is trail
+        line.echo("details about pkg-a")
+        trail.mark(True, "pkg-b")
+        trail.finish(False, "1/2 done")
+    output = screen(stream.getvalue())
+    failed = output.index(f"{KO_GLYPH} pkg-a failed")
+    details = output.index("details about pkg-a")
+    assert failed < details < output.index(f"{OK_GLYPH} pkg-b")
+
+
+def lane_progress(**kwargs) -> tuple[LaneProgress, list]:
+    """A display with four lanes, frozen at known states for `_block()` checks.
+
+    `apt` is done, `npm` runs fast, `pip` runs slow and `brew` waits.
+    """
+    progress = LaneProgress(unit="packages", **kwargs)
+    apt, npm, pip, brew = (
+        progress.lane([name] * total)
+        for name, total in (("apt", 2), ("npm", 10), ("pip", 10), ("brew", 4))
+    )
+    for tally, label in zip((apt, npm, pip, brew), ("apt", "npm", "pip", "brew")):
+        tally.label = label
+    apt.start, apt.end, apt.done = 0.0, 4.0, 2
+    npm.start, npm.done = 0.0, 8
+    pip.start, pip.done = 0.0, 2
+    return progress, [apt, npm, pip, brew]
+
+
+def test_lane_progress_block_lines():
+    """One line per lane: a kept ✓ line, running bars with rate and ETA, and the
+    lane expected to finish last flagged as the bottleneck."""
+    progress, _ = lane_progress()
+    lines = progress._block(now=4.0, height=24)
+    assert lines[0] == f"{OK_GLYPH} apt   2/2 packages in 4.0s  0.5/s"
+    assert lines[1].endswith(
+        "npm   [################----]  8/10 packages  2.0/s  ETA 1.0s"
+    )
+    assert lines[2].endswith(
+        "pip   [####----------------]  2/10 packages  0.5/s  ETA 16.0s  (slowest)"
+    )
+    assert lines[3] == "  brew  4 packages waiting"
+
+
+def test_lane_progress_block_folds_past_terminal_height():
+    """A block taller than the terminal lists only the running lanes."""
+    progress, _ = lane_progress()
+    lines = progress._block(now=4.0, height=3)
+    assert lines[0] == "4 lanes: 1 done, 2 running, 1 waiting"
+    assert [line.split()[1] for line in lines[1:]] == ["npm", "pip"]
+
+
+def test_lane_progress_redraws_only_changed_lanes():
+    """A second frame touches only the lane that moved, in place."""
+    stream = TTYStringIO()
+    progress, (_, npm, _, _) = lane_progress(stream=stream, enabled=True)
+    progress._mode = "live"
+    progress._draw(stream)
+    first = stream.getvalue()
+    npm.done = 9
+    progress._draw(stream)
+    update = stream.getvalue()[len(first) :]
+    # The cursor hops up to the npm row and rewrites a few characters there,
+    # instead of reprinting the four-line block.
+    assert "\x1b[" in update and "A" in update
+    assert len(update) < len(first) / 2
+    rows = screen(stream.getvalue()).splitlines()
+    assert len(rows) == 4
+    assert "9/10 packages" in rows[1]
+    assert "apt" in rows[0] and "brew" in rows[3]
+
+
+def test_lane_progress_live_run():
+    """Fed by run_lanes, the live block ends as a kept report of every lane."""
+    stream = TTYStringIO()
+
+    def work(item):
+        time.sleep(0.01)
+        return item
+
+    lanes = ([("a", n) for n in range(3)], [("b", 0)], [("c", n) for n in range(5)])
+    with LaneProgress(
+        label=lambda lane: lane[0][0], enabled=True, stream=stream
+    ) as progress:
+        assert _active_line(stream) is progress
+        results = list(run_lanes(work, lanes, jobs=3, progress=progress))
+    assert _active_line(stream) is None
+    assert len(results) == 9
+    output = stream.getvalue()
+    assert output.endswith("\n" + SHOW_CURSOR)
+    rows = screen(output).splitlines()
+    assert [row.split()[:2] for row in rows] == [
+        [OK_GLYPH, "a"],
+        [OK_GLYPH, "b"],
+        [OK_GLYPH, "c"],
+    ]
+    assert "5/5 items in" in rows[2]
+
+
+def test_lane_progress_echo_prints_above_block():
+    """A message lands above the block, which is redrawn underneath."""
+    stream = TTYStringIO()
+    progress, _ = lane_progress(stream=stream, enabled=True)
+    with progress:
+        assert wait_until(lambda: "brew" in screen(stream.getvalue()))
+        progress.echo("Mirror switched")
+        assert wait_until(lambda: "brew" in screen(stream.getvalue()))
+    rows = screen(stream.getvalue()).splitlines()
+    assert rows[0] == "Mirror switched"
+    labels = [re.findall(r"apt|npm|pip|brew", row) for row in rows[1:]]
+    assert labels == [["apt"], ["npm"], ["pip"], ["brew"]]
+
+
+def test_lane_progress_summary_lines_off_tty():
+    """Off a terminal, the display degrades to periodic plain summary lines."""
+    stream = io.StringIO()
+
+    def work(item):
+        time.sleep(0.05)
+        return item
+
+    with LaneProgress(summary_interval=0.1, stream=stream) as progress:
+        list(run_lanes(work, ([1, 2, 3, 4], [5, 6, 7, 8]), jobs=2, progress=progress))
+    output = stream.getvalue()
+    assert "\x1b" not in output and "\r" not in output
+    lines = output.splitlines()
+    assert len(lines) >= 2
+    assert re.match(r"2 lanes: \d done, \d running, 0 waiting", lines[0])
+    assert re.search(r"lane 1 \d/4 items \(\d+\.\d/s", output)
+    # The closing line reports the finished run.
+    assert lines[-1] == "2 lanes: 2 done, 0 running, 0 waiting"
+
+
+@pytest.mark.parametrize(
+    ("stream", "enabled"), ((io.StringIO(), None), (TTYStringIO(), False))
+)
+def test_lane_progress_quiet_runs(stream, enabled):
+    """A run shorter than one summary interval, or a disabled display, is silent."""
+    with LaneProgress(stream=stream, enabled=enabled) as progress:
+        list(run_lanes(str, ([1], [2]), jobs=2, progress=progress))
+    assert stream.getvalue() == ""
+    assert all(tally.end is not None for tally in progress._tallies)
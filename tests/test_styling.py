@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import importlib.metadata
 import textwrap
+import tracemalloc
 
 import click
 import cloup
@@ -28,12 +29,16 @@ from boltons.strutils import strip_ansi
 from click_extra import Style
 from click_extra.styling import (
     _nearest_256,
+    _quantize_color,
     ansi_to_html,
+    ansi_to_html_stream,
     ansi_to_jira,
     ansi_to_latex,
     ansi_to_textile,
     render_ansi,
+    render_ansi_stream,
     split_ansi,
+    split_ansi_stream,
     supports_truecolor,
     wrap_ansi,
 )
@@ -381,15 +386,16 @@ def test_contrast_ratio_requires_both_fgs():
 # --- 10. __eq__ / __hash__ --------------------------------------------------
 
 
-def test_eq_ignores_style_kwargs_cache():
-    """Equality must not depend on cloup's lazy ``_style_kwargs`` cache."""
+def test_eq_ignores_compiled_sgr_cache():
+    """Equality must not depend on the escape sequences compiled on first call."""
     a = Style(fg="red")
     b = Style(fg="red")
-    a("trigger")  # primes a's _style_kwargs
-    assert b._style_kwargs is None
-    assert a._style_kwargs is not None
+    a("trigger")  # compiles a's escape sequences
+    assert "_sgr_cache" not in b.__dict__
+    assert "_sgr_cache" in a.__dict__
     assert a == b
     assert hash(a) == hash(b)
+    assert a.to_dict() == b.to_dict()
 
 
 def test_eq_with_cloup_style():
@@ -456,8 +462,8 @@ def test_style_call_leaves_named_and_indexed_colors(monkeypatch, colorterm):
 def test_style_call_cache_survives_depth_flip(monkeypatch):
     """The same style renders correctly when truecolor flips between calls.
 
-    Quantizing on a transient copy must not poison cloup's lazy
-    ``_style_kwargs`` cache on the shared (often singleton) style instance.
+    Escape sequences are compiled per color depth, so the quantized ones must
+    not shadow the truecolor ones on the shared (often singleton) style instance.
     """
     style = Style(fg="#ff0000")
     index = _nearest_256(255, 0, 0)
@@ -472,6 +478,58 @@ def test_style_call_cache_survives_depth_flip(monkeypatch):
     assert style("X") == "\x1b[38;2;255;0;0mX\x1b[0m"
 
 
+@pytest.mark.parametrize("colorterm", ("truecolor", "256"))
+@pytest.mark.parametrize(
+    "style",
+    (
+        Style(),
+        Style(fg="#ff0000", bg=(0, 0, 255), bold=True, italic=False),
+        Style(fg="bright_cyan", dim=True, underline=True, strikethrough=True),
+        Style(fg=200, overline=True, blink=True, reverse=True),
+        Style(fg="green", text_transform=str.upper),
+    ),
+)
+def test_style_call_matches_click_style(monkeypatch, colorterm, style):
+    """Compiled escape sequences render like a direct click.style() call."""
+    monkeypatch.setenv("COLORTERM", colorterm)
+    truecolor = colorterm == "truecolor"
+    expected = click.style(
+        style.text_transform("X") if style.text_transform else "X",
+        fg=style.fg if truecolor else _quantize_color(style.fg),
+        bg=style.bg if truecolor else _quantize_color(style.bg),
+        bold=style.bold,
+        dim=style.dim,
+        underline=style.underline,
+        overline=style.overline,
+        italic=style.italic,
+        blink=style.blink,
+        reverse=style.reverse,
+        strikethrough=style.strikethrough,
+    )
+    # Twice: the second call is served by the compiled sequences.
+    assert style("X") == expected
+    assert style("X") == expected
+
+
+def test_style_call_compiles_once(monkeypatch):
+    """Styling many fragments renders the escape sequences once per color depth."""
+    style = Style(fg="#ff79c6", bold=True, underline=True)
+    calls = []
+    original = click.style
+
+    def counting_style(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(click, "style", counting_style)
+    for colorterm in ("256", "truecolor"):
+        monkeypatch.setenv("COLORTERM", colorterm)
+        for index in range(5000):
+            assert style(f"fragment-{index}").endswith(f"fragment-{index}\x1b[0m")
+    # An opening and a closing sequence per depth.
+    assert len(calls) == 4
+
+
 # --- 12. Upstream Click color handling ---------------------------------------
 
 
@@ -623,6 +681,102 @@ def test_render_ansi_splits_runs_at_newlines():
     assert result == "<two>\n<lines>"
 
 
+STREAMED_TEXT = (
+    "plain \x1b[31mred\x1b[0m mid \x1b[1;4mbold\nunderline\x1b[22m under"
+    "\x1b[0m \x1b[38;2;255;121;198mpink\x1b[m \x1b]8;;https://example.com"
+    "\x1b\\link\x1b]8;;\x1b\\ \x1b[38;5;42mgreen\x1b[2K\n\x1b[0mend\n"
+)
+
+
+def _merge_runs(runs):
+    """Merge consecutive runs sharing a style, as chunking may split them."""
+    merged = []
+    for style, run in runs:
+        if merged and merged[-1][0] == style:
+            merged[-1] = (style, merged[-1][1] + run)
+        else:
+            merged.append((style, run))
+    return merged
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_split_ansi_stream_matches_split_ansi(size):
+    """Chunk boundaries cutting through escapes do not change the runs."""
+    chunks = [
+        STREAMED_TEXT[index : index + size]
+        for index in range(0, len(STREAMED_TEXT), size)
+    ]
+    assert _merge_runs(split_ansi_stream(chunks)) == _merge_runs(
+        split_ansi(STREAMED_TEXT)
+    )
+
+
+def test_split_ansi_stream_split_string_terminator():
+    r"""An OSC 8 marker cut between the `ESC` and `\` of its terminator."""
+    chunks = ["a\x1b]8;;https://example.com\x1b", "\\b\x1b]8;;\x1b", "\\c"]
+    assert list(split_ansi_stream(chunks)) == [
+        (Style(), "a"),
+        (Style(), "b"),
+        (Style(), "c"),
+    ]
+
+
+def test_split_ansi_stream_unterminated_tail():
+    """An escape still open when the stream ends is flushed as split_ansi does."""
+    for chunks in (["a\x1b[3", "1"], ["a\x1b["], ["a\x1b]8;;x"]):
+        assert _merge_runs(split_ansi_stream(chunks)) == list(
+            split_ansi("".join(chunks))
+        )
+
+
+@pytest.mark.parametrize("size", [1, 4, 9, 1000])
+def test_render_ansi_stream_matches_render_ansi(size):
+    chunks = (
+        STREAMED_TEXT[index : index + size]
+        for index in range(0, len(STREAMED_TEXT), size)
+    )
+
+    def emitter(style, run):
+        return f"<{run}>"
+
+    assert "".join(render_ansi_stream(chunks, emitter)) == render_ansi(
+        STREAMED_TEXT, emitter
+    )
+
+
+def test_ansi_to_html_stream_matches_ansi_to_html():
+    chunks = STREAMED_TEXT.splitlines(keepends=True)
+    assert "".join(ansi_to_html_stream(chunks)) == ansi_to_html(STREAMED_TEXT)
+
+
+@pytest.mark.once
+def test_ansi_to_html_stream_memory():
+    """Converting a large capture holds memory to a few chunks."""
+    line = (
+        click.style("2026-10-18 12:00:00", fg="cyan")
+        + " "
+        + click.style("INFO", fg="green", bold=True)
+        + " building wheel for package 42\n"
+    )
+    chunk = line * 500
+    count = 40
+    size = len(chunk) * count
+
+    # Warm the module-level memos, so only the conversion itself is traced.
+    for _ in ansi_to_html_stream([chunk]):
+        pass
+
+    tracemalloc.start()
+    try:
+        for _ in ansi_to_html_stream(chunk for _ in range(count)):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < size / 20
+
+
 # --- 15. wrap_ansi() ---------------------------------------------------------
 
 WRAP_TEXT = "A very long note about the weather that will certainly need wrapping."
@@ -18,6 +18,8 @@ from __future__ import annotations
 
 import csv
 import json
+import tempfile
+import tracemalloc
 from pathlib import PurePosixPath
 
 import hjson
@@ -37,29 +39,42 @@ TABULATE_HAS_COLON_GRID = "colon_grid" in tabulate_formats
 
 from click_extra import (
     Color,
+    ConfigFormat,
     columns_option,
     command,
     echo,
     group,
+    limit_option,
     option,
     option_group,
     pass_context,
+    serialize_content,
     sort_by_option,
     style,
     table_format_option,
 )
 from click_extra.pytest import command_decorators
 from click_extra.table import (
+    RECORD_KEY,
     SERIALIZATION_FORMATS,
     STYLED_FORMATS,
     WRAPPABLE_FORMATS,
+    XML_ROOT_KEY,
     ColumnsOption,
     ColumnSpec,
     SortByOption,
+    TableData,
     TableFormat,
     _apply_default,
     _column_sort_key,
+    _external_sort,
+    _iter_json_chunks,
+    _iter_xml_chunks,
+    _iter_xml_records,
+    _row_sort_key,
+    _rows_as_dicts,
     _setup_tabulate,
+    _sort_rows,
     _strip_none,
     _visible_width,
     column_sort_key,
@@ -99,6 +114,7 @@ def test_table_formats_definition():
         ("JSON", "json"),
         ("JSON5", "json5"),
         ("JSONC", "jsonc"),
+        ("JSONL", "jsonl"),
         ("TOML", "toml"),
         ("XML", "xml"),
         ("YAML", "yaml"),
@@ -152,7 +168,7 @@ def test_unrecognized_format(invoke, cmd_decorator, cmd_type):
         "Error: Invalid value for '--table-format': 'random' is not one of "
         "'aligned', 'asciidoc', 'colon-grid', 'csv', 'csv-excel', 'csv-excel-tab', "
         "'csv-unix', 'double-grid', 'double-outline', 'fancy-grid', 'fancy-outline', 'github', "
-        "'grid', 'heavy-grid', 'heavy-outline', 'hjson', 'html', 'jira', 'json', 'json5', 'jsonc', 'latex', "
+        "'grid', 'heavy-grid', 'heavy-outline', 'hjson', 'html', 'jira', 'json', 'json5', 'jsonc', 'jsonl', 'latex', "
         "'latex-booktabs', 'latex-longtable', 'latex-raw', 'mediawiki', 'mixed-grid', "
         "'mixed-outline', 'moinmoin', 'orgtbl', 'outline', 'pipe', 'plain', 'presto', "
         "'pretty', 'psql', 'rounded-grid', 'rounded-outline', 'rst', 'simple', "
@@ -353,6 +369,12 @@ json5_table = json_table
 
 jsonc_table = json_table
 
+jsonl_table = """\
+{"Day": 1, "Temperature": 42.9}
+{"Day": 2, "Temperature": null}
+{"Day": "Friday", "Temperature": "Hot 🥵"}
+"""
+
 jira_table = """\
 || Day    || Temperature ||
 | 1      | 42.9        |
@@ -678,6 +700,7 @@ expected_renderings = {
     TableFormat.JSON: json_table,
     TableFormat.JSON5: json5_table,
     TableFormat.JSONC: jsonc_table,
+    TableFormat.JSONL: jsonl_table,
     TableFormat.LATEX: latex_table,
     TableFormat.LATEX_BOOKTABS: latex_booktabs_table,
     TableFormat.LATEX_LONGTABLE: latex_longtable_table,
@@ -962,6 +985,143 @@ def test_serialize_json_compatible(table_format, data):
     assert json.loads(result) == data
 
 
+SERIALIZER_CASES = (
+    pytest.param([], ("A",), id="empty"),
+    pytest.param([[1, 42.9], [2, None]], ("Day", "Temp"), id="numbers"),
+    pytest.param([[None, None]], ("A", "B"), id="all-null"),
+    pytest.param([["a\n\tb", "<&>\"'"]], ("x y", "9 lives"), id="escapes"),
+    pytest.param([["\x1b[31mé\x1b[0m", "🥵\u2028"]], ("A", None), id="unicode"),
+    pytest.param([[True, "v"], ["w", ""]], None, id="no-headers"),
+    pytest.param([[]], (), id="empty-row"),
+)
+
+
+@pytest.mark.parametrize(("rows", "headers"), SERIALIZER_CASES)
+def test_streaming_serializers_match_one_shot(rows, headers):
+    """Record-by-record JSON and XML are byte-identical to whole-document ones."""
+    json_document = serialize_content(ConfigFormat.JSON, _rows_as_dicts(rows, headers))
+    assert "".join(_iter_json_chunks(rows, headers)) == json_document
+    assert "".join(_iter_json_chunks(iter(rows), headers)) == json_document
+
+    xml_document = serialize_content(
+        ConfigFormat.XML,
+        {XML_ROOT_KEY: {RECORD_KEY: list(_iter_xml_records(rows, headers))}},
+    )
+    assert "".join(_iter_xml_chunks(rows, headers)) == xml_document
+
+
+@pytest.mark.parametrize(
+    "table_format", [TableFormat.JSON, TableFormat.XML, TableFormat.CSV]
+)
+def test_print_table_streams_serializations(table_format, capsys):
+    """print_table() writes records as rows arrive, to the rendered bytes."""
+    rows = [["a", "1"], ["b", None]]
+    expected = render_table(rows, ("Letter", "Number"), table_format=table_format)
+    seen = []
+
+    def lazy_rows():
+        for row in rows:
+            # Everything written so far precedes the row being pulled.
+            seen.append(capsys.readouterr().out)
+            yield row
+
+    print_table(lazy_rows(), ("Letter", "Number"), table_format=table_format)
+    seen.append(capsys.readouterr().out)
+    assert "".join(seen) == expected
+    assert "a" not in seen[0]
+    assert "a" in seen[1]
+
+
+@pytest.mark.parametrize(
+    "table_format",
+    sorted(WRAPPABLE_FORMATS - {TableFormat.VERTICAL}, key=lambda f: f.value),
+)
+@pytest.mark.parametrize("headers", (("Letter", "Number"), None))
+def test_print_table_pager_windows_match_render(
+    table_format, headers, monkeypatch, capsys
+):
+    """Windows fed to the pager join into the one-shot rendering."""
+    monkeypatch.setattr("click_extra.table.PAGER_WINDOW_ROWS", 2)
+    rows = [["a long cell", "1"], ["b", "2 two"], ["c", None], ["d", "4"], ["e", "5"]]
+    print_table(rows, headers, table_format=table_format, pager=True)
+    expected = render_table(rows, headers, table_format=table_format)
+    assert capsys.readouterr().out == expected + "\n"
+
+
+def test_print_table_pager_streams_windows(monkeypatch, capsys):
+    """The first window reaches the pager before later rows are pulled."""
+    monkeypatch.setattr("click_extra.table.PAGER_WINDOW_ROWS", 2)
+
+    seen = []
+
+    def rows():
+        yield ["apple", "1"]
+        assert capsys.readouterr().out == ""
+        yield ["banana", "2"]
+        yield ["cherry", "3"]
+        seen.append(capsys.readouterr().out)
+        assert "banana" in seen[0]
+        assert "cherry" not in seen[0]
+        yield ["a much longer fruit", "4"]
+
+    print_table(rows(), ("Fruit", "Count"), table_format=TableFormat.PSQL, pager=True)
+    seen.append(capsys.readouterr().out)
+    lines = "".join(seen).splitlines()
+    # Later rows wrap within the widths measured on the first window.
+    assert {len(line) for line in lines} == {18}
+    assert "| a much | 4     |" in lines
+
+
+@pytest.mark.parametrize(
+    "table_format",
+    (TableFormat.CSV, TableFormat.JSON, TableFormat.JSONL, TableFormat.XML),
+)
+def test_print_table_pager_serializations(table_format, capsys):
+    """Streamed serializations reach the pager byte for byte."""
+    rows = [["a", "1"], ["b", None]]
+    print_table(rows, ("Letter", "Number"), table_format=table_format, pager=True)
+    expected = render_table(rows, ("Letter", "Number"), table_format=table_format)
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    (
+        pytest.param([{"a": 1}, [1, 2]], '{"a": 1}\n[1, 2]\n', id="list"),
+        pytest.param(iter([{"a": "é"}]), '{"a": "é"}\n', id="iterator"),
+        pytest.param({"a": PurePosixPath("/tmp")}, '{"a": "/tmp"}\n', id="single"),
+        pytest.param([], "", id="empty"),
+    ),
+)
+def test_serialize_jsonl(data, expected):
+    """JSON Lines holds one document per record, applying the default hook."""
+    assert serialize_data(data, TableFormat.JSONL) == expected
+
+
+def test_print_data_jsonl_streams(capsys):
+    """print_data() emits each JSON Lines record before pulling the next one."""
+
+    def records():
+        yield {"id": 1}
+        assert capsys.readouterr().out == '{"id": 1}\n'
+        yield {"id": 2}
+
+    print_data(records(), TableFormat.JSONL)
+    assert capsys.readouterr().out == '{"id": 2}\n'
+
+
+def test_print_table_jsonl_streams(capsys):
+    """print_table() writes JSON Lines rows as an iterator yields them."""
+
+    def rows():
+        yield [style("a", fg=Color.red), "1"]
+        assert capsys.readouterr().out == '{"Letter": "a", "Number": "1"}\n'
+        yield ["b", None]
+
+    print_table(rows(), ("Letter", "Number"), table_format=TableFormat.JSONL)
+    assert capsys.readouterr().out == '{"Letter": "b", "Number": null}\n'
+
+
 @pytest.mark.parametrize(
     ("table_format", "data", "loader"),
     (
@@ -1481,6 +1641,20 @@ def test_sort_by_option_wires_context(invoke):
     assert [r["Fruit"] for r in parsed] == ["apple", "banana", "cherry"]
 
 
+def test_context_print_table_takes_lazy_rows_and_limit(invoke):
+    """ctx.print_table forwards a row generator and `limit` to print_table."""
+
+    @command
+    @table_format_option
+    @pass_context
+    def cli(ctx):
+        ctx.print_table(((str(n),) for n in range(100)), ("Number",), limit=3)
+
+    result = invoke(cli, "--table-format", "csv", color=False)
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["Number", "0", "1", "2"]
+
+
 def test_print_table_from_subcommand_context(invoke):
     """A group-level --table-format reaches ctx.print_table in subcommands.
 
@@ -1597,6 +1771,256 @@ def test_sort_by_option_decorator(invoke):
     assert [r["Fruit"] for r in parsed] == ["apple", "banana", "cherry"]
 
 
+@pytest.mark.parametrize("limit", [None, 0, 1, 3, 5, 6, 100])
+def test_sort_rows_partial_matches_full(limit):
+    """The heap-based partial sort yields the head of the stable full sort."""
+    rows = [
+        ["b", "1"],
+        [style("A", fg=Color.red), "2"],
+        ["c", "3"],
+        ["a", "4"],
+        ["B", "5"],
+        [None, "6"],
+    ]
+    key = _row_sort_key((0,))
+    expected = sorted(rows, key=key)
+    if limit is not None:
+        expected = expected[:limit]
+    assert _sort_rows(rows, key, limit) == expected
+    # Unsorted tables are truncated in their original order.
+    assert _sort_rows(rows, None, limit) == rows[:limit]
+
+
+@pytest.mark.parametrize("spill_rows", [1, 2, 3, 7, 8, 100])
+def test_external_sort_matches_sorted(spill_rows, monkeypatch):
+    """Spilled runs merge back into the stable in-memory sort order."""
+    rows = [[f"k{i % 5}", str(i)] for i in range(7, -1, -1)]
+    key = _row_sort_key((0,))
+
+    spill_files = []
+    temporary_file = tempfile.TemporaryFile
+
+    def tracked_temporary_file():
+        spill_file = temporary_file()
+        spill_files.append(spill_file)
+        return spill_file
+
+    monkeypatch.setattr(tempfile, "TemporaryFile", tracked_temporary_file)
+
+    result = list(_external_sort(iter(rows), key, spill_rows))
+    assert result == sorted(rows, key=key)
+    # A single run stays in memory, anything larger spills every run.
+    expected_runs = 0 if len(rows) < spill_rows else -(-len(rows) // spill_rows)
+    assert len(spill_files) == expected_runs
+    assert all(spill_file.closed for spill_file in spill_files)
+
+
+def test_sort_by_spill_streams_csv(invoke):
+    """A spilling --sort-by streams an iterator of rows to CSV output."""
+    data = [[f"fruit{i:02}", style(str(i), fg=Color.red)] for i in range(20, 0, -1)]
+    consumed = []
+
+    def rows():
+        for row in data:
+            consumed.append(row)
+            yield row
+
+    @command
+    @sort_by_option(("Fruit", "fruit"), ("Count", "count"), spill_rows=6)
+    @pass_context
+    def cli(ctx):
+        ctx.print_table(rows(), ("Fruit", "Count"))
+
+    result = invoke(cli, "--table-format", "csv-unix", "--sort-by", "fruit")
+    assert result.exit_code == 0
+    assert len(consumed) == len(data)
+    lines = result.stdout.splitlines()
+    assert lines[0] == '"Fruit","Count"'
+    assert lines[1:] == [f'"fruit{i:02}","{i}"' for i in range(1, 21)]
+
+    # Formats measuring column widths get the merged rows materialized.
+    result = invoke(cli, "--table-format", "json", "--sort-by", "fruit")
+    assert result.exit_code == 0
+    assert [r["Fruit"] for r in json.loads(result.stdout)] == [
+        f"fruit{i:02}" for i in range(1, 21)
+    ]
+
+
+def test_sort_by_spill_rows_validation():
+    """The spill threshold must be a positive row count."""
+    with pytest.raises(ValueError, match="spill_rows"):
+        SortByOption(("Fruit", "fruit"), spill_rows=0)
+
+
+def test_row_sort_key_ignores_ansi():
+    """Styled and plain cells of the same text collate together."""
+    key = _row_sort_key((0, 1))
+    assert key([style("Apple", fg=Color.red), None]) == key(["apple", ""])
+
+
+def test_limit_option_truncates_sorted_rows(invoke):
+    """--limit keeps the first rows of the --sort-by order."""
+
+    @command
+    @sort_by_option(("Fruit", "fruit"), ("Count", "count"))
+    @limit_option
+    @pass_context
+    def cli(ctx):
+        data = [["banana", "3"], ["apple", "1"], ["cherry", "2"], ["date", "4"]]
+        ctx.print_table(data, ("Fruit", "Count"))
+
+    result = invoke(cli, "--table-format", "json", "--sort-by", "count", "--limit", "2")
+    assert result.exit_code == 0
+    assert [r["Fruit"] for r in json.loads(result.stdout)] == ["apple", "cherry"]
+
+    result = invoke(cli, "--table-format", "json", "--sort-by", "fruit")
+    assert result.exit_code == 0
+    assert len(json.loads(result.stdout)) == 4
+
+    result = invoke(cli, "--limit", "-1")
+    assert result.exit_code == 2
+
+
+FRUIT_COLUMNS = (
+    ColumnSpec("fruit", "Fruit"),
+    ColumnSpec("count", "Count"),
+    ColumnSpec("notes", "Notes"),
+)
+
+FRUIT_ROWS = [
+    ["banana", "3", None],
+    [style("apple", fg=Color.red), "1", "crisp"],
+    ["cherry", "2", "🍒"],
+]
+
+
+def test_table_data_reads_like_rows():
+    """A columnar table iterates, indexes and slices like its rows."""
+    table = TableData.from_rows(FRUIT_COLUMNS, FRUIT_ROWS)
+    assert len(table) == 3
+    assert list(table) == [tuple(row) for row in FRUIT_ROWS]
+    assert table[-1] == ("cherry", "2", "🍒")
+    assert list(table[1:]) == [tuple(row) for row in FRUIT_ROWS[1:]]
+    with pytest.raises(IndexError):
+        table[3]
+
+    empty = TableData.from_rows(FRUIT_COLUMNS, [])
+    assert len(empty) == 0
+    assert list(empty) == []
+    assert empty.visible_widths == (0, 0, 0)
+
+    with pytest.raises(ValueError, match="different lengths"):
+        TableData(FRUIT_COLUMNS[:2], [("a", "b"), ("c",)])
+    with pytest.raises(ValueError, match="column definitions"):
+        TableData(FRUIT_COLUMNS, [("a",)])
+
+
+def test_table_data_measures_once_and_shares_columns():
+    """Derived tables share cells and carry the per-column measurements."""
+    table = TableData.from_rows(FRUIT_COLUMNS, FRUIT_ROWS)
+    assert table.visible_widths == (6, 1, 5)
+    assert table.ansi_flags == (True, False, False)
+
+    projected = table.select(["notes", "fruit"])
+    assert [c.id for c in projected.columns] == ["notes", "fruit"]
+    assert projected.data[0] is table.data[2]
+    assert projected.visible_widths == (5, 6)
+    assert table.select(None) is table
+    with pytest.raises(KeyError):
+        table.select(["unknown"])
+
+    reordered = table.take([2, 0, 1])
+    assert reordered[0] == tuple(FRUIT_ROWS[2])
+    assert reordered._widths is table._widths
+
+    stripped = table.strip_ansi()
+    assert stripped[1][0] == "apple"
+    # Only the column carrying escape sequences is rebuilt.
+    assert stripped.data[0] is not table.data[0]
+    assert stripped.data[1] is table.data[1]
+    assert stripped.strip_ansi() is stripped
+
+
+@pytest.mark.parametrize(
+    "table_format",
+    [
+        TableFormat.ROUNDED_OUTLINE,
+        TableFormat.CSV,
+        TableFormat.JSON,
+        TableFormat.HTML,
+        TableFormat.VERTICAL,
+    ],
+)
+@pytest.mark.parametrize("max_column_widths", [None, [4, "auto", None]])
+def test_table_data_renders_like_rows(table_format, max_column_widths):
+    """render_table() output is the same for columnar and row-major input."""
+    labels = [c.label for c in FRUIT_COLUMNS]
+    expected = render_table(
+        FRUIT_ROWS,
+        labels,
+        table_format=table_format,
+        max_column_widths=max_column_widths,
+    )
+    table = TableData.from_rows(FRUIT_COLUMNS, FRUIT_ROWS)
+    assert (
+        render_table(
+            table, table_format=table_format, max_column_widths=max_column_widths
+        )
+        == expected
+    )
+
+
+def test_table_data_sort_by_and_limit(invoke):
+    """A columnar table plugs into --sort-by and --limit through its columns."""
+
+    @command
+    @sort_by_option(columns=FRUIT_COLUMNS)
+    @limit_option
+    @pass_context
+    def cli(ctx):
+        ctx.print_table(TableData.from_rows(FRUIT_COLUMNS, FRUIT_ROWS))
+
+    result = invoke(cli, "--table-format", "json", "--sort-by", "count", "--limit", "2")
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == [
+        {"Fruit": "apple", "Count": "1", "Notes": "crisp"},
+        {"Fruit": "cherry", "Count": "2", "Notes": "🍒"},
+    ]
+
+
+@pytest.mark.once
+def test_table_data_memory_footprint():
+    """Columnar storage of 1M cells costs less than the row-major lists."""
+    column_count, row_count = 10, 100_000
+    cells = [f"cell-{i}" for i in range(row_count)]
+    columns = tuple(ColumnSpec(f"c{i}", f"C{i}") for i in range(column_count))
+
+    def retained(build):
+        """Memory still held by what `build` returns."""
+        tracemalloc.start()
+        try:
+            kept = build()
+            return tracemalloc.get_traced_memory()[0], kept
+        finally:
+            tracemalloc.stop()
+
+    rows_size, rows = retained(lambda: [[cell] * column_count for cell in cells])
+    table_size, table = retained(lambda: TableData(columns, [cells] * column_count))
+    assert len(rows) * column_count == len(table) * column_count == 1_000_000
+    assert table_size < rows_size * 0.6
+
+    sorted_size, _ = retained(lambda: table.take(reversed(range(row_count))))
+    assert sorted_size < rows_size * 0.6
+
+
+def test_render_table_limit_skips_measuring_dropped_rows():
+    """Rows past the limit never reach column width resolution."""
+    rows = [["short"], ["x" * 200]]
+    output = render_table(rows, ["Col"], table_format=TableFormat.PLAIN, limit=1)
+    assert "x" not in output
+    assert max(len(line) for line in output.splitlines()) < 20
+
+
 def test_sort_by_option_decorator_in_option_group(invoke):
     """The sort_by_option decorator composes with @option_group."""
 
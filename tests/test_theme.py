@@ -22,6 +22,7 @@ import dataclasses
 import logging
 import re
 import sys
+import threading
 from pathlib import Path
 from textwrap import dedent
 
@@ -779,7 +780,9 @@ def test_resolve_auto_theme_forwards_query_flag(monkeypatch):
     """``query_background`` gates the live query that env-var detection ignores."""
     for var in ("CLITHEME", "COLORFGBG"):
         monkeypatch.delenv(var, raising=False)
-    monkeypatch.setattr(color, "query_osc_background", lambda: (255, 255, 255))
+    monkeypatch.setattr(
+        color, "_osc_background_reply", lambda: b"\x1b]11;rgb:ffff/ffff/ffff\x07"
+    )
 
     # With the query allowed, the live light background wins.
     assert resolve_auto_theme(query_background=True) is BUILTIN_THEMES["light"]
@@ -787,6 +790,132 @@ def test_resolve_auto_theme_forwards_query_flag(monkeypatch):
     assert resolve_auto_theme(query_background=False) is BUILTIN_THEMES["dark"]
 
 
+@pytest.mark.parametrize(
+    ("clitheme", "expected_name", "queries"),
+    (
+        (None, "light", 1),
+        # An explicit CLITHEME settles the background: no query is sent.
+        ("dark", "dark", 0),
+    ),
+)
+def test_background_query_overlaps_invocation(
+    invoke, monkeypatch, clitheme, expected_name, queries
+):
+    """The OSC 11 query is sent by main(), off the main thread, and sent once."""
+    monkeypatch.delenv("COLORFGBG", raising=False)
+    if clitheme:
+        monkeypatch.setenv("CLITHEME", clitheme)
+    else:
+        monkeypatch.delenv("CLITHEME", raising=False)
+    threads = []
+
+    def query():
+        threads.append(threading.current_thread())
+        return b"\x1b]11;rgb:ffff/ffff/ffff\x07"
+
+    monkeypatch.setattr(color, "_osc_background_reply", query)
+    captured: dict = {}
+
+    @click_extra.command(params=[ThemeOption(default="auto", query_background=True)])
+    def palette() -> None:
+        captured["theme"] = click_extra.get_current_context().meta.get(context.THEME)
+
+    result = invoke(palette)
+    assert result.exit_code == 0, result.stderr
+    assert captured["theme"] is BUILTIN_THEMES[expected_name]
+    assert len(threads) == queries
+    assert threading.main_thread() not in threads
+    assert color._pending_background_query is None
+
+
+@pytest.mark.parametrize(
+    ("default", "args", "env", "queries"),
+    (
+        ("auto", (), {}, 1),
+        ("auto", ("--theme", "dark"), {}, 0),
+        ("auto", ("--theme=light",), {}, 0),
+        ("auto", ("--theme", "dark", "--theme", "auto"), {}, 1),
+        ("auto", (), {"PALETTE_THEME": "light"}, 0),
+        ("dark", (), {}, 0),
+        ("dark", ("--theme", "auto"), {}, 1),
+        ("dark", (), {THEME_ENVVAR: "auto"}, 1),
+    ),
+)
+def test_background_query_skipped_for_explicit_theme(
+    invoke, monkeypatch, default, args, env, queries
+):
+    """Only a theme that may be ``auto`` is queried, and never past parsing."""
+    for var in ("CLITHEME", "COLORFGBG"):
+        monkeypatch.delenv(var, raising=False)
+    for var, value in env.items():
+        monkeypatch.setenv(var, value)
+    calls = []
+    monkeypatch.setattr(
+        color,
+        "_osc_background_reply",
+        lambda: calls.append(True) or b"\x1b]11;rgb:ffff/ffff/ffff\x07",
+    )
+    pending = []
+
+    @click_extra.command(params=[ThemeOption(default=default, query_background=True)])
+    def palette() -> None:
+        pending.append(color._pending_background_query)
+
+    result = invoke(palette, args)
+    assert result.exit_code == 0, result.stderr
+    assert len(calls) == queries
+    assert pending == [None]
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    (
+        (("-t", "auto"), True),
+        (("-tauto",), True),
+        (("-vtauto",), True),
+        (("-vt", "auto"), True),
+        (("-tdark",), False),
+        (("-t=auto",), False),
+        (("--label", "--theme"), False),
+        (("--label", "--theme", "-t", "auto"), True),
+        (("--theme", "auto", "--label", "-t"), True),
+        (("--", "--theme", "auto"), False),
+    ),
+)
+def test_background_query_reads_option_tokens(monkeypatch, args, expected):
+    """The early query follows Click's tokenizing of the command line."""
+    monkeypatch.delenv("CLITHEME", raising=False)
+    monkeypatch.delenv(THEME_ENVVAR, raising=False)
+
+    @click_extra.command(
+        params=[
+            ThemeOption(["-t", "--theme"], default="dark", query_background=True),
+            click.Option(["--label"]),
+            click.Option(["-v", "--verbose"], is_flag=True),
+        ]
+    )
+    def palette() -> None:
+        pass
+
+    assert palette._may_query_background(args) is expected
+
+
+def test_background_query_not_started_with_prompts(monkeypatch):
+    """A prompting option reads stdin during parsing: no early query races it."""
+    monkeypatch.delenv("CLITHEME", raising=False)
+
+    @click_extra.command(
+        params=[
+            ThemeOption(default="auto", query_background=True),
+            click.Option(["--name"], prompt=True),
+        ]
+    )
+    def palette() -> None:
+        pass
+
+    assert palette._may_query_background(()) is False
+
+
 # --- Machine-wide CLICK_EXTRA_THEME variable --------------------------------
 
 
@@ -48,8 +48,10 @@ from click_extra.cli import demo
 from click_extra.color import forced_color
 from click_extra.commands import default_params
 from click_extra.prebake import (
+    BakedField,
     discover_package_init_files,
     prebake_dunder,
+    prebake_fields,
     prebake_version,
 )
 from click_extra.pytest import (
@@ -899,6 +901,69 @@ def test_prebake_dunder_full_sha(init_file):
     assert f'__git_tag_sha__ = "{sha}"' in p.read_text()
 
 
+# --- prebake_fields tests ---
+
+
+def test_prebake_fields_one_write(init_file):
+    """Every placeholder is baked in a single write, resolvers run on demand."""
+    p = init_file(
+        '__version__ = "4.0.0.dev0"\n'
+        '__git_branch__ = ""; __git_tag__ = ""\n'
+        '__git_tag_sha__ = "already_set"\n'
+        '__git_dirty__ = ""\n'
+    )
+    calls = []
+
+    def resolver(value):
+        def resolve():
+            calls.append(value)
+            return value
+
+        return resolve
+
+    results = prebake_fields(
+        p,
+        {
+            "__git_branch__": resolver("main"),
+            "__git_tag__": resolver("v4.0.0"),
+            "__git_tag_sha__": resolver("never"),
+            "__git_dirty__": resolver(None),
+            "__git_date__": resolver("never"),
+        },
+        local_version="abc1234",
+    )
+    assert results == {
+        "__version__": BakedField("4.0.0.dev0", "4.0.0.dev0+abc1234"),
+        "__git_branch__": BakedField("", "main"),
+        "__git_tag__": BakedField("", "v4.0.0"),
+        "__git_tag_sha__": BakedField("already_set", None),
+        "__git_dirty__": BakedField("", None),
+    }
+    # Set and absent placeholders never trigger their resolver.
+    assert calls == ["main", "v4.0.0", None]
+    # Two literals sharing a line are both rewritten.
+    assert p.read_text() == (
+        '__version__ = "4.0.0.dev0+abc1234"\n'
+        '__git_branch__ = "main"; __git_tag__ = "v4.0.0"\n'
+        '__git_tag_sha__ = "already_set"\n'
+        '__git_dirty__ = ""\n'
+    )
+
+
+def test_prebake_fields_untouched_file_not_written(init_file):
+    """A file with nothing left to bake keeps its modification time."""
+    p = init_file('__version__ = "1.0.0"\n__git_tag__ = "v1.0.0"\n')
+    mtime = p.stat().st_mtime_ns
+    results = prebake_fields(
+        p, {"__git_tag__": lambda: "v2.0.0"}, local_version="abc1234"
+    )
+    assert results == {
+        "__version__": BakedField("1.0.0", None),
+        "__git_tag__": BakedField("v1.0.0", None),
+    }
+    assert p.stat().st_mtime_ns == mtime
+
+
 # --- discover_package_init_files tests ---
 
 